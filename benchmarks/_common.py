@@ -0,0 +1,88 @@
+"""
+Helpers shared by the benchmarks, for generating documents and for timing.
+"""
+
+import time
+from typing import Callable, Iterable, List, TypeVar
+
+import tomlkit
+from tomlkit import TOMLDocument
+
+REPEATS = 3
+FIELDS_PER_TABLE = 8
+
+_T = TypeVar("_T")
+
+
+def field_lines(num_fields: int = FIELDS_PER_TABLE) -> List[str]:
+    """Returns the lines of `num_fields` integer fields, named by their index."""
+    return [f"field_{field} = {field}" for field in range(num_fields)]
+
+
+def mixed_table_lines(index: int) -> List[str]:
+    """
+    Returns the lines of a table, alternating with a table of an
+    array-of-tables, with a comment and `FIELDS_PER_TABLE` fields, making up
+    `FIELDS_PER_TABLE + 3` items.
+    """
+    header = "[[array.of.tables]]" if index % 2 else f"[table_{index}]  # table comment"
+    return [header, "# a comment within the table", *field_lines(), ""]
+
+
+def generate_document(
+    num_tables: int, table_lines: Callable[[int], Iterable[str]]
+) -> TOMLDocument:
+    """
+    Generates a document from the lines of `num_tables` tables, where the lines
+    of each table are returned by `table_lines` given the index of the table.
+    """
+    lines: List[str] = []
+
+    for index in range(num_tables):
+        lines.extend(table_lines(index))
+
+    return tomlkit.parse("\n".join(lines))
+
+
+def generate_table_document(num_keys: int) -> TOMLDocument:
+    """Generates a document with a single table containing `num_keys` fields."""
+    lines = ["[table]"] + [f"key_{index} = {index}" for index in range(num_keys)]
+    return tomlkit.parse("\n".join(lines))
+
+
+def generate_content(num_tables: int) -> str:
+    """Generates TOML content with `num_tables` tables of a few fields each."""
+    return "\n".join(
+        f"[table_{index}]  # table comment\n"
+        f'name = "table {index}"\n'
+        f"values = [1, 2, 3]\n"
+        f"inline = {{ enabled = true, weight = {index}.5 }}\n"
+        for index in range(num_tables)
+    )
+
+
+def best_time(function: Callable[[], object]) -> float:
+    """
+    Returns the time, in milliseconds, of calling a function, taking the best
+    of `REPEATS` repeats.
+    """
+    return best_time_with_setup(setup=lambda: None, function=lambda _: function())
+
+
+def best_time_with_setup(
+    setup: Callable[[], _T], function: Callable[[_T], object]
+) -> float:
+    """
+    Returns the time, in milliseconds, of calling a function with the result
+    of `setup`, which is called again before each repeat and is not timed,
+    taking the best of `REPEATS` repeats.
+    """
+    timings: List[float] = []
+
+    for _ in range(REPEATS):
+        argument = setup()
+        start = time.perf_counter()
+        _ = function(argument)
+        timings.append((time.perf_counter() - start) * 1e3)
+
+    return min(timings)
@@ -0,0 +1,68 @@
+"""
+Benchmark for `bulk_insert` against repeated calls to `attribute_insert`.
+
+Measures the total time to insert a batch of keys, spread evenly across a
+table, as the size of the batch grows. Repeated calls resolve the hierarchy
+and re-index the body of the table once per insertion, whereas a bulk
+insertion resolves it once and merges every key in a single pass.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_bulk_insertion
+"""
+
+from typing import Callable, List
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import best_time_with_setup, generate_table_document
+from tomlkit_extras import attribute_insert, bulk_insert
+
+NUM_KEYS = 1_000
+BATCH_SIZES: List[int] = [50, 100, 250, 500]
+
+
+def _insert_sequentially(document: TOMLDocument, batch_size: int) -> None:
+    """Inserts a batch of keys with one `attribute_insert` call per key."""
+    step = NUM_KEYS // batch_size
+    for index in range(batch_size):
+        attribute_insert(
+            document, index, index * (step + 1) + 1, "table", f"new_{index}"
+        )
+
+
+def _insert_in_bulk(document: TOMLDocument, batch_size: int) -> None:
+    """Inserts the same batch of keys with a single `bulk_insert` call."""
+    step = NUM_KEYS // batch_size
+    bulk_insert(
+        document,
+        [
+            ("table", f"new_{index}", index, index * step + 1, True)
+            for index in range(batch_size)
+        ],
+    )
+
+
+def _time_batch(insert: Callable[[TOMLDocument, int], None], batch_size: int) -> float:
+    """
+    Returns the total time, in milliseconds, to insert a batch of keys, taking
+    the best of several repeats.
+    """
+    return best_time_with_setup(
+        setup=lambda: generate_table_document(num_keys=NUM_KEYS),
+        function=lambda document: insert(document, batch_size),
+    )
+
+
+def main() -> None:
+    print(f"{'batch':>8} {'sequential (ms)':>16} {'bulk (ms)':>12}")
+    for batch_size in BATCH_SIZES:
+        sequential_time = _time_batch(
+            insert=_insert_sequentially, batch_size=batch_size
+        )
+        bulk_time = _time_batch(insert=_insert_in_bulk, batch_size=batch_size)
+        print(f"{batch_size:>8} {sequential_time:>16.1f} {bulk_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark for building a `TOMLDocumentDescriptor`.
+
+Measures the time of building a descriptor for generated documents of a
+growing number of items, where every table holds the same number of fields,
+comments, and whitespace, and some tables are nested within an
+array-of-tables.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_descriptor
+"""
+
+from typing import List
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import (
+    FIELDS_PER_TABLE,
+    best_time,
+    generate_document,
+    mixed_table_lines,
+)
+from tomlkit_extras import TOMLDocumentDescriptor
+
+SIZES: List[int] = [1_000, 10_000, 50_000]
+
+
+def _generate_document(num_items: int) -> TOMLDocument:
+    """
+    Generates a document with roughly `num_items` items, counting each table,
+    field, comment, and whitespace.
+    """
+    return generate_document(
+        num_tables=max(num_items // (FIELDS_PER_TABLE + 3), 1),
+        table_lines=mixed_table_lines,
+    )
+
+
+def main() -> None:
+    print(f"{'items':>8} {'build (ms)':>12} {'per item (us)':>15}")
+    for num_items in SIZES:
+        toml_document = _generate_document(num_items=num_items)
+        build_time = best_time(lambda: TOMLDocumentDescriptor(toml_document))
+        print(
+            f"{num_items:>8} {build_time:>12.1f} {build_time / num_items * 1e3:>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark for building a `TOMLDocumentDescriptor` of a document with many
+arrays-of-tables, and retrieving tables and fields from them.
+
+Measures the time of building a descriptor for generated documents with a
+growing number of distinct arrays-of-tables, each with a sub-table and a
+nested array-of-tables, and of retrieving a sample of their tables and
+fields.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_descriptor_aot
+"""
+
+from typing import List, Tuple
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import best_time, generate_document
+from tomlkit_extras import TOMLDocumentDescriptor
+
+SIZES: List[int] = [500, 2_000, 5_000]
+RETRIEVAL_STEP = 7
+
+
+def _generate_document(num_arrays: int) -> TOMLDocument:
+    """
+    Generates a document with `num_arrays` distinct arrays-of-tables, each
+    with a sub-table and a nested array-of-tables.
+    """
+    return generate_document(
+        num_tables=num_arrays,
+        table_lines=lambda index: [
+            f"[[array_{index}]]",
+            "field = 1",
+            f"[array_{index}.table]",
+            "field = 2",
+            f"[[array_{index}.nested]]",
+            "field = 3",
+            "",
+        ],
+    )
+
+
+def _time_build_and_retrieval(
+    toml_document: TOMLDocument, num_arrays: int
+) -> Tuple[float, float]:
+    """
+    Returns the times, in milliseconds, of building a descriptor for the
+    document and of retrieving a sample of tables and fields from it, taking
+    the best of several repeats.
+    """
+    build_time = best_time(lambda: TOMLDocumentDescriptor(toml_document))
+    descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+
+    def retrieve() -> None:
+        for index in range(0, num_arrays, RETRIEVAL_STEP):
+            _ = descriptor.get_table_from_aot(hierarchy=f"array_{index}.table")
+            _ = descriptor.get_field_from_aot(hierarchy=f"array_{index}.nested.field")
+
+    return build_time, best_time(retrieve)
+
+
+def main() -> None:
+    print(f"{'arrays':>8} {'build (ms)':>12} {'retrieval (ms)':>16}")
+    for num_arrays in SIZES:
+        toml_document = _generate_document(num_arrays=num_arrays)
+        build_time, retrieval_time = _time_build_and_retrieval(
+            toml_document=toml_document, num_arrays=num_arrays
+        )
+        print(f"{num_arrays:>8} {build_time:>12.1f} {retrieval_time:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
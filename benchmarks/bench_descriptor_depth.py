@@ -0,0 +1,96 @@
+"""
+Benchmark for building a `TOMLDocumentDescriptor` of deeply nested and of
+wide documents.
+
+Measures the time of building a descriptor for generated documents that are
+either deep, with a chain of nested tables or of nested inline tables, or
+wide, with many top-level tables that each have a few fields. The deep
+documents are built programmatically, as `tomlkit` cannot parse documents
+nested this deeply.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_descriptor_depth
+"""
+
+from typing import Callable, List, Tuple
+
+import tomlkit
+from tomlkit import TOMLDocument
+
+from benchmarks._common import best_time, generate_document
+from tomlkit_extras import TOMLDocumentDescriptor
+
+DEEP_SIZES: List[int] = [100, 1_000, 5_000]
+WIDE_SIZES: List[int] = [1_000, 5_000, 20_000]
+
+
+def _generate_nested_tables(depth: int) -> TOMLDocument:
+    """
+    Generates a document with a chain of `depth` nested tables, each with a
+    single field.
+    """
+    toml_document = tomlkit.document()
+    container = toml_document
+
+    for index in range(depth):
+        table = tomlkit.table()
+        table.append("field", index)
+        container.append(f"table_{index}", table)
+        container = table
+
+    return toml_document
+
+
+def _generate_nested_inline_tables(depth: int) -> TOMLDocument:
+    """
+    Generates a document with a single field whose value is a chain of `depth`
+    nested inline tables.
+    """
+    inline_table = tomlkit.inline_table()
+    inline_table.append("field", 1)
+
+    for _ in range(depth - 1):
+        outer_table = tomlkit.inline_table()
+        outer_table.append("nested", inline_table)
+        inline_table = outer_table
+
+    toml_document = tomlkit.document()
+    toml_document.append("inline", inline_table)
+    return toml_document
+
+
+def _generate_wide_document(num_tables: int) -> TOMLDocument:
+    """
+    Generates a document with `num_tables` top-level tables, each with a few
+    fields.
+    """
+    return generate_document(
+        num_tables=num_tables,
+        table_lines=lambda index: [
+            f"[table_{index}]",
+            f"name = 'table_{index}'",
+            "values = [1, 2, 3]",
+            "enabled = true",
+            "",
+        ],
+    )
+
+
+def main() -> None:
+    generators: List[Tuple[str, Callable[[int], TOMLDocument], List[int]]] = [
+        ("nested tables", _generate_nested_tables, DEEP_SIZES),
+        ("nested inline tables", _generate_nested_inline_tables, DEEP_SIZES),
+        ("wide tables", _generate_wide_document, WIDE_SIZES),
+    ]
+
+    print(f"{'document':>22} {'size':>8} {'build (ms)':>12}")
+    for name, generate_document, sizes in generators:
+        for size in sizes:
+            toml_document = generate_document(size)
+            build_time = best_time(lambda: TOMLDocumentDescriptor(toml_document))
+            print(f"{name:>22} {size:>8} {build_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
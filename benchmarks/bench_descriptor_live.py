@@ -0,0 +1,92 @@
+"""
+Benchmark for keeping a `TOMLDocumentDescriptor` up to date with a document
+that is modified through the library.
+
+Measures the time of inserting a field into a table in the middle of
+generated documents of a growing number of tables, and then either building
+a new descriptor from scratch, or letting a live descriptor update itself.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_descriptor_live
+"""
+
+from typing import List
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import (
+    FIELDS_PER_TABLE,
+    REPEATS,
+    best_time_with_setup,
+    field_lines,
+    generate_document,
+)
+from tomlkit_extras import TOMLDocumentDescriptor, general_insert
+
+SIZES: List[int] = [1_000, 5_000, 10_000]
+
+
+def _generate_document(num_tables: int) -> TOMLDocument:
+    """
+    Generates a document with `num_tables` top-level tables, each with a
+    comment and `FIELDS_PER_TABLE` fields.
+    """
+    return generate_document(
+        num_tables=num_tables,
+        table_lines=lambda index: [
+            f"[table_{index}]  # table comment",
+            *field_lines(),
+            "",
+        ],
+    )
+
+
+def _time_rebuild(num_tables: int) -> float:
+    """
+    Returns the time, in milliseconds, of inserting a field and then building
+    a new descriptor, taking the best of several repeats.
+    """
+
+    def rebuild(toml_document: TOMLDocument) -> None:
+        general_insert(
+            toml_document, 0, hierarchy=f"table_{num_tables // 2}", key="new"
+        )
+        _ = TOMLDocumentDescriptor(toml_source=toml_document)
+
+    return best_time_with_setup(
+        setup=lambda: _generate_document(num_tables=num_tables), function=rebuild
+    )
+
+
+def _time_live(num_tables: int) -> float:
+    """
+    Returns the time, in milliseconds, of inserting a field into a document
+    bound to a live descriptor, taking the best of several repeats.
+    """
+    toml_document = _generate_document(num_tables=num_tables)
+
+    # The descriptor is only kept alive, it updates itself after each insertion
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document, live=True)
+    keys = iter(range(REPEATS))
+
+    def insert(key: int) -> None:
+        general_insert(
+            toml_document, key, hierarchy=f"table_{num_tables // 2}", key=f"new_{key}"
+        )
+
+    live_time = best_time_with_setup(setup=lambda: next(keys), function=insert)
+    assert toml_descriptor.number_of_fields == num_tables * FIELDS_PER_TABLE + REPEATS
+    return live_time
+
+
+def main() -> None:
+    print(f"{'tables':>8} {'rebuild (ms)':>14} {'live (ms)':>12}")
+    for num_tables in SIZES:
+        rebuild_time = _time_rebuild(num_tables=num_tables)
+        live_time = _time_live(num_tables=num_tables)
+        print(f"{num_tables:>8} {rebuild_time:>14.1f} {live_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Memory benchmark for building a `TOMLDocumentDescriptor`.
+
+Measures, with `tracemalloc`, the memory retained by a descriptor built for
+generated documents of a growing number of items, and reports it as bytes
+per described item. Every table holds the same number of fields, a comment
+and whitespace, and some tables are nested within an array-of-tables.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_descriptor_memory
+"""
+
+import gc
+import tracemalloc
+from typing import List, Tuple
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import FIELDS_PER_TABLE, generate_document, mixed_table_lines
+from tomlkit_extras import TOMLDocumentDescriptor
+
+SIZES: List[int] = [1_000, 10_000, 50_000]
+
+
+def _generate_document(num_items: int) -> Tuple[TOMLDocument, int]:
+    """
+    Generates a document with roughly `num_items` items, returning it along
+    with the exact number of items, counting each table, field, comment, and
+    whitespace.
+    """
+    items_per_table = FIELDS_PER_TABLE + 3
+    num_tables = max(num_items // items_per_table, 1)
+    toml_document = generate_document(
+        num_tables=num_tables, table_lines=mixed_table_lines
+    )
+    return toml_document, num_tables * items_per_table
+
+
+def _measure_descriptor(toml_document: TOMLDocument) -> int:
+    """
+    Returns the number of bytes retained by a descriptor of the document,
+    after building it.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del descriptor
+    return after - before
+
+
+def main() -> None:
+    print(f"{'items':>8} {'retained (MB)':>15} {'per item (bytes)':>18}")
+    for num_items in SIZES:
+        toml_document, described_items = _generate_document(num_items=num_items)
+        retained = _measure_descriptor(toml_document=toml_document)
+        print(
+            f"{described_items:>8} {retained / 1e6:>15.2f} "
+            f"{retained / described_items:>18.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark for building a `TOMLDocumentDescriptor` with multiple worker
+processes.
+
+Measures the time of building a descriptor for generated documents of a
+growing number of tables, each with the same number of fields, comments,
+and whitespace, in a single process and with a growing number of worker
+processes.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_descriptor_parallel
+"""
+
+import os
+from typing import List, Optional
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import best_time, field_lines, generate_document
+from tomlkit_extras import TOMLDocumentDescriptor
+
+SIZES: List[int] = [1_000, 5_000, 10_000]
+WORKERS: List[Optional[int]] = [None, 2, 4]
+
+
+def _generate_document(num_tables: int) -> TOMLDocument:
+    """
+    Generates a document with `num_tables` top-level tables, each with a
+    comment, a sub-table, and `FIELDS_PER_TABLE` fields.
+    """
+    return generate_document(
+        num_tables=num_tables,
+        table_lines=lambda index: [
+            f"[table_{index}]  # table comment",
+            "# a comment within the table",
+            *field_lines(),
+            f"[table_{index}.sub_table]",
+            "values = [1, 2, 3]",
+            "",
+        ],
+    )
+
+
+def main() -> None:
+    print(f"cpus: {os.cpu_count()}")
+    print(f"{'tables':>8} {'workers':>8} {'build (ms)':>12}")
+    for num_tables in SIZES:
+        toml_document = _generate_document(num_tables=num_tables)
+        for workers in WORKERS:
+            build_time = best_time(
+                lambda: TOMLDocumentDescriptor(toml_document, workers=workers)
+            )
+            print(f"{num_tables:>8} {workers or 1:>8} {build_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
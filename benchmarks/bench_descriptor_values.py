@@ -0,0 +1,91 @@
+"""
+Benchmark for building a `TOMLDocumentDescriptor` of a document with large
+arrays, where the value of each field is unwrapped.
+
+Measures the time of building a descriptor for generated documents of a
+growing number of tables, each holding a large numeric array. A descriptor
+is built with the default lazy unwrapping of field values, with the values
+of every field accessed afterwards, and without unwrapping values at all.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_descriptor_values
+"""
+
+from typing import Callable, List
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import best_time, generate_document
+from tomlkit_extras import TOMLDocumentDescriptor
+
+SIZES: List[int] = [10, 50, 100]
+ARRAY_LENGTH = 1_000
+
+
+def _generate_document(num_tables: int) -> TOMLDocument:
+    """
+    Generates a document with `num_tables` tables, each holding a numeric
+    array of `ARRAY_LENGTH` values and a single other field.
+    """
+    array = ", ".join(str(value) for value in range(ARRAY_LENGTH))
+    return generate_document(
+        num_tables=num_tables,
+        table_lines=lambda index: [
+            f"[table_{index}]",
+            f'name = "table {index}"',
+            f"values = [{array}]",
+            "",
+        ],
+    )
+
+
+def _build_lazy(toml_document: TOMLDocument) -> None:
+    """Builds a descriptor, leaving the values of the fields unwrapped."""
+    _ = TOMLDocumentDescriptor(toml_source=toml_document)
+
+
+def _build_and_access(toml_document: TOMLDocument) -> None:
+    """Builds a descriptor and accesses the value of every field."""
+    descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+    for table in toml_document:
+        for field in ("name", "values"):
+            _ = descriptor.get_field(hierarchy=f"{table}.{field}").value
+
+
+def _build_without_unwrapping(toml_document: TOMLDocument) -> None:
+    """Builds a descriptor which never unwraps the values of the fields."""
+    _ = TOMLDocumentDescriptor(toml_source=toml_document, unwrap_values=False)
+
+
+def _time_build(
+    toml_document: TOMLDocument, build: Callable[[TOMLDocument], None]
+) -> float:
+    """
+    Returns the time, in milliseconds, of running a build function on the
+    document, taking the best of several repeats.
+    """
+    return best_time(lambda: build(toml_document))
+
+
+def main() -> None:
+    print(
+        f"{'tables':>8} {'lazy (ms)':>12} {'accessed (ms)':>15} {'no unwrap (ms)':>16}"
+    )
+    for num_tables in SIZES:
+        toml_document = _generate_document(num_tables=num_tables)
+        lazy_time = _time_build(toml_document=toml_document, build=_build_lazy)
+        accessed_time = _time_build(
+            toml_document=toml_document, build=_build_and_access
+        )
+        no_unwrap_time = _time_build(
+            toml_document=toml_document, build=_build_without_unwrapping
+        )
+        print(
+            f"{num_tables:>8} {lazy_time:>12.1f} {accessed_time:>15.1f} "
+            f"{no_unwrap_time:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark for comparing many revisions of a large document against the same
+`TOMLDocumentDescriptor` with `diff_descriptors`.
+
+Each revision of a document with a growing number of tables changes the value
+of a single field. Measures the time to compare all revisions, once the
+descriptors are built, against comparing the unwrapped documents as dicts,
+which only finds whether anything changed.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_diff
+"""
+
+import time
+from typing import List
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import field_lines, generate_document
+from tomlkit_extras import TOMLDocumentDescriptor, diff_descriptors
+
+SIZES: List[int] = [500, 2_000, 5_000]
+FIELDS_PER_TABLE = 4
+REVISIONS = 20
+
+
+def _generate_document(num_tables: int, changed_table: int = -1) -> TOMLDocument:
+    """
+    Generates a document with `num_tables` tables, each with `FIELDS_PER_TABLE`
+    fields, where the first field of the table `changed_table` has another
+    value.
+    """
+    return generate_document(
+        num_tables=num_tables,
+        table_lines=lambda index: [
+            f"[table_{index}]",
+            f"port = {-1 if index == changed_table else index}",
+            *field_lines(FIELDS_PER_TABLE - 1),
+        ],
+    )
+
+
+def main() -> None:
+    print(f"{'tables':>8} {'diff (ms)':>11} {'unwrap (ms)':>13}")
+    for num_tables in SIZES:
+        base_document = _generate_document(num_tables=num_tables)
+        revisions = [
+            _generate_document(num_tables=num_tables, changed_table=index)
+            for index in range(REVISIONS)
+        ]
+
+        base_descriptor = TOMLDocumentDescriptor(toml_source=base_document)
+        descriptors = [
+            TOMLDocumentDescriptor(toml_source=revision) for revision in revisions
+        ]
+        for descriptor in [base_descriptor, *descriptors]:
+            _ = diff_descriptors(old=descriptor, new=descriptor)
+
+        start = time.perf_counter()
+        for descriptor in descriptors:
+            changes = diff_descriptors(old=base_descriptor, new=descriptor)
+            assert len(changes) == 1
+        diff_time = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        for revision in revisions:
+            assert base_document.unwrap() != revision.unwrap()
+        unwrap_time = (time.perf_counter() - start) * 1e3
+
+        print(f"{num_tables:>8} {diff_time:>11.1f} {unwrap_time:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark for positional insertion via `attribute_insert` and `container_insert`.
+
+Measures the average cost of a single positional insertion into a table as
+the number of existing keys in the table grows. Since insertions are spliced
+directly into the body of the table, nothing is copied or rebuilt, but the
+per-insert cost still grows linearly with the table: the body is scanned up
+to the position of insertion to translate it into an index, and tomlkit
+re-indexes every key in its key map after splicing.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_insertion
+"""
+
+from typing import Callable, List
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import best_time_with_setup, generate_table_document
+from tomlkit_extras import attribute_insert, container_insert
+
+SIZES: List[int] = [100, 500, 1_000, 5_000]
+INSERTS = 50
+
+
+def _time_inserts(insert: Callable[..., None], num_keys: int) -> float:
+    """
+    Returns the average time, in microseconds, of a single insertion into the
+    middle of the table, taking the best of several repeats.
+    """
+
+    def insert_all(document: TOMLDocument) -> None:
+        for index in range(INSERTS):
+            insert(document, index, num_keys // 2, "table", f"inserted_{index}")
+
+    total_time = best_time_with_setup(
+        setup=lambda: generate_table_document(num_keys=num_keys),
+        function=insert_all,
+    )
+    return total_time / INSERTS * 1e3
+
+
+def main() -> None:
+    print(f"{'keys':>8} {'attribute (us)':>16} {'container (us)':>16}")
+    for num_keys in SIZES:
+        attribute_time = _time_inserts(insert=attribute_insert, num_keys=num_keys)
+        container_time = _time_inserts(insert=container_insert, num_keys=num_keys)
+        print(f"{num_keys:>8} {attribute_time:>16.1f} {container_time:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
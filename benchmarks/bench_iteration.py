@@ -0,0 +1,96 @@
+"""
+Benchmark for scanning the fields of a large array-of-tables through a
+`TOMLDocumentDescriptor`.
+
+Measures the time and peak memory of summing a field of every table in
+generated arrays of a growing number of tables, either by retrieving a list
+of the fields with `get_field_from_aot`, or by streaming all fields with
+`iter_fields`.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_iteration
+"""
+
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import REPEATS, field_lines, generate_document
+from tomlkit_extras import TOMLDocumentDescriptor
+
+SIZES: List[int] = [5_000, 20_000, 50_000]
+FIELDS_PER_TABLE = 4
+
+
+def _generate_document(num_tables: int) -> TOMLDocument:
+    """
+    Generates a document with an array-of-tables of `num_tables` tables, each
+    with `FIELDS_PER_TABLE` fields.
+    """
+    return generate_document(
+        num_tables=num_tables,
+        table_lines=lambda index: [
+            "[[servers]]",
+            f"port = {index}",
+            *field_lines(FIELDS_PER_TABLE - 1),
+        ],
+    )
+
+
+def _sum_from_list(toml_descriptor: TOMLDocumentDescriptor) -> int:
+    """Sums the port of every table from a list of all port fields."""
+    fields = toml_descriptor.get_field_from_aot(hierarchy="servers.port")
+    return sum(field.value for field in fields)
+
+
+def _sum_from_iterator(toml_descriptor: TOMLDocumentDescriptor) -> int:
+    """Sums the port of every table while streaming through all fields."""
+    return sum(
+        field.value for field in toml_descriptor.iter_fields() if field.name == "port"
+    )
+
+
+def _time_scan(
+    toml_descriptor: TOMLDocumentDescriptor,
+    scan: Callable[[TOMLDocumentDescriptor], int],
+) -> Tuple[float, float]:
+    """
+    Returns the time, in milliseconds, and the peak memory allocated, in
+    kilobytes, of a scan, taking the best of several repeats.
+    """
+    timings: List[float] = []
+    peaks: List[float] = []
+
+    for _ in range(REPEATS):
+        tracemalloc.start()
+        start = time.perf_counter()
+        _ = scan(toml_descriptor)
+        timings.append((time.perf_counter() - start) * 1e3)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1e3)
+        tracemalloc.stop()
+
+    return min(timings), min(peaks)
+
+
+def main() -> None:
+    print(
+        f"{'tables':>8} {'list (ms)':>11} {'list (KB)':>11} "
+        f"{'iter (ms)':>11} {'iter (KB)':>11}"
+    )
+    for num_tables in SIZES:
+        toml_descriptor = TOMLDocumentDescriptor(
+            toml_source=_generate_document(num_tables=num_tables)
+        )
+        list_time, list_peak = _time_scan(toml_descriptor, _sum_from_list)
+        iter_time, iter_peak = _time_scan(toml_descriptor, _sum_from_iterator)
+        print(
+            f"{num_tables:>8} {list_time:>11.1f} {list_peak:>11.1f} "
+            f"{iter_time:>11.1f} {iter_peak:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
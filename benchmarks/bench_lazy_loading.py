@@ -0,0 +1,57 @@
+"""
+Benchmark for lazy loading with `load_toml_file(..., lazy=True)`.
+
+Measures the average time of loading TOML content and then reading a field
+from two of its tables, when the whole document is parsed up front, against
+when it is loaded lazily, where only the two tables that are read are ever
+parsed.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_lazy_loading
+"""
+
+from typing import List
+
+from benchmarks._common import best_time, generate_content
+from tomlkit_extras import get_attribute_from_toml_source, load_toml_file
+
+SIZES: List[int] = [10, 100, 1_000]
+
+
+def _time_reads(toml_content: str, num_tables: int, lazy: bool) -> float:
+    """
+    Returns the time, in milliseconds, of loading the content and reading a
+    field from the first and last tables, taking the best of several repeats.
+    """
+
+    def read() -> None:
+        toml_document = load_toml_file(toml_source=toml_content, lazy=lazy)
+        for index in (0, num_tables - 1):
+            _ = get_attribute_from_toml_source(
+                hierarchy=f"table_{index}.name", toml_source=toml_document
+            )
+
+    return best_time(read)
+
+
+def main() -> None:
+    print(f"{'tables':>8} {'eager (ms)':>12} {'lazy (ms)':>12} {'speedup':>9}")
+    for num_tables in SIZES:
+        toml_content = generate_content(num_tables=num_tables)
+
+        eager_time = _time_reads(
+            toml_content=toml_content, num_tables=num_tables, lazy=False
+        )
+        lazy_time = _time_reads(
+            toml_content=toml_content, num_tables=num_tables, lazy=True
+        )
+
+        print(
+            f"{num_tables:>8} {eager_time:>12.2f} {lazy_time:>12.2f} "
+            f"{eager_time / lazy_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
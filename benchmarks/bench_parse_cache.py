@@ -0,0 +1,56 @@
+"""
+Benchmark for the process-wide parse cache used by `load_toml_file`.
+
+Measures the average time of loading the same TOML content without the
+cache, which parses it every time, against loading it with the cache
+enabled, where every load after the first is a cache hit that only has
+to deserialize an independent copy of the cached document.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_parse_cache
+"""
+
+from typing import List
+
+from benchmarks._common import best_time, generate_content
+from tomlkit_extras import disable_parse_cache, enable_parse_cache, load_toml_file
+
+SIZES: List[int] = [10, 100, 500]
+LOADS = 10
+
+
+def _time_loads(toml_content: str) -> float:
+    """
+    Returns the average time, in microseconds, of loading the content, taking
+    the best of several repeats.
+    """
+
+    def load() -> None:
+        for _ in range(LOADS):
+            _ = load_toml_file(toml_source=toml_content)
+
+    return best_time(load) / LOADS * 1e3
+
+
+def main() -> None:
+    print(f"{'tables':>8} {'parse (us)':>14} {'cache hit (us)':>16} {'speedup':>9}")
+    for num_tables in SIZES:
+        toml_content = generate_content(num_tables=num_tables)
+
+        disable_parse_cache()
+        parse_time = _time_loads(toml_content=toml_content)
+
+        enable_parse_cache()
+        _ = load_toml_file(toml_source=toml_content)
+        hit_time = _time_loads(toml_content=toml_content)
+        disable_parse_cache()
+
+        print(
+            f"{num_tables:>8} {parse_time:>14.1f} {hit_time:>16.1f} "
+            f"{parse_time / hit_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
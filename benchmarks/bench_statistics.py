@@ -0,0 +1,50 @@
+"""
+Benchmark for collecting summary statistics of a TOML document with
+`collect_statistics`, compared to building a `TOMLDocumentDescriptor`.
+
+Measures the time of collecting the statistics of generated documents of a
+growing number of tables, each with the same number of fields, comments,
+and arrays.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_statistics
+"""
+
+from typing import List
+
+from tomlkit import TOMLDocument
+
+from benchmarks._common import best_time, field_lines, generate_document
+from tomlkit_extras import TOMLDocumentDescriptor, collect_statistics
+
+SIZES: List[int] = [1_000, 5_000, 10_000]
+
+
+def _generate_document(num_tables: int) -> TOMLDocument:
+    """
+    Generates a document with `num_tables` top-level tables, each with a
+    comment, an array, and `FIELDS_PER_TABLE` fields.
+    """
+    return generate_document(
+        num_tables=num_tables,
+        table_lines=lambda index: [
+            f"[table_{index}]  # table comment",
+            *field_lines(),
+            "values = [1, 2, 3]",
+            "",
+        ],
+    )
+
+
+def main() -> None:
+    print(f"{'tables':>8} {'descriptor (ms)':>17} {'statistics (ms)':>17}")
+    for num_tables in SIZES:
+        toml_document = _generate_document(num_tables=num_tables)
+        descriptor_time = best_time(lambda: TOMLDocumentDescriptor(toml_document))
+        statistics_time = best_time(lambda: collect_statistics(toml_document))
+        print(f"{num_tables:>8} {descriptor_time:>17.1f} {statistics_time:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
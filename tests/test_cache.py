@@ -0,0 +1,123 @@
+import os
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from tomlkit import TOMLDocument
+
+from tomlkit_extras import (
+    CacheStatistics,
+    TOMLFileCache,
+    TOMLParseCache,
+    disable_parse_cache,
+    enable_parse_cache,
+    get_parse_cache,
+    load_toml_file,
+)
+
+TOML_SOURCE = """
+[project]
+name = "Example Project"
+version = "0.1.0"
+"""
+
+
+@pytest.fixture(scope="function")
+def parse_cache() -> Iterator[TOMLParseCache]:
+    """Function-scoped fixture for an enabled process-wide parse cache."""
+    yield enable_parse_cache(max_entries=2)
+    disable_parse_cache()
+
+
+def test_parse_cache_hits(parse_cache: TOMLParseCache) -> None:
+    """
+    Function to test that `load_toml_file` retrieves documents from the
+    process-wide parse cache, and that each document is independent.
+    """
+    assert get_parse_cache() is parse_cache
+
+    toml_document: TOMLDocument = load_toml_file(toml_source=TOML_SOURCE)
+    toml_document["project"]["name"] = "Modified Project"
+
+    cached_document = load_toml_file(toml_source=TOML_SOURCE)
+    assert cached_document["project"]["name"] == "Example Project"
+    assert cached_document.as_string() == TOML_SOURCE
+
+    # Bytes are cached separately from strings with the same content
+    _ = load_toml_file(toml_source=TOML_SOURCE.encode("utf-8"))
+    _ = load_toml_file(toml_source=bytearray(TOML_SOURCE, "utf-8"))
+
+    statistics = parse_cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.evictions) == (2, 2, 0)
+    assert statistics.entries == 2
+
+    disable_parse_cache()
+    _ = load_toml_file(toml_source=TOML_SOURCE)
+    assert parse_cache.statistics() == statistics
+
+
+def test_parse_cache_eviction(parse_cache: TOMLParseCache) -> None:
+    """
+    Function to test that the least recently used entries are evicted from
+    the parse cache once either the entry count or byte budget is exceeded.
+    """
+    toml_sources = [f'name = "Project {index}"' for index in range(3)]
+    for toml_source in toml_sources:
+        _ = load_toml_file(toml_source=toml_source)
+
+    statistics = parse_cache.statistics()
+    assert (statistics.misses, statistics.evictions, statistics.entries) == (3, 1, 2)
+
+    _ = load_toml_file(toml_source=toml_sources[2])
+    _ = load_toml_file(toml_source=toml_sources[0])
+    assert parse_cache.statistics().hits == 1
+
+    # Only a single entry fits within the byte budget
+    byte_budget_cache = enable_parse_cache(
+        max_entries=10, max_bytes=parse_cache.statistics().size_bytes // 2 + 1
+    )
+    for toml_source in toml_sources:
+        _ = load_toml_file(toml_source=toml_source)
+
+    statistics = byte_budget_cache.statistics()
+    assert statistics.entries == 1
+    assert statistics.evictions == 2
+    assert statistics.size_bytes <= byte_budget_cache.max_bytes
+
+    byte_budget_cache.clear()
+    assert byte_budget_cache.statistics() == CacheStatistics(0, 0, 0, 0, 0)
+
+
+def test_file_cache(tmp_path: Path) -> None:
+    """
+    Function to test that `load_toml_file` retrieves documents from a
+    `TOMLFileCache` until the file changes or the entry is invalidated.
+    """
+    file_cache = TOMLFileCache()
+    toml_path = tmp_path / "config.toml"
+    toml_path.write_text(TOML_SOURCE, encoding="utf-8")
+
+    toml_document = load_toml_file(toml_source=toml_path, cache=file_cache)
+    toml_document["project"]["name"] = "Modified Project"
+
+    cached_document = load_toml_file(toml_source=str(toml_path), cache=file_cache)
+    assert cached_document["project"]["name"] == "Example Project"
+    assert (file_cache.statistics().hits, file_cache.statistics().misses) == (1, 1)
+
+    # A change to the modification time alone invalidates the entry
+    file_stat = os.stat(toml_path)
+    os.utime(toml_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9))
+    _ = load_toml_file(toml_source=toml_path, cache=file_cache)
+    assert file_cache.statistics().misses == 2
+
+    toml_path.write_text(TOML_SOURCE + 'license = "MIT"\n', encoding="utf-8")
+    toml_document = load_toml_file(toml_source=toml_path, cache=file_cache)
+    assert toml_document["project"]["license"] == "MIT"
+    assert file_cache.statistics().misses == 3
+
+    assert file_cache.invalidate(path=toml_path)
+    assert not file_cache.invalidate(path=toml_path)
+    _ = load_toml_file(toml_source=toml_path, cache=file_cache)
+
+    statistics = file_cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.entries) == (1, 4, 1)
@@ -0,0 +1,160 @@
+import copy
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import pytest
+import tomlkit
+from tomlkit import TOMLDocument
+
+from tests.typing import FixtureFunction
+from tomlkit_extras import (
+    DescriptorChange,
+    TOMLDocumentDescriptor,
+    diff_descriptors,
+    general_insert,
+)
+
+_OLD_DOCUMENT = """# header
+title = "x"
+[server]
+port = 80 # the port
+host = "a"
+[[items]]
+id = 1
+[[items]]
+id = 2
+[other]
+v = [1, 2]
+"""
+
+_NEW_DOCUMENT = """# header
+title = "y"
+[server]
+port = 80.0 # the port
+user = "root"
+# new note
+[[items]]
+id = 1
+
+[other]
+v = [1, 2]
+[extra]
+z = 1
+"""
+
+
+@dataclass(frozen=True)
+class ChangeTestCase:
+    """
+    Dataclass representing an expected difference found by the
+    `diff_descriptors` function.
+    """
+
+    change: str
+    item_type: str
+    hierarchy: Optional[str]
+    old_value: object
+    new_value: object
+    line_numbers: Tuple[Optional[int], Optional[int]]
+
+
+def _check_changes(
+    changes: List[DescriptorChange], expected: List[ChangeTestCase]
+) -> None:
+    """
+    Function to check that a list of `DescriptorChange` instances is the same
+    as a list of expected differences.
+    """
+    assert [
+        ChangeTestCase(
+            change=change.change,
+            item_type=change.item_type,
+            hierarchy=str(change.hierarchy) if change.hierarchy is not None else None,
+            old_value=change.old_value,
+            new_value=change.new_value,
+            line_numbers=(change.old_line_no, change.new_line_no),
+        )
+        for change in changes
+    ] == expected
+
+
+def test_diff_descriptors() -> None:
+    """
+    Function to test that `diff_descriptors` finds the fields, tables, tables
+    of an array-of-tables, and comments that were added, removed, or changed.
+    """
+    old_descriptor = TOMLDocumentDescriptor(toml_source=tomlkit.parse(_OLD_DOCUMENT))
+    new_descriptor = TOMLDocumentDescriptor(toml_source=tomlkit.parse(_NEW_DOCUMENT))
+
+    _check_changes(
+        changes=diff_descriptors(old=old_descriptor, new=new_descriptor),
+        expected=[
+            ChangeTestCase("changed", "field", "title", "x", "y", (2, 2)),
+            ChangeTestCase("changed", "field", "server.port", 80, 80.0, (4, 4)),
+            ChangeTestCase("removed", "field", "server.host", "a", None, (5, None)),
+            ChangeTestCase("added", "field", "server.user", None, "root", (None, 5)),
+            ChangeTestCase("added", "comment", "server", None, "# new note", (None, 6)),
+            ChangeTestCase("removed", "table", "items", None, None, (8, None)),
+            ChangeTestCase("removed", "field", "items.id", 2, None, (9, None)),
+            ChangeTestCase("added", "table", "extra", None, None, (None, 12)),
+            ChangeTestCase("added", "field", "extra.z", None, 1, (None, 13)),
+        ],
+    )
+    _check_changes(
+        changes=diff_descriptors(old=new_descriptor, new=old_descriptor),
+        expected=[
+            ChangeTestCase("changed", "field", "title", "y", "x", (2, 2)),
+            ChangeTestCase("changed", "field", "server.port", 80.0, 80, (4, 4)),
+            ChangeTestCase("removed", "field", "server.user", "root", None, (5, None)),
+            ChangeTestCase("added", "field", "server.host", None, "a", (None, 5)),
+            ChangeTestCase(
+                "removed", "comment", "server", "# new note", None, (6, None)
+            ),
+            ChangeTestCase("added", "table", "items", None, None, (None, 8)),
+            ChangeTestCase("added", "field", "items.id", None, 2, (None, 9)),
+            ChangeTestCase("removed", "table", "extra", None, None, (12, None)),
+            ChangeTestCase("removed", "field", "extra.z", 1, None, (13, None)),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "fixture", ["load_toml_a", "load_toml_b", "load_toml_c", "load_toml_d"]
+)
+def test_diff_descriptors_identical(
+    fixture: FixtureFunction, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that `diff_descriptors` finds no differences between
+    descriptors of the same document, in both directions.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(fixture)
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+    copied_descriptor = TOMLDocumentDescriptor(toml_source=copy.deepcopy(toml_document))
+
+    assert diff_descriptors(old=toml_descriptor, new=toml_descriptor) == []
+    assert diff_descriptors(old=toml_descriptor, new=copied_descriptor) == []
+    assert diff_descriptors(old=copied_descriptor, new=toml_descriptor) == []
+
+
+def test_diff_descriptors_live() -> None:
+    """
+    Function to test that `diff_descriptors` reflects modifications of the
+    document of a live descriptor, and rejects anything other than a
+    `TOMLDocumentDescriptor`.
+    """
+    toml_document = tomlkit.parse(_OLD_DOCUMENT)
+    old_descriptor = TOMLDocumentDescriptor(toml_source=tomlkit.parse(_OLD_DOCUMENT))
+    live_descriptor = TOMLDocumentDescriptor(toml_source=toml_document, live=True)
+    assert diff_descriptors(old=old_descriptor, new=live_descriptor) == []
+
+    general_insert(toml_document, "b", hierarchy="other", key="w")
+    _check_changes(
+        changes=diff_descriptors(old=old_descriptor, new=live_descriptor),
+        expected=[
+            ChangeTestCase("added", "field", "other.w", None, "b", (None, 12)),
+        ],
+    )
+
+    with pytest.raises(TypeError):
+        diff_descriptors(old=old_descriptor, new=toml_document)
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import datetime
+import pickle
+import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, List, Optional, Type
+from typing import Any, Callable, List, Optional, Set, Tuple, Type
 
 import pytest
+import tomlkit
+from tomlkit import TOMLDocument
 
-from tests.typing import FixtureDescriptor
+from tests.typing import FixtureDescriptor, FixtureFunction
 from tomlkit_extras import (
     AoTDescriptor,
     BaseTOMLError,
     CommentDescriptor,
+    CommentEntry,
     FieldDescriptor,
     Hierarchy,
     InvalidFieldError,
@@ -19,9 +26,21 @@ from tomlkit_extras import (
     StyleDescriptor,
     TableDescriptor,
     TOMLDocumentDescriptor,
+    container_insert,
+    delete_from_toml_source,
+    general_insert,
+    get_attribute_from_toml_source,
+    update_toml_source,
 )
 from tomlkit_extras._hierarchy import standardize_hierarchy
-from tomlkit_extras._typing import AoTItem, FieldItem, ParentItem, StyleItem, TableItem
+from tomlkit_extras._typing import (
+    AoTItem,
+    FieldItem,
+    ItemKind,
+    ParentItem,
+    StyleItem,
+    TableItem,
+)
 
 
 @dataclass(frozen=True)
@@ -851,6 +870,816 @@ def test_toml_array_descriptor(
         table.validate_descriptor(descriptor=descriptors[idx])
 
 
+def test_toml_array_descriptor_from_array(load_toml_a: TOMLDocument) -> None:
+    """
+    Function to test the functionality of `get_array_of_tables` when the
+    descriptor is generated directly from an array-of-tables.
+    """
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=load_toml_a["members"])
+    descriptors = toml_descriptor.get_aot(hierarchy="members")
+    assert len(descriptors) == 1
+
+    test_case = AoTDescriptorTestCase(
+        "toml_a_descriptor",
+        "array-of-tables",
+        None,
+        "members",
+        "members",
+        0,
+        1,
+        1,
+        False,
+        2,
+    )
+    test_case.validate_descriptor(descriptor=descriptors[0])
+
+
+@pytest.mark.parametrize(
+    "fixture, hierarchy",
+    [
+        ("load_toml_a", "project.name"),
+        ("load_toml_a", "details.description"),
+        ("load_toml_b", "main_table.name"),
+        ("load_toml_c", "tool.rye.dev-dependencies"),
+        ("load_toml_d", "clients.hosts"),
+    ],
+)
+def test_toml_field_descriptor_value(
+    fixture: FixtureFunction, hierarchy: str, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that the value of a `FieldDescriptor` is unwrapped on
+    first access, and is never unwrapped when `unwrap_values` is False.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(fixture)
+    toml_field = get_attribute_from_toml_source(
+        hierarchy=hierarchy, toml_source=toml_document
+    )
+
+    field_descriptor = TOMLDocumentDescriptor(toml_source=toml_document).get_field(
+        hierarchy=hierarchy
+    )
+    assert not field_descriptor._unwrapped
+    assert field_descriptor.value == toml_field.unwrap()
+    assert field_descriptor.value is field_descriptor.value
+    assert field_descriptor.value_type is type(toml_field.unwrap())
+
+    field_descriptor = TOMLDocumentDescriptor(
+        toml_source=toml_document, unwrap_values=False
+    ).get_field(hierarchy=hierarchy)
+    assert field_descriptor.value is toml_field
+    assert field_descriptor.value_type is type(toml_field)
+
+
+@pytest.mark.parametrize(
+    "fixture", ["toml_a_descriptor", "toml_b_descriptor", "toml_c_descriptor"]
+)
+def test_toml_descriptor_copies(
+    fixture: FixtureDescriptor, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that the slotted descriptors of fields and tables can be
+    copied, deep copied and pickled.
+    """
+    toml_descriptor: TOMLDocumentDescriptor = request.getfixturevalue(fixture)
+
+    for table_descriptor in toml_descriptor._store.tables._tables.values():
+        descriptors: List[Any] = [table_descriptor, *table_descriptor.fields.values()]
+        for descriptor in descriptors:
+            assert not hasattr(descriptor, "__dict__")
+
+            for descriptor_copy in [
+                descriptor.copy(),
+                descriptor.deepcopy(),
+                pickle.loads(pickle.dumps(descriptor)),
+            ]:
+                assert descriptor_copy is not descriptor
+                assert repr(descriptor_copy) == repr(descriptor)
+
+
+def _get_descriptor_reprs(toml_descriptor: TOMLDocumentDescriptor) -> List[str]:
+    """
+    Function which returns the reprs of all descriptors in a
+    `TOMLDocumentDescriptor`, including all fields and stylings.
+    """
+    store = toml_descriptor._store
+    descriptors: List[Any] = [
+        *store.document._document_fields.values(),
+        *store.document._document_stylings.get_stylings(),
+        *store.tables._tables.values(),
+    ]
+    for array_of_tables in store.array_of_tables._array_of_tables.values():
+        for array in array_of_tables.aots:
+            descriptors.append(array)
+            for tables in array.tables.values():
+                descriptors.extend(tables)
+
+    descriptor_reprs: List[str] = []
+    for descriptor in descriptors:
+        nested_descriptors: List[Any] = [descriptor]
+        if isinstance(descriptor, TableDescriptor):
+            nested_descriptors.extend(descriptor.fields.values())
+
+        for nested_descriptor in nested_descriptors:
+            descriptor_reprs.append(repr(nested_descriptor))
+            if not isinstance(nested_descriptor, (StyleDescriptor, AoTDescriptor)):
+                stylings = nested_descriptor.stylings.get_stylings()
+                descriptor_reprs.extend(repr(styling) for styling in stylings)
+
+    return descriptor_reprs
+
+
+@pytest.mark.parametrize(
+    "fixture", ["load_toml_a", "load_toml_b", "load_toml_c", "load_toml_d"]
+)
+def test_toml_descriptor_workers(
+    fixture: FixtureFunction, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that a `TOMLDocumentDescriptor` parsed by multiple worker
+    processes is the same as one parsed in a single process.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(fixture)
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+    descriptor_reprs = _get_descriptor_reprs(toml_descriptor=toml_descriptor)
+
+    for workers in [2, 3]:
+        parallel_descriptor = TOMLDocumentDescriptor(
+            toml_source=toml_document, workers=workers
+        )
+        assert _get_descriptor_reprs(parallel_descriptor) == descriptor_reprs
+        assert vars(parallel_descriptor._toml_statistics) == vars(
+            toml_descriptor._toml_statistics
+        )
+
+    with pytest.raises(ValueError):
+        TOMLDocumentDescriptor(toml_source=toml_document, workers=0)
+
+
+@pytest.mark.parametrize(
+    "fixture", ["load_toml_a", "load_toml_b", "load_toml_c", "load_toml_d"]
+)
+def test_toml_descriptor_iterators(
+    fixture: FixtureFunction, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that the iterators of a `TOMLDocumentDescriptor` yield
+    every descriptor exactly once, in order of line number.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(fixture)
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+
+    descriptors = list(toml_descriptor.walk())
+    line_numbers = [descriptor.line_no for descriptor in descriptors]
+    assert line_numbers == sorted(line_numbers)
+    assert sorted(repr(descriptor) for descriptor in descriptors) == sorted(
+        _get_descriptor_reprs(toml_descriptor=toml_descriptor)
+    )
+
+    assert list(toml_descriptor.iter_fields()) == [
+        descriptor
+        for descriptor in descriptors
+        if isinstance(descriptor, FieldDescriptor)
+    ]
+    assert list(toml_descriptor.iter_tables()) == [
+        descriptor
+        for descriptor in descriptors
+        if isinstance(descriptor, TableDescriptor)
+    ]
+    assert list(toml_descriptor.iter_aots()) == [
+        descriptor
+        for descriptor in descriptors
+        if isinstance(descriptor, AoTDescriptor)
+    ]
+    stylings: List[Optional[StyleItem]] = [None, "comment", "whitespace"]
+    for styling in stylings:
+        assert list(toml_descriptor.iter_stylings(styling=styling)) == [
+            descriptor
+            for descriptor in descriptors
+            if isinstance(descriptor, StyleDescriptor)
+            and styling in {None, descriptor.item_type}
+        ]
+
+
+def test_toml_descriptor_walk_order() -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor.walk` yields descriptors in
+    the order they appear, when tables appear out of order and arrays of tables
+    are nested.
+    """
+    toml_document = tomlkit.parse(
+        "[a.b]\n"
+        "x = 1\n"
+        "[c]\n"
+        "y = {z = 2}\n"
+        "[a]\n"
+        "w = 3\n"
+        "[[aot]]\n"
+        "k = 1\n"
+        "[[aot.inner]]\n"
+        "n = 2\n"
+        "[[aot]]\n"
+        "k = 3\n"
+    )
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+
+    assert [
+        (descriptor.item_type, str(descriptor.hierarchy), descriptor.line_no)
+        for descriptor in toml_descriptor.walk()
+        if not isinstance(descriptor, StyleDescriptor)
+    ] == [
+        ("table", "a.b", 1),
+        ("field", "a.b.x", 2),
+        ("table", "c", 3),
+        ("inline-table", "c.y", 4),
+        ("field", "c.y.z", 4),
+        ("table", "a", 5),
+        ("field", "a.w", 6),
+        ("array-of-tables", "aot", 7),
+        ("table", "aot", 7),
+        ("field", "aot.k", 8),
+        ("array-of-tables", "aot.inner", 9),
+        ("table", "aot.inner", 9),
+        ("field", "aot.inner.n", 10),
+        ("table", "aot", 11),
+        ("field", "aot.k", 12),
+    ]
+
+
+_FIND_DOCUMENT = """[tool.alpha]
+version = "1.0"
+[tool.beta.nested]
+version = "2.0"
+name = "beta"
+[[servers]]
+port = 80
+[[servers]]
+port = 81
+[servers.meta]
+port = 9
+"""
+
+
+@dataclass(frozen=True)
+class FindTestCase:
+    """
+    Dataclass representing a test case for `TOMLDocumentDescriptor.find`, with
+    the item type, hierarchy, and line number of each expected match.
+    """
+
+    pattern: str
+    matches: List[Tuple[str, str, int]]
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        FindTestCase(
+            "tool.**.version",
+            [
+                ("field", "tool.alpha.version", 2),
+                ("field", "tool.beta.nested.version", 4),
+            ],
+        ),
+        FindTestCase(
+            "servers.*",
+            [
+                ("field", "servers.port", 7),
+                ("field", "servers.port", 9),
+                ("table", "servers.meta", 10),
+            ],
+        ),
+        FindTestCase(
+            "servers",
+            [
+                ("array-of-tables", "servers", 6),
+                ("table", "servers", 6),
+                ("table", "servers", 8),
+            ],
+        ),
+        FindTestCase(
+            "**.port",
+            [
+                ("field", "servers.port", 7),
+                ("field", "servers.port", 9),
+                ("field", "servers.meta.port", 11),
+            ],
+        ),
+        FindTestCase("tool.b*.*.name", [("field", "tool.beta.nested.name", 5)]),
+        FindTestCase("tool.*", [("table", "tool.alpha", 1)]),
+        FindTestCase("missing.**", []),
+    ],
+)
+def test_toml_descriptor_find(test_case: FindTestCase) -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor.find` retrieves all
+    descriptors matching a hierarchy pattern, in the order they appear.
+    """
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=tomlkit.parse(_FIND_DOCUMENT))
+    assert [
+        (descriptor.item_type, str(descriptor.hierarchy), descriptor.line_no)
+        for descriptor in toml_descriptor.find(pattern=test_case.pattern)
+    ] == test_case.matches
+
+
+def test_toml_descriptor_find_live() -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor.find` reflects modifications
+    of the document of a live descriptor, and rejects invalid patterns.
+    """
+    toml_document = tomlkit.parse(_FIND_DOCUMENT)
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document, live=True)
+    assert len(toml_descriptor.find(pattern="tool.alpha.*")) == 1
+
+    general_insert(toml_document, "3.0", hierarchy="tool.alpha", key="license")
+    assert [
+        str(descriptor.hierarchy)
+        for descriptor in toml_descriptor.find(pattern="tool.alpha.*")
+    ] == ["tool.alpha.version", "tool.alpha.license"]
+
+    with pytest.raises(ValueError):
+        toml_descriptor.find(pattern="tool..version")
+
+
+_LINES_DOCUMENT = """[tool.alpha]
+version = "1.0"
+[tool.beta]
+inline = {a = 1, b = {c = 2}}
+# comment
+
+[[servers]]
+port = 80
+[servers.meta]
+port = 9
+"""
+
+
+@dataclass(frozen=True)
+class AtLineTestCase:
+    """
+    Dataclass representing a test case for `TOMLDocumentDescriptor.at_line`,
+    with the item type and hierarchy of the expected item, and the hierarchies
+    of the tables it appears within.
+    """
+
+    line_no: int
+    item_type: str
+    hierarchy: str
+    tables: List[str]
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        AtLineTestCase(1, "table", "tool.alpha", []),
+        AtLineTestCase(2, "field", "tool.alpha.version", ["tool.alpha"]),
+        AtLineTestCase(
+            4,
+            "field",
+            "tool.beta.inline.b.c",
+            ["tool.beta", "tool.beta.inline", "tool.beta.inline.b"],
+        ),
+        AtLineTestCase(6, "comment", "tool.beta", ["tool.beta"]),
+        AtLineTestCase(7, "whitespace", "tool.beta", ["tool.beta"]),
+        AtLineTestCase(8, "table", "servers", []),
+        AtLineTestCase(11, "field", "servers.meta.port", ["servers", "servers.meta"]),
+    ],
+)
+def test_toml_descriptor_at_line(test_case: AtLineTestCase) -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor.at_line` retrieves the
+    innermost item at a line, along with the tables it appears within.
+    """
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=tomlkit.parse(_LINES_DOCUMENT))
+    line_lookup = toml_descriptor.at_line(line_no=test_case.line_no)
+    assert line_lookup is not None
+    assert line_lookup.descriptor.item_type == test_case.item_type
+    assert str(line_lookup.descriptor.hierarchy) == test_case.hierarchy
+    assert [str(table.hierarchy) for table in line_lookup.tables] == test_case.tables
+
+
+def test_toml_descriptor_at_line_boundaries() -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor.at_line` returns None for
+    lines that no item covers, and the array for the line that closes it.
+    """
+    toml_string = "[tool]\nversion = 1\n\n[other]\nx = [\n  1,\n]\ny = 2\n"
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=tomlkit.parse(toml_string))
+    filtered_descriptor = TOMLDocumentDescriptor(
+        toml_source=tomlkit.parse(toml_string), item_kinds=["table", "field"]
+    )
+
+    for descriptor in (toml_descriptor, filtered_descriptor):
+        line_lookup = descriptor.at_line(line_no=7)
+        assert line_lookup is not None
+        assert str(line_lookup.descriptor.hierarchy) == "other.x"
+        assert descriptor.at_line(line_no=9) is None
+        assert descriptor.at_line(line_no=99) is None
+
+    line_lookup = toml_descriptor.at_line(line_no=3)
+    assert line_lookup is not None
+    assert line_lookup.descriptor.item_type == "whitespace"
+    assert filtered_descriptor.at_line(line_no=3) is None
+
+
+def test_toml_descriptor_in_range() -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor.in_range` retrieves all items
+    starting within a range of lines, and that `TOMLDocumentDescriptor.at_line`
+    returns None before the first line.
+    """
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=tomlkit.parse(_LINES_DOCUMENT))
+    assert toml_descriptor.at_line(line_no=0) is None
+    assert [
+        (descriptor.item_type, str(descriptor.hierarchy))
+        for descriptor in toml_descriptor.in_range(start=8, end=10)
+    ] == [
+        ("array-of-tables", "servers"),
+        ("table", "servers"),
+        ("field", "servers.port"),
+        ("table", "servers.meta"),
+    ]
+    assert toml_descriptor.in_range(start=20, end=30) == []
+
+    with pytest.raises(ValueError):
+        toml_descriptor.in_range(start=2, end=1)
+
+
+@pytest.mark.parametrize("unwrap_values", [True, False])
+def test_toml_descriptor_value_index(unwrap_values: bool) -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor.fields_by_type` and
+    `TOMLDocumentDescriptor.fields_with_value` retrieve fields by the type and
+    value of their unwrapped value.
+    """
+    toml_document = tomlkit.parse(
+        "enabled = true\n"
+        "count = 1\n"
+        "[features]\n"
+        "beta = true\n"
+        "alpha = false\n"
+        "released = 1979-05-27T07:32:00Z\n"
+        "tags = [1, 2]\n"
+        "[[servers]]\n"
+        "active = true\n"
+        "[features.nested]\n"
+        "deep = true\n"
+    )
+    toml_descriptor = TOMLDocumentDescriptor(
+        toml_source=toml_document, unwrap_values=unwrap_values
+    )
+
+    def _hierarchies(field_descriptors: List[FieldDescriptor]) -> List[str]:
+        return [str(field.hierarchy) for field in field_descriptors]
+
+    assert _hierarchies(toml_descriptor.fields_with_value(value=True)) == [
+        "enabled",
+        "features.beta",
+        "servers.active",
+        "features.nested.deep",
+    ]
+    assert _hierarchies(
+        toml_descriptor.fields_with_value(value=True, hierarchy="features")
+    ) == ["features.beta", "features.nested.deep"]
+    assert _hierarchies(toml_descriptor.fields_with_value(value=1)) == ["count"]
+    assert toml_descriptor.fields_with_value(value="missing") == []
+
+    assert _hierarchies(toml_descriptor.fields_by_type(value_type=bool)) == [
+        "enabled",
+        "features.beta",
+        "features.alpha",
+        "servers.active",
+        "features.nested.deep",
+    ]
+    assert _hierarchies(toml_descriptor.fields_by_type(value_type=int)) == ["count"]
+    assert _hierarchies(
+        toml_descriptor.fields_by_type(value_type=datetime.datetime)
+    ) == ["features.released"]
+    assert _hierarchies(toml_descriptor.fields_by_type(value_type=list)) == [
+        "features.tags"
+    ]
+
+    with pytest.raises(TypeError):
+        toml_descriptor.fields_with_value(value=[1, 2])
+
+
+def test_toml_descriptor_comment_index() -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor.comments_with_prefix` and
+    `TOMLDocumentDescriptor.search_comments` retrieve standalone, trailing, and
+    array item comments across the whole document.
+    """
+    toml_document = tomlkit.parse(
+        "# TODO top\n"
+        "x = 1  # TODO trailing\n"
+        "[a]  # table\n"
+        "# @deprecated soon\n"
+        "arr = [\n"
+        "  1, # TODO item\n"
+        "  2,\n"
+        "]  # after array\n"
+        "[[s]]  # owner: infra\n"
+        "k = 1\n"
+    )
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+
+    assert toml_descriptor.comments_with_prefix(prefix="TODO") == [
+        CommentEntry(
+            comment="# TODO top", line_no=1, hierarchy=None, kind="standalone"
+        ),
+        CommentEntry(
+            comment="# TODO trailing",
+            line_no=2,
+            hierarchy=Hierarchy.from_str_hierarchy(hierarchy="x"),
+            kind="trailing",
+        ),
+        CommentEntry(
+            comment="# TODO item",
+            line_no=6,
+            hierarchy=Hierarchy.from_str_hierarchy(hierarchy="a.arr"),
+            kind="array-item",
+        ),
+    ]
+    assert [
+        entry.text
+        for entry in toml_descriptor.comments_with_prefix(prefix="", hierarchy="a")
+    ] == ["table", "@deprecated soon", "TODO item", "after array"]
+    assert [
+        entry.line_no
+        for entry in toml_descriptor.search_comments(pattern=r"@deprecated|owner:")
+    ] == [4, 9]
+    assert [
+        entry.kind
+        for entry in toml_descriptor.search_comments(
+            pattern=re.compile("array|item"), hierarchy="a.arr"
+        )
+    ] == ["array-item", "trailing"]
+    assert toml_descriptor.comments_with_prefix(prefix="FIXME") == []
+
+
+@dataclass(frozen=True)
+class LiveDescriptorTestCase:
+    """
+    Dataclass representing a test case for a live `TOMLDocumentDescriptor`,
+    with the hierarchy of a table to insert into, and a hierarchy to delete.
+    """
+
+    fixture: FixtureFunction
+    table: str
+    deletion: str
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        LiveDescriptorTestCase("load_toml_a", "project", "details"),
+        LiveDescriptorTestCase("load_toml_b", "main_table", "tool.ruff.lint"),
+        LiveDescriptorTestCase("load_toml_c", "tool.rye", "project"),
+        LiveDescriptorTestCase("load_toml_d", "servers.beta", "owner"),
+    ],
+)
+def test_toml_descriptor_live(
+    test_case: LiveDescriptorTestCase, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that a live `TOMLDocumentDescriptor` is the same as one
+    parsed from scratch after each modification of its document.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(test_case.fixture)
+    live_descriptor = TOMLDocumentDescriptor(toml_source=toml_document, live=True)
+
+    mutations: List[Callable[[], None]] = [
+        lambda: container_insert(toml_document, "value", 1, key="live_field"),
+        lambda: general_insert(toml_document, 1, test_case.table, "live_nested"),
+        lambda: update_toml_source(toml_document, "updated", "live_field"),
+        lambda: delete_from_toml_source(test_case.deletion, toml_document),
+        lambda: general_insert(toml_document, {"field": True}, key="live_table"),
+    ]
+    for mutation in mutations:
+        mutation()
+        toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+        assert _get_descriptor_reprs(live_descriptor) == _get_descriptor_reprs(
+            toml_descriptor
+        )
+        assert vars(live_descriptor._toml_statistics) == vars(
+            toml_descriptor._toml_statistics
+        )
+
+    with pytest.raises(TypeError):
+        TOMLDocumentDescriptor(toml_source=tomlkit.table(), live=True)
+
+    with pytest.raises(ValueError):
+        TOMLDocumentDescriptor(
+            toml_source=toml_document, top_level_only=True, live=True
+        )
+
+
+def test_toml_descriptor_live_top_level_arrays() -> None:
+    """
+    Function to test that a live `TOMLDocumentDescriptor` describes stylings
+    within arrays in the top-level space the same as one parsed from scratch.
+    """
+    toml_document = tomlkit.parse("f0 = {i0 = 27}\nf1 = [1, 2, # three\n 3]\n")
+    live_descriptor = TOMLDocumentDescriptor(toml_source=toml_document, live=True)
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+    assert _get_descriptor_reprs(live_descriptor) == _get_descriptor_reprs(
+        toml_descriptor
+    )
+
+    array_stylings = live_descriptor.get_field(hierarchy="f1").stylings
+    assert list(array_stylings.comments) == ["# three"]
+    assert not live_descriptor.get_field(hierarchy="f0.i0").stylings.whitespace
+
+
+@dataclass(frozen=True)
+class FilteredDescriptorTestCase:
+    """
+    Dataclass representing a test case for a `TOMLDocumentDescriptor` with
+    filter options, along with the hierarchies of the tables, arrays of
+    tables, and top-level fields expected to be described.
+    """
+
+    fixture: FixtureFunction
+    include: Optional[List[str]]
+    exclude: Optional[List[str]]
+    item_kinds: Optional[List[ItemKind]]
+    max_depth: Optional[int]
+    tables: Set[str]
+    array_of_tables: Set[str]
+    fields: Set[str]
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        FilteredDescriptorTestCase(
+            "load_toml_b",
+            ["tool.*"],
+            None,
+            None,
+            None,
+            {"tool.ruff", "tool.ruff.lint", "tool.ruff.lint.pydocstyle"},
+            set(),
+            set(),
+        ),
+        FilteredDescriptorTestCase(
+            "load_toml_b",
+            None,
+            ["tool"],
+            None,
+            None,
+            {"main_table"},
+            {"main_table.sub_tables"},
+            {"project"},
+        ),
+        FilteredDescriptorTestCase(
+            "load_toml_b",
+            ["main_table.sub_tables"],
+            None,
+            None,
+            None,
+            {"main_table"},
+            {"main_table.sub_tables"},
+            set(),
+        ),
+        FilteredDescriptorTestCase(
+            "load_toml_b",
+            None,
+            None,
+            ["table", "field"],
+            None,
+            {"main_table", "tool.ruff", "tool.ruff.lint", "tool.ruff.lint.pydocstyle"},
+            {"main_table.sub_tables"},
+            {"project"},
+        ),
+        FilteredDescriptorTestCase(
+            "load_toml_b", None, None, None, 1, {"main_table"}, set(), {"project"}
+        ),
+        FilteredDescriptorTestCase(
+            "load_toml_d",
+            ["servers"],
+            ["*.ip"],
+            ["table"],
+            None,
+            {"servers.alpha", "servers.beta", "servers.gamma"},
+            set(),
+            set(),
+        ),
+    ],
+)
+def test_toml_descriptor_filters(
+    test_case: FilteredDescriptorTestCase, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that a `TOMLDocumentDescriptor` with filter options only
+    describes the items that are kept, each the same as without any filters.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(test_case.fixture)
+    filtered_descriptor = TOMLDocumentDescriptor(
+        toml_source=toml_document,
+        include=test_case.include,
+        exclude=test_case.exclude,
+        item_kinds=test_case.item_kinds,
+        max_depth=test_case.max_depth,
+    )
+
+    store = filtered_descriptor._store
+    assert store.tables.hierarchies == test_case.tables
+    assert store.array_of_tables.hierarchies == test_case.array_of_tables
+    assert store.document.fields == test_case.fields
+
+    # Line numbers and positions must not change for any item that is kept,
+    # only the number of fields described within each table
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+    descriptor_reprs = {
+        re.sub(r"num_fields=\d+", str(), descriptor_repr)
+        for descriptor_repr in _get_descriptor_reprs(toml_descriptor)
+    }
+    for descriptor_repr in _get_descriptor_reprs(filtered_descriptor):
+        assert re.sub(r"num_fields=\d+", str(), descriptor_repr) in descriptor_reprs
+
+
+@pytest.mark.parametrize("item_kinds", [["field"], ["field", "comment"]])
+def test_toml_descriptor_item_kinds_nested(item_kinds: List[ItemKind]) -> None:
+    """
+    Function to test that a `TOMLDocumentDescriptor` limited to kinds of items
+    other than tables still describes the items nested within tables.
+    """
+    toml_document = tomlkit.parse(
+        "x = 1\n[tool]\na = 1 # note\n[tool.sub]\nb = 2\n[[items]]\nc = 3\n"
+    )
+    filtered_descriptor = TOMLDocumentDescriptor(
+        toml_source=toml_document, item_kinds=item_kinds
+    )
+
+    assert [
+        (str(field.hierarchy), field.value, field.line_no)
+        for field in filtered_descriptor.iter_fields()
+    ] == [("x", 1, 1), ("tool.a", 1, 3), ("tool.sub.b", 2, 5), ("items.c", 3, 7)]
+    assert filtered_descriptor.get_field(hierarchy="tool.sub.b").value == 2
+    assert [
+        field.value for field in filtered_descriptor.get_field_from_aot("items.c")
+    ] == [3]
+
+
+def test_toml_descriptor_invalid_filters(load_toml_a: TOMLDocument) -> None:
+    """
+    Function to test the error handling of the filter options of a
+    `TOMLDocumentDescriptor`.
+    """
+    with pytest.raises(ValueError):
+        TOMLDocumentDescriptor(toml_source=load_toml_a, max_depth=-1)
+
+    with pytest.raises(ValueError):
+        TOMLDocumentDescriptor(
+            toml_source=load_toml_a, item_kinds=["field", "inline-table"]
+        )
+
+
+def test_toml_descriptor_deep_nesting() -> None:
+    """
+    Function to test that `TOMLDocumentDescriptor` parses tables and inline
+    tables nested deeper than the recursion limit.
+    """
+    depth = sys.getrecursionlimit() + 100
+
+    toml_document = tomlkit.document()
+    container: Any = toml_document
+    for index in range(depth):
+        table = tomlkit.table()
+        table.append("field", index)
+        container.append(f"table_{index}", table)
+        container = table
+
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+    hierarchy = ".".join(f"table_{index}" for index in range(depth))
+    assert toml_descriptor.number_of_tables == depth
+    assert sum(1 for _ in toml_descriptor.iter_tables()) == depth
+
+    table_descriptor = toml_descriptor.get_table(hierarchy=hierarchy)
+    assert table_descriptor.line_no == 2 * depth - 1
+    assert table_descriptor.fields["field"].value == depth - 1
+
+    inline_table = tomlkit.inline_table()
+    inline_table.append("field", 1)
+    for _ in range(depth - 1):
+        outer_table = tomlkit.inline_table()
+        outer_table.append("nested", inline_table)
+        inline_table = outer_table
+
+    toml_document = tomlkit.document()
+    toml_document.append("inline", inline_table)
+
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_document)
+    hierarchy = ".".join(["inline", *["nested"] * (depth - 1)])
+    assert toml_descriptor.number_of_inline_tables == depth
+
+    table_descriptor = toml_descriptor.get_table(hierarchy=hierarchy)
+    assert table_descriptor.item_type == "inline-table"
+    assert table_descriptor.line_no == 1
+    assert table_descriptor.fields["field"].value == 1
+
+
 @pytest.mark.parametrize(
     "test_case",
     [
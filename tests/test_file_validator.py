@@ -1,9 +1,32 @@
+import codecs
+import tracemalloc
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import pytest
+from tomlkit import TOMLDocument
 
-from tomlkit_extras import TOMLDecodingError, load_toml_file
+from tomlkit_extras import (
+    TOMLDecodingError,
+    get_decoding_statistics,
+    load_toml_file,
+    reset_decoding_statistics,
+)
+from tomlkit_extras import _file_validator
+from tomlkit_extras._typing import DecodingStrategy, TOMLSourceFile
+
+
+@dataclass(frozen=True)
+class DecodingTestCase:
+    """
+    Dataclass representing a test case for the decoding of bytes within the
+    `load_toml_file` function.
+    """
+
+    toml_source: bytes
+    encoding: Optional[str]
+    strategy: DecodingStrategy
 
 
 @pytest.mark.parametrize(
@@ -112,3 +135,110 @@ def test_load_toml_file_invalid() -> None:
     assert str(exc_info.value) == (
         "If path is passed in as the source, it must link to an existing file"
     )
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        DecodingTestCase('name = "Crème brûlée"'.encode("utf-8"), None, "utf-8"),
+        DecodingTestCase(
+            codecs.BOM_UTF8 + 'name = "Crème brûlée"'.encode("utf-8"), None, "bom"
+        ),
+        DecodingTestCase('name = "Crème brûlée"'.encode("utf-16"), None, "bom"),
+        DecodingTestCase('name = "Crème brûlée"'.encode("utf-32"), None, "bom"),
+        DecodingTestCase('name = "Crème brûlée"'.encode("cp1252"), None, "detected"),
+        DecodingTestCase(
+            'name = "Crème brûlée"'.encode("latin-1"), "latin-1", "explicit"
+        ),
+    ],
+)
+def test_decoding_load_toml_file(test_case: DecodingTestCase) -> None:
+    """
+    Function to test the decoding strategy used by `load_toml_file` when
+    reading from a bytes and bytearray instance.
+    """
+    reset_decoding_statistics()
+
+    toml_document = load_toml_file(
+        toml_source=test_case.toml_source, encoding=test_case.encoding
+    )
+    toml_document_from_bytearray = load_toml_file(
+        toml_source=bytearray(test_case.toml_source), encoding=test_case.encoding
+    )
+    assert toml_document == toml_document_from_bytearray
+
+    # A detected encoding is a best guess, so the decoded content can only be
+    # verified when the encoding is known
+    if test_case.strategy != "detected":
+        assert toml_document["name"] == "Crème brûlée"
+
+    decoding_statistics = get_decoding_statistics()
+    assert decoding_statistics.pop(test_case.strategy) == 2
+    assert not any(decoding_statistics.values())
+
+
+def test_decoding_load_toml_file_invalid() -> None:
+    """
+    Function to test the error handling of `load_toml_file` when bytes cannot
+    be decoded with an explicit encoding.
+    """
+    with pytest.raises(TOMLDecodingError) as exc_info:
+        _ = load_toml_file(
+            toml_source='name = "Crème brûlée"'.encode("latin-1"), encoding="utf-8"
+        )
+    assert (
+        exc_info.value.message == "Issue occured when decoding the TOML source content"
+    )
+
+
+def test_memory_map_load_toml_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Function to test that loading a file through a memory map, or loading from
+    a memoryview instance, lowers the peak memory used by `load_toml_file`.
+    """
+    toml_path = tmp_path / "large.toml"
+    with open(toml_path, mode="w", encoding="utf-8") as file:
+        for index in range(250_000):
+            file.write(f'key_{index} = "value {index}"\n')
+
+    toml_bytes = bytearray(toml_path.read_bytes())
+
+    # Skip parsing, so that only the memory used to read and decode the content
+    # is traced
+    monkeypatch.setattr(
+        _file_validator, "_read_toml", lambda toml_content: TOMLDocument()
+    )
+
+    def peak_memory(toml_source: TOMLSourceFile, memory_map: bool = False) -> int:
+        tracemalloc.start()
+        try:
+            _ = load_toml_file(toml_source=toml_source, memory_map=memory_map)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    read_peak = peak_memory(toml_source=toml_path)
+    assert read_peak > 2 * len(toml_bytes)
+    assert peak_memory(toml_source=toml_path, memory_map=True) < 0.6 * read_peak
+    assert peak_memory(toml_source=memoryview(toml_bytes)) < 0.6 * read_peak
+
+
+def test_memory_map_load_toml_file_contents(tmp_path: Path) -> None:
+    """
+    Function to test that loading a file through a memory map, or loading from
+    a memoryview instance, produces the same document as reading the file.
+    """
+    toml_path = tmp_path / "config.toml"
+    toml_path.write_bytes(codecs.BOM_UTF8 + b'[project]\nname = "Example Project"\n')
+
+    toml_document = load_toml_file(toml_source=toml_path)
+    assert load_toml_file(toml_source=toml_path, memory_map=True) == toml_document
+    assert load_toml_file(toml_source=memoryview(toml_path.read_bytes())) == (
+        toml_document
+    )
+
+    toml_path.write_bytes(b"")
+    assert load_toml_file(toml_source=toml_path, memory_map=True) == {}
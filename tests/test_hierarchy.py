@@ -1,5 +1,10 @@
-from tomlkit_extras import Hierarchy
-from tomlkit_extras._hierarchy import standardize_hierarchy
+import copy
+import pickle
+
+import pytest
+
+from tomlkit_extras import Hierarchy, InternedHierarchy
+from tomlkit_extras._hierarchy import HierarchyTrie, standardize_hierarchy
 
 
 def test_standardize_hierarchy() -> None:
@@ -9,6 +14,7 @@ def test_standardize_hierarchy() -> None:
 
     hierarchy_tool_ruff_again = standardize_hierarchy(hierarchy=hierarchy_tool_ruff)
     assert hierarchy_tool_ruff_again == hierarchy_tool_ruff
+    assert standardize_hierarchy(hierarchy="tool.ruff") is hierarchy_tool_ruff
 
 
 def test_hierarchy() -> None:
@@ -53,3 +59,133 @@ def test_hierarchy() -> None:
     assert not hierarchy_tool_ruff.is_child_hierarchy(
         hierarchy="tool.ruff.lint.rules.noqa"
     )
+
+
+def test_interned_hierarchy() -> None:
+    """Function to test the functionality of `InternedHierarchy`."""
+    hierarchy_tool_ruff = InternedHierarchy.from_str_hierarchy(hierarchy="tool.ruff")
+
+    # Test that identical hierarchies share a single instance
+    assert hierarchy_tool_ruff is InternedHierarchy(
+        hierarchy=("tool",), attribute="ruff"
+    )
+    assert hierarchy_tool_ruff is InternedHierarchy.from_list_hierarchy(
+        hierarchy=["tool", "ruff"]
+    )
+    assert copy.deepcopy(hierarchy_tool_ruff) is hierarchy_tool_ruff
+    assert pickle.loads(pickle.dumps(hierarchy_tool_ruff)) is hierarchy_tool_ruff
+
+    # Test dunder methods
+    assert hierarchy_tool_ruff == "tool.ruff"
+    assert hierarchy_tool_ruff == Hierarchy(hierarchy=("tool",), attribute="ruff")
+    assert Hierarchy(hierarchy=("tool",), attribute="ruff") == hierarchy_tool_ruff
+    assert hierarchy_tool_ruff != "tool.rye"
+    assert InternedHierarchy(hierarchy=(), attribute="tool.ruff") != "tool.ruff"
+    assert hash(hierarchy_tool_ruff) == hash("tool.ruff")
+    assert {hierarchy_tool_ruff: "ruff"}[hierarchy_tool_ruff] == "ruff"
+    assert {hierarchy_tool_ruff: "ruff"}["tool.ruff"] == "ruff"
+    assert {"tool.ruff": "ruff"}[hierarchy_tool_ruff] == "ruff"
+    assert "tool.ruff" in {hierarchy_tool_ruff}
+    assert hierarchy_tool_ruff in {"tool.ruff"}
+    assert repr(hierarchy_tool_ruff) == f"<Hierarchy tool.ruff>"
+
+    # Test properties
+    assert hierarchy_tool_ruff.full_hierarchy == ("tool", "ruff")
+    assert hierarchy_tool_ruff.full_hierarchy_str == "tool.ruff"
+    assert hierarchy_tool_ruff.depth == 2
+    assert hierarchy_tool_ruff.ancestor_hierarchies == ["tool", "tool.ruff"]
+    assert hierarchy_tool_ruff.parent == "tool"
+    assert hierarchy_tool_ruff.parent.parent is None
+
+    HIERARCHIES = {"tool", "tool.ruff.lint", "tool.rye", "build-system", "tool.ruff"}
+    assert hierarchy_tool_ruff.shortest_ancestor_hierarchy(HIERARCHIES) == "tool"
+    assert hierarchy_tool_ruff.longest_ancestor_hierarchy(HIERARCHIES) == "tool.ruff"
+
+    # Test that the hierarchy cannot be modified
+    with pytest.raises(AttributeError):
+        hierarchy_tool_ruff.attribute = "rye"
+
+    with pytest.raises(AttributeError):
+        hierarchy_tool_ruff.add_to_hierarchy(update="lint")
+
+    assert hierarchy_tool_ruff.extend_hierarchy(update="lint") == "tool.ruff.lint"
+    assert hierarchy_tool_ruff.extend_hierarchy(update="") is hierarchy_tool_ruff
+    assert hierarchy_tool_ruff == "tool.ruff"
+
+
+def test_hierarchy_trie() -> None:
+    """Function to test the functionality of `HierarchyTrie`."""
+    hierarchy_trie: HierarchyTrie[int] = HierarchyTrie()
+    for index, hierarchy in enumerate(
+        ["tool", "tool.ruff.lint", "tool.rye", "build-system", "tool.ruff"]
+    ):
+        hierarchy_trie[hierarchy] = index
+
+    # Test mapping methods
+    assert len(hierarchy_trie) == 5
+    assert "tool.ruff" in hierarchy_trie
+    assert Hierarchy.from_str_hierarchy(hierarchy="tool.ruff") in hierarchy_trie
+    assert "tool.ruff.format" not in hierarchy_trie
+    assert "build" not in hierarchy_trie
+    assert hierarchy_trie["tool.ruff.lint"] == 1
+    assert hierarchy_trie.get("tool.ruff.format") is None
+    assert list(hierarchy_trie) == [
+        "tool",
+        "tool.ruff",
+        "tool.ruff.lint",
+        "tool.rye",
+        "build-system",
+    ]
+    assert hierarchy_trie.hierarchies() == {
+        "tool",
+        "tool.ruff.lint",
+        "tool.rye",
+        "build-system",
+        "tool.ruff",
+    }
+
+    with pytest.raises(KeyError):
+        hierarchy_trie["tool.ruff.format"]
+
+    hierarchy_trie["tool.ruff"] = 10
+    assert len(hierarchy_trie) == 5
+    assert hierarchy_trie["tool.ruff"] == 10
+
+    # Test ancestor lookups, which include the hierarchy itself
+    assert hierarchy_trie.longest_ancestor(hierarchy="tool.ruff.lint.isort") == (
+        "tool.ruff.lint"
+    )
+    assert hierarchy_trie.shortest_ancestor(hierarchy="tool.ruff.lint.isort") == "tool"
+    assert hierarchy_trie.longest_ancestor(hierarchy="tool.ruff") == "tool.ruff"
+    assert hierarchy_trie.longest_ancestor(hierarchy="project.name") is None
+    assert hierarchy_trie.shortest_ancestor(hierarchy="project.name") is None
+
+    # Test children and descendants
+    assert hierarchy_trie.children(hierarchy="tool") == ["tool.ruff", "tool.rye"]
+    assert hierarchy_trie.children(hierarchy="tool.ruff.lint") == []
+    assert list(hierarchy_trie.descendants(hierarchy="tool")) == [
+        "tool.ruff",
+        "tool.ruff.lint",
+        "tool.rye",
+    ]
+    assert list(hierarchy_trie.descendants(hierarchy="project")) == []
+
+    # Test matching of glob-style hierarchy patterns
+    assert sorted(hierarchy_trie.match(pattern="tool.*")) == [
+        ("tool.ruff", 10),
+        ("tool.rye", 2),
+    ]
+    assert sorted(
+        hierarchy for hierarchy, _ in hierarchy_trie.match(pattern="tool.**")
+    ) == [
+        "tool",
+        "tool.ruff",
+        "tool.ruff.lint",
+        "tool.rye",
+    ]
+    assert hierarchy_trie.match(pattern="**.lint") == [("tool.ruff.lint", 1)]
+    assert hierarchy_trie.match(pattern="build-*") == [("build-system", 3)]
+    assert hierarchy_trie.match(pattern="project.*") == []
+
+    with pytest.raises(ValueError):
+        hierarchy_trie.match(pattern="tool.")
@@ -1,14 +1,17 @@
 from dataclasses import dataclass
-from typing import Any, List, Literal, Optional, Type
+from typing import Any, List, Literal, Optional, Type, cast
 
 import pytest
+import tomlkit
 from tomlkit import TOMLDocument, items
+from tomlkit.exceptions import KeyAlreadyPresent
 
 from tests.typing import FixtureFunction
 from tomlkit_extras import (
     Hierarchy,
     TOMLInsertionError,
     attribute_insert,
+    bulk_insert,
     container_insert,
     general_insert,
     get_attribute_from_toml_source,
@@ -49,6 +52,18 @@ class InvalidInsertionTestCase(BaseInsertionTestCase):
     struct_type: Type[Any]
 
 
+@dataclass(frozen=True)
+class ArrayInsertionTestCase:
+    """
+    Dataclass representing a test case for the `attribute_insert` and
+    `container_insert` functions when inserting into an array.
+    """
+
+    insertion: Literal["attribute", "container"]
+    position: int
+    array: List[str]
+
+
 def consolidate_hierarchy(hierarchy: Optional[str], key: Optional[str]) -> Hierarchy:
     """Consolidates a hierarchy from two optional string arguments."""
     full_hierarchy: List[str] = []
@@ -192,3 +207,214 @@ def test_invalid_insertion(
         )
     assert exc_info.value.message == test_case.message
     assert exc_info.value.struct_type == test_case.struct_type
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        ArrayInsertionTestCase(
+            "attribute",
+            1,
+            ["pytest", "ruff>=0.4.4", "mypy>=0.812", "sphinx>=3.5", "setuptools>=56.0"],
+        ),
+        ArrayInsertionTestCase(
+            "attribute",
+            3,
+            ["ruff>=0.4.4", "mypy>=0.812", "pytest", "sphinx>=3.5", "setuptools>=56.0"],
+        ),
+        ArrayInsertionTestCase(
+            "attribute",
+            10,
+            ["ruff>=0.4.4", "mypy>=0.812", "sphinx>=3.5", "setuptools>=56.0", "pytest"],
+        ),
+        ArrayInsertionTestCase(
+            "container",
+            6,
+            ["ruff>=0.4.4", "pytest", "mypy>=0.812", "sphinx>=3.5", "setuptools>=56.0"],
+        ),
+    ],
+)
+def test_insertion_into_array(
+    test_case: ArrayInsertionTestCase, load_toml_c: TOMLDocument
+) -> None:
+    """
+    Function to test the functionality of the `attribute_insert` and
+    `container_insert` functions when inserting into an array.
+    """
+    insertion_args = {
+        "toml_source": load_toml_c,
+        "insertion": "pytest",
+        "position": test_case.position,
+        "hierarchy": "tool.rye.dev-dependencies",
+    }
+
+    if test_case.insertion == "attribute":
+        attribute_insert(**insertion_args)
+    else:
+        container_insert(**insertion_args)
+
+    array = get_attribute_from_toml_source(
+        hierarchy="tool.rye.dev-dependencies", toml_source=load_toml_c
+    )
+    assert array == test_case.array
+    assert tomlkit.parse(load_toml_c.as_string()) == load_toml_c
+
+
+def test_insertion_splices_into_body(load_toml_b: TOMLDocument) -> None:
+    """
+    Function to test that positional insertions are spliced into the existing
+    body of a container, rather than the body being copied and rebuilt.
+    """
+    table = cast(
+        items.Table,
+        get_attribute_from_toml_source(hierarchy="main_table", toml_source=load_toml_b),
+    )
+    body_items = [body_item for _, body_item in table.value.body]
+
+    attribute_insert(load_toml_b, "1.0.0", 2, "main_table", "version")
+    container_insert(load_toml_b, ["alpha"], 1, "main_table", "hosts")
+
+    # Ensure that all original items remain, untouched, in the body
+    assert all(
+        any(body_item is original for _, body_item in table.value.body)
+        for original in body_items
+    )
+    assert [key.key for key, _ in table.value.body if key is not None] == [
+        "hosts",
+        "name",
+        "version",
+        "description",
+        "sub_tables",
+    ]
+    assert get_positions(hierarchy="main_table.version", toml_source=load_toml_b) == (
+        3,
+        3,
+    )
+
+    # Ensure the document still renders into TOML that is parsed identically
+    assert tomlkit.parse(load_toml_b.as_string()) == load_toml_b
+
+    # Tables are placed after any fields, to keep them out of the new table
+    attribute_insert(load_toml_b, {"enabled": True}, 1, "main_table", "settings")
+    assert tomlkit.parse(load_toml_b.as_string()) == load_toml_b
+
+
+@pytest.mark.parametrize(
+    "toml_string, position, expected",
+    [
+        (
+            "a = 1\n\n[[aot]]\nk = 2\n",
+            3,
+            "a = 1\n\n[new]\nk = 1\n\n[[aot]]\nk = 2\n",
+        ),
+        (
+            "[x]\ny = 1\n\n[[aot]]\nk = 2\n",
+            2,
+            "[x]\ny = 1\n\n[new]\nk = 1\n\n[[aot]]\nk = 2\n",
+        ),
+        (
+            "[x]\ny = 1\n\n[t]\nk = 2\n",
+            2,
+            "[x]\ny = 1\n\n[new]\nk = 1\n\n[t]\nk = 2\n",
+        ),
+        ("a = 1\n[t]\nk = 2\n", 2, "a = 1\n\n[new]\nk = 1\n\n[t]\nk = 2\n"),
+    ],
+)
+def test_insertion_spliced_table_whitespace(
+    toml_string: str, position: int, expected: str
+) -> None:
+    """
+    Function to test that a table spliced before a table header is separated
+    from the items around it by whitespace, as if appended by tomlkit.
+    """
+    toml_document = tomlkit.parse(toml_string)
+    table = tomlkit.table()
+    table.add("k", 1)
+
+    container_insert(toml_document, table, position, key="new")
+    assert toml_document.as_string() == expected
+
+
+def test_bulk_insertion(load_toml_b: TOMLDocument, load_toml_c: TOMLDocument) -> None:
+    """
+    Function to test the functionality of the `bulk_insert` function, where
+    all positions are interpreted against the original layout.
+    """
+    bulk_insert(
+        load_toml_b,
+        [
+            ("main_table", "license", "MIT", 2, True),
+            ("main_table", "hosts", ["alpha"], 1, True),
+            ("main_table", "version", "1.0.0", 2, True),
+            ("main_table", "settings", {"enabled": True}, 1, True),
+            (None, "title", "Example TOML Document", 1, False),
+            ("tool.ruff", "fix", True, 2, True),
+        ],
+    )
+
+    table = cast(
+        items.Table,
+        get_attribute_from_toml_source(hierarchy="main_table", toml_source=load_toml_b),
+    )
+    assert [key.key for key, _ in table.value.body if key is not None] == [
+        "hosts",
+        "name",
+        "license",
+        "version",
+        "description",
+        "settings",
+        "sub_tables",
+    ]
+    assert get_positions(hierarchy="main_table.version", toml_source=load_toml_b) == (
+        4,
+        4,
+    )
+    assert get_positions(hierarchy="tool.ruff.fix", toml_source=load_toml_b) == (
+        2,
+        2,
+    )
+    assert get_positions(hierarchy="title", toml_source=load_toml_b) == (1, 1)
+    assert tomlkit.parse(load_toml_b.as_string()) == load_toml_b
+
+    bulk_insert(
+        load_toml_c,
+        [
+            ("tool.rye.dev-dependencies", None, "pytest", 3, True),
+            ("tool.rye.dev-dependencies", None, "black", 1, True),
+            ("tool.rye.dev-dependencies", None, "isort", 3, True),
+        ],
+    )
+
+    array = get_attribute_from_toml_source(
+        hierarchy="tool.rye.dev-dependencies", toml_source=load_toml_c
+    )
+    assert array == [
+        "black",
+        "ruff>=0.4.4",
+        "mypy>=0.812",
+        "pytest",
+        "isort",
+        "sphinx>=3.5",
+        "setuptools>=56.0",
+    ]
+    assert tomlkit.parse(load_toml_c.as_string()) == load_toml_c
+
+
+def test_bulk_insertion_duplicate_key(load_toml_b: TOMLDocument) -> None:
+    """
+    Function to test that the `bulk_insert` function does not modify the
+    source when one of the insertions uses a key that is already present.
+    """
+    toml_string = load_toml_b.as_string()
+
+    with pytest.raises(KeyAlreadyPresent):
+        bulk_insert(
+            load_toml_b,
+            [
+                (None, "title", "Example TOML Document", 1, True),
+                ("main_table", "version", "1.0.0", 2, True),
+                ("main_table", "version", "2.0.0", 3, True),
+            ],
+        )
+
+    assert load_toml_b.as_string() == toml_string
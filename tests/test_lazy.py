@@ -0,0 +1,162 @@
+from pathlib import Path
+
+import pytest
+import tomlkit
+from tomlkit import items
+
+from tomlkit_extras import (
+    LazyTOMLDocument,
+    TOMLDecodingError,
+    TOMLDocumentDescriptor,
+    get_attribute_from_toml_source,
+    load_toml_file,
+)
+
+TOML_SOURCE = '''title = "Inventory"
+owner.name = "Tom"
+notes = """
+[not_a_table]
+"""
+
+[[hosts]]
+name = "alpha"
+
+[hosts.meta]
+rack = 1
+
+[[hosts]]
+name = "beta"
+
+  [server] # indented header
+ip = "10.0.0.1"
+
+[database]
+port = 5432
+
+[server.alpha]
+role = "frontend"
+
+[owner.address]
+city = "Paris"
+'''
+
+
+@pytest.mark.parametrize(
+    "toml_source",
+    [
+        "./tests/examples/toml_a.toml",
+        "./tests/examples/toml_b.toml",
+        "./tests/examples/toml_c.toml",
+        "./tests/examples/toml_d.toml",
+        "./tests/examples/toml_e.toml",
+    ],
+)
+def test_lazy_document_matches_parse(toml_source: str) -> None:
+    """
+    Function to test that a fully materialized `LazyTOMLDocument` renders and
+    unwraps identically to a document parsed by `tomlkit`.
+    """
+    toml_document = load_toml_file(toml_source=toml_source)
+    lazy_document = load_toml_file(toml_source=toml_source, lazy=True)
+    assert isinstance(lazy_document, LazyTOMLDocument)
+
+    assert lazy_document.as_string() == toml_document.as_string()
+    assert lazy_document.unwrap() == toml_document.unwrap()
+    assert not lazy_document.unparsed_keys
+
+
+@pytest.mark.parametrize(
+    "toml_content",
+    [
+        "[a.b]\nx = 1\n[c]\nz = 1\n[a.d]\ny = 1\n",
+        "[a]\nx = 1\n[c]\nz = 1\n[a.b]\ny = 1\n[a.b.c]\nq = 1\n",
+        "[[h]]\nn = 1\n[h.m]\nr = 1\n[[h]]\nn = 2\n[x]\n[[h]]\nn = 3\n",
+        "[s]\nalpha.ip = 1\n[p]\n[s.beta]\nip = 2\n[s.alpha.config]\nm = 1\n",
+        "  [s] # comment\nip = 1\n\n[s.t]\n  [s.t.u]\nv = 1\n",
+    ],
+)
+def test_lazy_document_split_tables(toml_content: str) -> None:
+    """
+    Function to test that tables split across a `LazyTOMLDocument`, including
+    runs of child tables and array-of-tables, are merged exactly as when
+    parsing the whole document.
+    """
+    toml_document = tomlkit.parse(toml_content)
+    lazy_document = LazyTOMLDocument.from_string(toml_content=toml_content)
+
+    assert lazy_document.as_string() == toml_document.as_string()
+    assert lazy_document.unwrap() == toml_document.unwrap()
+    assert not lazy_document.unparsed_keys
+
+
+def test_lazy_document_parses_on_access(tmp_path: Path) -> None:
+    """
+    Function to test that a `LazyTOMLDocument` only parses the tables under a
+    top-level key once the key is accessed, and that the result is unchanged
+    regardless of the order in which keys are accessed.
+    """
+    toml_path = tmp_path / "inventory.toml"
+    toml_path.write_text(TOML_SOURCE, encoding="utf-8")
+    toml_document = tomlkit.parse(TOML_SOURCE)
+
+    lazy_document = load_toml_file(toml_source=toml_path, lazy=True)
+    assert isinstance(lazy_document, LazyTOMLDocument)
+    assert lazy_document.unparsed_keys == ("hosts", "server", "database", "owner")
+
+    # Fields before the first table header are parsed up front
+    assert lazy_document["title"] == "Inventory"
+    assert "server" in lazy_document
+    assert lazy_document.unparsed_keys == ("hosts", "server", "database", "owner")
+
+    assert (
+        get_attribute_from_toml_source(
+            hierarchy="server.alpha.role", toml_source=lazy_document
+        )
+        == "frontend"
+    )
+    assert lazy_document.unparsed_keys == ("hosts", "database", "owner")
+
+    hosts = get_attribute_from_toml_source(hierarchy="hosts", toml_source=lazy_document)
+    assert isinstance(hosts, items.AoT)
+    assert [host["name"] for host in hosts] == ["alpha", "beta"]
+    assert lazy_document.unparsed_keys == ("database", "owner")
+
+    # The owner key is defined both before the first table header and by a
+    # later table, which are merged exactly as when parsing the whole document
+    assert lazy_document["owner"]["address"]["city"] == "Paris"
+    assert lazy_document.unparsed_keys == ("database",)
+
+    assert lazy_document.as_string() == TOML_SOURCE
+    assert lazy_document.unwrap() == toml_document.unwrap()
+    assert not lazy_document.unparsed_keys
+
+
+def test_lazy_document_descriptor(load_toml_a: tomlkit.TOMLDocument) -> None:
+    """
+    Function to test that a `TOMLDocumentDescriptor` created from a
+    `LazyTOMLDocument` is identical to one created from a parsed document.
+    """
+    lazy_document = load_toml_file(
+        toml_source="./tests/examples/toml_a.toml", lazy=True
+    )
+    lazy_descriptor = TOMLDocumentDescriptor(toml_source=lazy_document)
+    document_descriptor = TOMLDocumentDescriptor(toml_source=load_toml_a)
+
+    assert lazy_descriptor.number_of_tables == document_descriptor.number_of_tables
+    assert lazy_descriptor.number_of_aots == document_descriptor.number_of_aots
+    assert lazy_descriptor.number_of_fields == document_descriptor.number_of_fields
+
+
+def test_lazy_document_invalid_table() -> None:
+    """
+    Function to test that a syntax error within a table of a `LazyTOMLDocument`
+    is raised as a `TOMLDecodingError` once the table is accessed.
+    """
+    lazy_document = load_toml_file(
+        toml_source='title = "Inventory"\n\n[valid]\nkey = 1\n\n[invalid]\nkey = \n',
+        lazy=True,
+    )
+
+    assert lazy_document["valid"]["key"] == 1
+    with pytest.raises(TOMLDecodingError):
+        _ = lazy_document["invalid"]
@@ -8,11 +8,14 @@ from tomlkit.container import OutOfOrderTableProxy
 
 from tests.typing import FixtureFunction
 from tomlkit_extras import (
+    OutOfOrderTableView,
+    TOMLDocumentDescriptor,
     contains_out_of_order_tables,
     fix_out_of_order_table,
     fix_out_of_order_tables,
     get_attribute_from_toml_source,
     get_comments,
+    get_positions,
 )
 from tomlkit_extras._typing import ContainerComment
 
@@ -111,3 +114,95 @@ def test_fix_out_of_order_table(
     for hierarchy, table in test_case.tables:
         table_comments = get_comments(toml_source=fixed_table, hierarchy=hierarchy)
         assert table == table_comments
+
+
+@pytest.mark.parametrize(
+    "fixture, hierarchy",
+    [
+        ("load_toml_c", "tool.ruff"),
+        ("load_toml_d", "servers"),
+        ("load_toml_e", "project"),
+        ("load_toml_e", "servers"),
+    ],
+)
+def test_out_of_order_table_view(
+    fixture: FixtureFunction, hierarchy: str, request: pytest.FixtureRequest
+) -> None:
+    """Function to test the functionality of `OutOfOrderTableView`."""
+    toml_document: TOMLDocument = request.getfixturevalue(fixture)
+    toml_document_original = copy.deepcopy(toml_document)
+    out_of_order_table = get_attribute_from_toml_source(
+        hierarchy=hierarchy, toml_source=toml_document
+    )
+    assert isinstance(out_of_order_table, OutOfOrderTableProxy)
+
+    # The view must hold the same values as the proxy without copying tables
+    out_of_order_view = OutOfOrderTableView.from_proxy(table=out_of_order_table)
+    assert out_of_order_view.unwrap() == out_of_order_table.unwrap()
+    assert all(
+        view_table is proxy_table
+        for view_table, proxy_table in zip(
+            out_of_order_view.components, out_of_order_table._tables
+        )
+    )
+
+    fixed_table = fix_out_of_order_table(table=out_of_order_table)
+    assert set(out_of_order_view) == set(fixed_table)
+    assert len(out_of_order_view) == len(fixed_table)
+    assert toml_document_original == toml_document
+
+
+@pytest.mark.parametrize(
+    "fixture, hierarchy",
+    [
+        ("load_toml_c", "tool.ruff"),
+        ("load_toml_d", "servers"),
+        ("load_toml_e", "project"),
+    ],
+)
+def test_out_of_order_table_descriptor(
+    fixture: FixtureFunction, hierarchy: str, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that a `TOMLDocumentDescriptor` of an out-of-order table
+    matches the descriptor of the fixed table.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(fixture)
+    out_of_order_table = get_attribute_from_toml_source(
+        hierarchy=hierarchy, toml_source=toml_document
+    )
+    assert isinstance(out_of_order_table, OutOfOrderTableProxy)
+
+    out_of_order_descriptor = TOMLDocumentDescriptor(toml_source=out_of_order_table)
+    fixed_descriptor = TOMLDocumentDescriptor(
+        toml_source=fix_out_of_order_table(table=out_of_order_table)
+    )
+
+    assert out_of_order_descriptor.top_level_type == "table"
+    assert (
+        out_of_order_descriptor.top_level_hierarchy
+        == fixed_descriptor.top_level_hierarchy
+    )
+    assert out_of_order_descriptor.number_of_tables == fixed_descriptor.number_of_tables
+    assert out_of_order_descriptor.number_of_fields == fixed_descriptor.number_of_fields
+    assert (
+        out_of_order_descriptor.number_of_comments
+        == fixed_descriptor.number_of_comments
+    )
+
+
+@pytest.mark.parametrize("key", ["line-length", "lint"])
+def test_out_of_order_table_positions(key: str, load_toml_c: TOMLDocument) -> None:
+    """
+    Function to test that `get_positions` finds the positions of an item within
+    an out-of-order table as they would be within the fixed table.
+    """
+    out_of_order_table = get_attribute_from_toml_source(
+        hierarchy="tool.ruff", toml_source=load_toml_c
+    )
+    assert isinstance(out_of_order_table, OutOfOrderTableProxy)
+
+    fixed_table = fix_out_of_order_table(table=out_of_order_table)
+    assert get_positions(
+        hierarchy=f"tool.ruff.{key}", toml_source=load_toml_c
+    ) == get_positions(hierarchy=key, toml_source=fixed_table)
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import pytest
+import tomlkit
+from tomlkit import TOMLDocument
+
+from tests.typing import FixtureFunction
+from tomlkit_extras import (
+    TOMLDocumentDescriptor,
+    TOMLSourceStatistics,
+    collect_statistics,
+    get_attribute_from_toml_source,
+)
+
+
+@dataclass(frozen=True)
+class StatisticsTestCase:
+    """
+    Dataclass representing a test case for the counts per depth and per table,
+    and the size of all values, collected by the `collect_statistics` function.
+    """
+
+    fixture: FixtureFunction
+    fields_per_depth: Dict[int, int]
+    tables_per_depth: Dict[int, int]
+    fields_per_table: Dict[str, int]
+    value_bytes: int
+
+
+@pytest.mark.parametrize(
+    "fixture, hierarchy",
+    [
+        ("load_toml_a", None),
+        ("load_toml_a", "members"),
+        ("load_toml_b", None),
+        ("load_toml_b", "main_table"),
+        ("load_toml_c", None),
+        ("load_toml_c", "tool.ruff"),
+        ("load_toml_d", None),
+        ("load_toml_d", "servers"),
+    ],
+)
+def test_collect_statistics_counts(
+    fixture: FixtureFunction, hierarchy: Optional[str], request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test that the counts collected by `collect_statistics` are the
+    same as those of a `TOMLDocumentDescriptor`.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(fixture)
+    toml_source = (
+        toml_document
+        if hierarchy is None
+        else get_attribute_from_toml_source(
+            hierarchy=hierarchy, toml_source=toml_document
+        )
+    )
+
+    toml_statistics = collect_statistics(toml_source=toml_source)
+    toml_descriptor = TOMLDocumentDescriptor(toml_source=toml_source)
+
+    assert toml_statistics.number_of_tables == toml_descriptor.number_of_tables
+    assert (
+        toml_statistics.number_of_inline_tables
+        == toml_descriptor.number_of_inline_tables
+    )
+    assert toml_statistics.number_of_aots == toml_descriptor.number_of_aots
+    assert toml_statistics.number_of_arrays == toml_descriptor.number_of_arrays
+    assert toml_statistics.number_of_comments == toml_descriptor.number_of_comments
+    assert toml_statistics.number_of_fields == toml_descriptor.number_of_fields
+    assert sum(toml_statistics.fields_per_depth.values()) == (
+        toml_statistics.number_of_fields
+    )
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        StatisticsTestCase(
+            "load_toml_b",
+            {1: 1, 2: 2, 3: 5, 5: 1},
+            {1: 1, 2: 3, 3: 1, 4: 1},
+            {
+                "main_table": 2,
+                "main_table.sub_tables": 4,
+                "tool.ruff": 1,
+                "tool.ruff.lint": 0,
+                "tool.ruff.lint.pydocstyle": 1,
+            },
+            130,
+        ),
+    ],
+)
+def test_collect_statistics_extended(
+    test_case: StatisticsTestCase, request: pytest.FixtureRequest
+) -> None:
+    """
+    Function to test the counts per depth and per table, and the size of all
+    values, collected by the `collect_statistics` function.
+    """
+    toml_document: TOMLDocument = request.getfixturevalue(test_case.fixture)
+    toml_statistics = collect_statistics(toml_source=toml_document)
+
+    assert toml_statistics.fields_per_depth == test_case.fields_per_depth
+    assert toml_statistics.tables_per_depth == test_case.tables_per_depth
+    assert toml_statistics.fields_per_table == test_case.fields_per_table
+    assert toml_statistics.value_bytes == test_case.value_bytes
+
+
+def test_collect_statistics_merge() -> None:
+    """
+    Function to test merging the statistics collected by `collect_statistics`
+    for several TOML sources.
+    """
+    toml_statistics = TOMLSourceStatistics()
+    for value in ["é", "ab"]:
+        toml_document = tomlkit.parse(f'[table]\nname = "{value}"\nvalues = [1]\n')
+        toml_statistics.merge(toml_statistics=collect_statistics(toml_document))
+
+    assert toml_statistics.number_of_tables == 2
+    assert toml_statistics.number_of_fields == 2
+    assert toml_statistics.number_of_arrays == 2
+    assert toml_statistics.fields_per_depth == {2: 2}
+    assert toml_statistics.tables_per_depth == {1: 2}
+    assert toml_statistics.fields_per_table == {"table": 2}
+
+    # The quotes of each string are counted, and "é" is encoded as two bytes
+    assert toml_statistics.value_bytes == 4 + 4 + 1 + 1
+
+    with pytest.raises(TypeError):
+        collect_statistics(toml_source=tomlkit.comment("comment"))
@@ -0,0 +1,105 @@
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+import tomlkit
+from tomlkit import items
+
+from tomlkit_extras import get_attribute_from_toml_source, iter_toml_tables
+
+TOML_SOURCE = '''title = "Inventory"
+matrix = [
+  [1, 2],
+[3]
+]
+notes = """
+[not_a_table]
+\\"""
+[[still_not_a_table]]
+"""
+
+[[hosts]]
+name = "alpha" # [comment]
+tags = ["[x]", '[y]']
+
+[hosts.meta]
+rack = 1
+
+[[hosts]]
+name = "beta"
+
+[[hosts.ports]]
+port = 80
+
+[[hosts.ports]]
+port = 443
+
+["quoted.key" . inner]
+value = 1
+
+[server]
+ip = "10.0.0.1"
+
+[server.alpha]
+role = "frontend"
+'''
+
+
+@pytest.mark.parametrize(
+    "toml_source, expected",
+    [
+        (
+            "./tests/examples/toml_a.toml",
+            [("project", 3), ("details", 6), ("members", 9), ("members", 18)],
+        ),
+        ("./tests/examples/toml_b.toml", [("tool", 6), ("main_table", 14)]),
+    ],
+)
+def test_iter_toml_tables(toml_source: str, expected: List[Tuple[str, int]]) -> None:
+    """
+    Function to test that `iter_toml_tables` yields each top-level table, and
+    that each is equal to the table in the fully parsed document.
+    """
+    with open(toml_source, mode="r", encoding="utf-8") as file:
+        toml_document = tomlkit.parse(file.read())
+
+    streamed_tables = list(iter_toml_tables(toml_path=toml_source))
+    assert [
+        (str(hierarchy), line_no) for hierarchy, _, line_no in streamed_tables
+    ] == expected
+
+    for hierarchy, table, _ in streamed_tables:
+        if not isinstance(toml_document[str(hierarchy)], items.AoT):
+            assert table == toml_document[str(hierarchy)]
+
+
+def test_iter_toml_tables_array_of_tables(tmp_path: Path) -> None:
+    """
+    Function to test that `iter_toml_tables` yields each element of a top-level
+    array-of-tables separately, and ignores lines within multi-line strings
+    and arrays that resemble table headers.
+    """
+    toml_path = tmp_path / "inventory.toml"
+    toml_path.write_text(TOML_SOURCE, encoding="utf-8")
+    toml_document = tomlkit.parse(TOML_SOURCE)
+
+    streamed_tables = list(iter_toml_tables(toml_path=toml_path))
+    assert [(str(hierarchy), line_no) for hierarchy, _, line_no in streamed_tables] == [
+        ("hosts", 12),
+        ("hosts", 19),
+        ("quoted.key", 28),
+        ("server", 31),
+    ]
+
+    (_, alpha, _), (_, beta, _), (_, quoted, _), (_, server, _) = streamed_tables
+    assert alpha == toml_document["hosts"][0]
+    assert beta == toml_document["hosts"][1]
+    assert quoted == toml_document["quoted.key"]
+    assert server == toml_document["server"]
+
+    # Each table can be used with the retrieval helpers
+    assert get_attribute_from_toml_source(hierarchy="meta.rack", toml_source=alpha) == 1
+    assert (
+        get_attribute_from_toml_source(hierarchy="alpha.role", toml_source=server)
+        == "frontend"
+    )
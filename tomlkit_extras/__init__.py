@@ -1,3 +1,11 @@
+from tomlkit_extras._cache import (
+    CacheStatistics,
+    TOMLFileCache,
+    TOMLParseCache,
+    disable_parse_cache,
+    enable_parse_cache,
+    get_parse_cache,
+)
 from tomlkit_extras._exceptions import (
     BaseTOMLError,
     HierarchyModificationError,
@@ -18,8 +26,14 @@ from tomlkit_extras._exceptions import (
     TOMLInsertionError,
     TOMLReadError,
 )
-from tomlkit_extras._file_validator import load_toml_file
-from tomlkit_extras._hierarchy import Hierarchy
+from tomlkit_extras._file_validator import (
+    get_decoding_statistics,
+    load_toml_file,
+    reset_decoding_statistics,
+)
+from tomlkit_extras._hierarchy import Hierarchy, InternedHierarchy
+from tomlkit_extras._lazy import LazyTOMLDocument
+from tomlkit_extras._streaming import iter_toml_tables
 from tomlkit_extras._utils import (
     contains_out_of_order_tables,
     create_array,
@@ -37,14 +51,22 @@ from tomlkit_extras.descriptor._descriptors import (
     TableDescriptor,
 )
 from tomlkit_extras.descriptor._helpers import CommentDescriptor
+from tomlkit_extras.descriptor._diff import DescriptorChange, diff_descriptors
+from tomlkit_extras.descriptor._indexes import CommentEntry, LineLookup
+from tomlkit_extras.descriptor._statistics import (
+    TOMLSourceStatistics,
+    collect_statistics,
+)
 from tomlkit_extras.toml._comments import get_array_field_comment, get_comments
 from tomlkit_extras.toml._delete import delete_from_toml_source
 from tomlkit_extras.toml._insert import (
     attribute_insert,
+    bulk_insert,
     container_insert,
     general_insert,
 )
 from tomlkit_extras.toml._out_of_order import (
+    OutOfOrderTableView,
     fix_out_of_order_table,
     fix_out_of_order_tables,
 )
@@ -58,9 +80,22 @@ from tomlkit_extras.toml._update import update_toml_source
 __version__ = "0.2.0"
 __all__ = [
     "load_toml_file",
+    "get_decoding_statistics",
+    "reset_decoding_statistics",
+    "CacheStatistics",
+    "TOMLFileCache",
+    "TOMLParseCache",
+    "disable_parse_cache",
+    "enable_parse_cache",
+    "get_parse_cache",
     "Hierarchy",
+    "InternedHierarchy",
+    "LazyTOMLDocument",
+    "iter_toml_tables",
     "delete_from_toml_source",
     "TOMLDocumentDescriptor",
+    "TOMLSourceStatistics",
+    "collect_statistics",
     "update_toml_source",
     "contains_out_of_order_tables",
     "create_array",
@@ -73,13 +108,19 @@ __all__ = [
     "get_comments",
     "StructureComment",
     "CommentDescriptor",
+    "CommentEntry",
+    "LineLookup",
+    "DescriptorChange",
+    "diff_descriptors",
     "AoTDescriptor",
     "FieldDescriptor",
     "StyleDescriptor",
     "TableDescriptor",
     "attribute_insert",
+    "bulk_insert",
     "container_insert",
     "general_insert",
+    "OutOfOrderTableView",
     "fix_out_of_order_table",
     "fix_out_of_order_tables",
     "get_attribute_from_toml_source",
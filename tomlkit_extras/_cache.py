@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Hashable, Optional, Tuple, Union
+
+from tomlkit import TOMLDocument
+
+from tomlkit_extras._typing import FileSignature, TOMLBuffer
+
+# Default limits of the process-wide parse cache
+_DEFAULT_MAX_ENTRIES = 128
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    """
+    Dataclass representing a snapshot of the counters of a cache.
+
+    Attributes:
+        hits (int): The number of lookups that found a cached document.
+        misses (int): The number of lookups that did not find a cached document.
+        evictions (int): The number of entries evicted to stay within the limits.
+        entries (int): The number of entries currently in the cache.
+        size_bytes (int): The number of bytes used by entries currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class _DocumentCache:
+    """
+    A private base class which provides a thread-safe, least-recently-used
+    cache of `tomlkit.TOMLDocument` instances, bounded by both an entry count
+    and a byte budget.
+
+    Documents are stored in a serialized form, so that every lookup hands back
+    an independent `tomlkit.TOMLDocument` instance that cannot affect the
+    cached entry when modified. The size of each entry is the size of its
+    serialized form. Each entry can also be stored with a tag, in which case
+    a lookup only succeeds if the tag of the lookup matches.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("Both max_entries and max_bytes must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[Hashable, Tuple[Hashable, bytes]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: Hashable, tag: Hashable = None) -> Optional[TOMLDocument]:
+        """
+        Retrieves an independent copy of a cached `tomlkit.TOMLDocument`
+        instance, or None if there is no entry for the key and tag. An entry
+        for the key with a different tag is stale, and is removed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] != tag:
+                self._remove(key=key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        toml_document: TOMLDocument = pickle.loads(entry[1])
+        return toml_document
+
+    def _put(
+        self, key: Hashable, toml_document: TOMLDocument, tag: Hashable = None
+    ) -> None:
+        """
+        Adds a `tomlkit.TOMLDocument` instance to the cache, evicting the
+        least recently used entries if either limit is exceeded. A document
+        which by itself exceeds the byte budget is not cached.
+        """
+        serialized = pickle.dumps(toml_document, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if len(serialized) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key=key)
+            self._entries[key] = (tag, serialized)
+            self._size_bytes += len(serialized)
+
+            while (
+                len(self._entries) > self.max_entries
+                or self._size_bytes > self.max_bytes
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size_bytes -= len(evicted)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> bool:
+        """
+        Removes the entry for a key from the cache, where the lock must already
+        be held by the caller.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+
+        self._size_bytes -= len(entry[1])
+        return True
+
+    def clear(self) -> None:
+        """Removes all entries from the cache, and resets all counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def statistics(self) -> CacheStatistics:
+        """
+        Returns a snapshot of the counters of the cache.
+
+        Returns:
+            `CacheStatistics`: A `CacheStatistics` instance.
+        """
+        with self._lock:
+            return CacheStatistics(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+
+class TOMLParseCache(_DocumentCache):
+    """
+    A thread-safe, least-recently-used cache of parsed `tomlkit.TOMLDocument`
+    instances, keyed by a hash of the raw string or bytes they were parsed from.
+
+    Documents are stored in a serialized form, so that every lookup hands back
+    an independent `tomlkit.TOMLDocument` instance that cannot affect the
+    cached entry when modified. The size of each entry is the size of its
+    serialized form, and the least recently used entries are evicted whenever
+    either the entry count or the byte budget is exceeded.
+
+    Args:
+        max_entries (int): The maximum number of entries in the cache. Defaults
+            to 128.
+        max_bytes (int): The maximum number of bytes used by all entries in
+            the cache. Defaults to 64 MiB.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+    ) -> None:
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes)
+
+    @staticmethod
+    def content_key(
+        toml_content: Union[str, TOMLBuffer], encoding: Optional[str]
+    ) -> Tuple[str, Optional[str], bytes]:
+        """
+        Creates the key of the cache entry for a string or bytes representation
+        of a TOML file. The key is a hash of the content, along with whether the
+        content was a string and the encoding used to decode bytes.
+
+        Args:
+            toml_content (str | `TOMLBuffer`): A string or bytes-like representation
+                of a TOML file.
+            encoding (str | None): The encoding used to decode bytes, or None.
+
+        Returns:
+            Tuple[str, str | None, bytes]: A tuple, which is the key of the entry.
+        """
+        if isinstance(toml_content, str):
+            content_type = "str"
+            toml_bytes = toml_content.encode("utf-8", "surrogatepass")
+        else:
+            content_type = "bytes"
+            toml_bytes = toml_content
+
+        digest = hashlib.blake2b(toml_bytes, digest_size=16).digest()
+        return (content_type, encoding, digest)
+
+    def get(self, key: Hashable) -> Optional[TOMLDocument]:
+        """
+        Retrieves an independent copy of a cached `tomlkit.TOMLDocument`
+        instance, or None if there is no entry for the key.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            `tomlkit.TOMLDocument` | None: A `tomlkit.TOMLDocument` instance or None.
+        """
+        return self._get(key=key)
+
+    def put(self, key: Hashable, toml_document: TOMLDocument) -> None:
+        """
+        Adds a `tomlkit.TOMLDocument` instance to the cache, evicting the
+        least recently used entries if either limit is exceeded. A document
+        which by itself exceeds the byte budget is not cached.
+
+        Args:
+            key (Hashable): The key of the entry.
+            toml_document (`tomlkit.TOMLDocument`): A `tomlkit.TOMLDocument` instance.
+        """
+        self._put(key=key, toml_document=toml_document)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Removes the entry for a key from the cache.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            bool: A boolean indicating whether an entry was removed.
+        """
+        with self._lock:
+            return self._remove(key=key)
+
+
+class TOMLFileCache(_DocumentCache):
+    """
+    A thread-safe, least-recently-used cache of `tomlkit.TOMLDocument` instances
+    loaded from files, which can be passed into `load_toml_file` through its
+    `cache` argument.
+
+    Each entry is keyed by the absolute path of the file, and is only valid
+    while the modification time, size, and inode of the file are unchanged.
+    Checking an entry takes a single `stat` call, and a hit does not read the
+    file at all. As with `TOMLParseCache`, every lookup hands back an
+    independent `tomlkit.TOMLDocument` instance.
+
+    Args:
+        max_entries (int): The maximum number of entries in the cache. Defaults
+            to 128.
+        max_bytes (int): The maximum number of bytes used by all entries in
+            the cache. Defaults to 64 MiB.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+    ) -> None:
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes)
+
+    @staticmethod
+    def path_key(path: Union[str, Path]) -> str:
+        """
+        Creates the key of the cache entry for a file, being its absolute path.
+
+        Args:
+            path (str | `Path`): A string or `Path` instance of a file path.
+
+        Returns:
+            str: The absolute path of the file.
+        """
+        return os.path.abspath(path)
+
+    @staticmethod
+    def file_signature(
+        file_stat: os.stat_result, encoding: Optional[str]
+    ) -> FileSignature:
+        """
+        Creates the signature of a file, which identifies the version of the
+        file that an entry was loaded from.
+
+        Args:
+            file_stat (`os.stat_result`): The result of a `stat` call on the file.
+            encoding (str | None): The encoding used to decode the file, or None.
+
+        Returns:
+            `FileSignature`: A tuple of the modification time in nanoseconds,
+                size, and inode of the file, and the encoding.
+        """
+        return (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino, encoding)
+
+    def get(
+        self,
+        path: Union[str, Path],
+        file_stat: os.stat_result,
+        encoding: Optional[str] = None,
+    ) -> Optional[TOMLDocument]:
+        """
+        Retrieves an independent copy of the `tomlkit.TOMLDocument` instance
+        cached for a file, or None if there is no entry for the file or the
+        file has changed since it was cached.
+
+        Args:
+            path (str | `Path`): A string or `Path` instance of a file path.
+            file_stat (`os.stat_result`): The result of a `stat` call on the file.
+            encoding (str | None): The encoding used to decode the file, or None.
+                Defaults to None.
+
+        Returns:
+            `tomlkit.TOMLDocument` | None: A `tomlkit.TOMLDocument` instance or None.
+        """
+        return self._get(
+            key=self.path_key(path=path),
+            tag=self.file_signature(file_stat=file_stat, encoding=encoding),
+        )
+
+    def put(
+        self,
+        path: Union[str, Path],
+        file_stat: os.stat_result,
+        toml_document: TOMLDocument,
+        encoding: Optional[str] = None,
+    ) -> None:
+        """
+        Adds the `tomlkit.TOMLDocument` instance loaded from a file to the cache,
+        evicting the least recently used entries if either limit is exceeded.
+
+        Args:
+            path (str | `Path`): A string or `Path` instance of a file path.
+            file_stat (`os.stat_result`): The result of a `stat` call on the file,
+                made before it was read.
+            toml_document (`tomlkit.TOMLDocument`): A `tomlkit.TOMLDocument` instance.
+            encoding (str | None): The encoding used to decode the file, or None.
+                Defaults to None.
+        """
+        self._put(
+            key=self.path_key(path=path),
+            toml_document=toml_document,
+            tag=self.file_signature(file_stat=file_stat, encoding=encoding),
+        )
+
+    def invalidate(self, path: Union[str, Path]) -> bool:
+        """
+        Removes the entry for a file from the cache.
+
+        Args:
+            path (str | `Path`): A string or `Path` instance of a file path.
+
+        Returns:
+            bool: A boolean indicating whether an entry was removed.
+        """
+        with self._lock:
+            return self._remove(key=self.path_key(path=path))
+
+
+_parse_cache: Optional[TOMLParseCache] = None
+
+
+def enable_parse_cache(
+    max_entries: int = _DEFAULT_MAX_ENTRIES, max_bytes: int = _DEFAULT_MAX_BYTES
+) -> TOMLParseCache:
+    """
+    Enables a process-wide cache of parsed documents, used by `load_toml_file`
+    whenever a string, bytes, or bytearray instance is parsed. Any existing
+    process-wide cache is replaced.
+
+    Args:
+        max_entries (int): The maximum number of entries in the cache. Defaults
+            to 128.
+        max_bytes (int): The maximum number of bytes used by all entries in
+            the cache. Defaults to 64 MiB.
+
+    Returns:
+        `TOMLParseCache`: The `TOMLParseCache` instance that was enabled.
+    """
+    global _parse_cache
+    _parse_cache = TOMLParseCache(max_entries=max_entries, max_bytes=max_bytes)
+    return _parse_cache
+
+
+def disable_parse_cache() -> None:
+    """Disables and discards the process-wide cache of parsed documents."""
+    global _parse_cache
+    _parse_cache = None
+
+
+def get_parse_cache() -> Optional[TOMLParseCache]:
+    """
+    Returns the process-wide cache of parsed documents, if it is enabled.
+
+    Returns:
+        `TOMLParseCache` | None: A `TOMLParseCache` instance or None.
+    """
+    return _parse_cache
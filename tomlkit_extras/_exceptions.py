@@ -1,10 +1,41 @@
 from abc import ABC, abstractmethod
 from typing import Any, List, Optional, Set, Union
 
-from tomlkit_extras._hierarchy import Hierarchy
-from tomlkit_extras._typing import BodyContainerItems, Retrieval, TOMLFieldSource
+from tomlkit_extras._hierarchy import Hierarchy, HierarchyTrie
+from tomlkit_extras._typing import (
+    BodyContainerItems,
+    HierarchyCollection,
+    Retrieval,
+    TOMLFieldSource,
+)
 from tomlkit_extras._utils import decompose_body_item, safe_unwrap
 
+
+def _hierarchies_to_set(hierarchies: HierarchyCollection) -> Set[str]:
+    """
+    A private function which returns a `HierarchyCollection` instance as a set
+    of string hierarchies.
+    """
+    if isinstance(hierarchies, HierarchyTrie):
+        return hierarchies.hierarchies()
+    else:
+        return hierarchies
+
+
+def _longest_ancestor_hierarchy(
+    hierarchy: Hierarchy, hierarchies: HierarchyCollection
+) -> Optional[str]:
+    """
+    A private function which returns the longest ancestor of a hierarchy that
+    appears in a `HierarchyCollection` instance, looking it up in the trie
+    directly when the hierarchies are indexed in one.
+    """
+    if isinstance(hierarchies, HierarchyTrie):
+        return hierarchies.longest_ancestor(hierarchy=hierarchy)
+    else:
+        return hierarchy.longest_ancestor_hierarchy(hierarchies=hierarchies)
+
+
 # ==============================================================================
 # General Base Error Class for all Errors
 # ==============================================================================
@@ -119,16 +150,21 @@ class InvalidHierarchyError(InvalidTOMLStructureError):
     """
 
     def __init__(
-        self, message: str, hierarchy: Hierarchy, hierarchies: Set[str]
+        self, message: str, hierarchy: Hierarchy, hierarchies: HierarchyCollection
     ) -> None:
         super().__init__(message=message, hierarchy=hierarchy)
-        self.hierarchies = hierarchies
+        self._hierarchies = hierarchies
+
+    @property
+    def hierarchies(self) -> Set[str]:
+        """Returns all hierarchies appearing in the space of the TOML file."""
+        return _hierarchies_to_set(hierarchies=self._hierarchies)
 
     @property
     def closest_hierarchy(self) -> Optional[str]:
         """Returns the longest ancestor hierarchy that exists in the TOML file."""
-        return self._hierarchy_obj.longest_ancestor_hierarchy(
-            hierarchies=self.hierarchies
+        return _longest_ancestor_hierarchy(
+            hierarchy=self._hierarchy_obj, hierarchies=self._hierarchies
         )
 
 
@@ -207,14 +243,23 @@ class InvalidArrayOfTablesError(InvalidTOMLStructureError):
             the invalid hierarchy that exists in the TOML file
     """
 
-    def __init__(self, message: str, hierarchy: Hierarchy, arrays: Set[str]) -> None:
+    def __init__(
+        self, message: str, hierarchy: Hierarchy, arrays: HierarchyCollection
+    ) -> None:
         super().__init__(message=message, hierarchy=hierarchy)
-        self.arrays = arrays
+        self._arrays = arrays
+
+    @property
+    def arrays(self) -> Set[str]:
+        """Returns all hierarchies corresponding to existing arrays-of-tables."""
+        return _hierarchies_to_set(hierarchies=self._arrays)
 
     @property
     def closest_hierarchy(self) -> Optional[str]:
         """Returns the longest ancestor hierarchy that exists in the TOML file."""
-        return self._hierarchy_obj.longest_ancestor_hierarchy(hierarchies=self.arrays)
+        return _longest_ancestor_hierarchy(
+            hierarchy=self._hierarchy_obj, hierarchies=self._arrays
+        )
 
 
 # ==============================================================================
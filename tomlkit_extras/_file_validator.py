@@ -1,6 +1,9 @@
+import codecs
+import mmap
 import os
+import stat
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 import charset_normalizer
 import tomlkit
@@ -9,10 +12,33 @@ from pathvalidate import ValidationError, validate_filepath
 from tomlkit import TOMLDocument
 from tomlkit.exceptions import ParseError
 
+from tomlkit_extras._cache import TOMLFileCache, get_parse_cache
 from tomlkit_extras._exceptions import TOMLConversionError, TOMLDecodingError
-from tomlkit_extras._typing import TOMLSourceFile
+from tomlkit_extras._lazy import LazyTOMLDocument
+from tomlkit_extras._typing import DecodingStrategy, TOMLBuffer, TOMLSourceFile
 from tomlkit_extras._utils import from_dict_to_toml_document
 
+# The number of bytes, from the start of the content, that are sampled when
+# detecting the encoding of content that is not valid UTF-8
+_DETECTION_SAMPLE_SIZE = 64 * 1024
+
+# Byte order marks and their corresponding encodings, where the UTF-32 marks
+# are checked first since the little-endian mark starts with the UTF-16 one
+_BYTE_ORDER_MARKS: Tuple[Tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_DECODING_STATISTICS: Dict[DecodingStrategy, int] = {
+    "explicit": 0,
+    "bom": 0,
+    "utf-8": 0,
+    "detected": 0,
+}
+
 
 def _read_toml(toml_content: str) -> TOMLDocument:
     """
@@ -31,49 +57,260 @@ def _read_toml(toml_content: str) -> TOMLDocument:
         )
 
 
-def _load_toml(toml_content: Union[str, bytes]) -> TOMLDocument:
+def get_decoding_statistics() -> Dict[DecodingStrategy, int]:
     """
-    A private function which accepts either a string or bytes instance,
-    being a string or bytes representation of a TOML file respectively, into
-    a `tomlkit.TOMLDocument` instance.
+    Returns the number of times each decoding strategy was used to decode
+    bytes into a string when loading TOML files, since the process started or
+    since the counts were last reset.
+
+    The strategies are:
+    - "explicit": decoded with an encoding passed in by the caller.
+    - "bom": decoded with the encoding indicated by a byte order mark.
+    - "utf-8": decoded as strict UTF-8, the encoding specified for TOML.
+    - "detected": decoded with an encoding detected from a bounded sample,
+        after a strict UTF-8 decode failed.
+
+    Returns:
+        Dict[`DecodingStrategy`, int]: A dictionary mapping each decoding
+            strategy to the number of times it was used.
     """
-    if isinstance(toml_content, bytes):
-        detected_encoding: Optional[CharsetMatch] = charset_normalizer.from_bytes(
-            toml_content
-        ).best()
+    return dict(_DECODING_STATISTICS)
 
-        # Default to utf-8 encoding if encoding was not detected
-        toml_encoding: str = "utf-8"
 
-        if detected_encoding is not None:
-            toml_encoding = detected_encoding.encoding
+def reset_decoding_statistics() -> None:
+    """Resets the counts of each decoding strategy back to zero."""
+    for strategy in _DECODING_STATISTICS:
+        _DECODING_STATISTICS[strategy] = 0
 
-        # Decode content and parse into dictionary
-        toml_content_decoded: str = toml_content.decode(toml_encoding)
-        return _read_toml(toml_content=toml_content_decoded)
-    else:
-        return _read_toml(toml_content=toml_content)
+
+def _detect_encoding(toml_content: TOMLBuffer) -> Optional[str]:
+    """
+    A private function which detects the encoding of bytes, using only a
+    bounded sample from the start of the content.
+    """
+    detected_encoding: Optional[CharsetMatch] = charset_normalizer.from_bytes(
+        bytes(toml_content[:_DETECTION_SAMPLE_SIZE])
+    ).best()
+
+    if detected_encoding is None:
+        return None
+    return detected_encoding.encoding
+
+
+def _decode_toml(
+    toml_content: TOMLBuffer, encoding: Optional[str]
+) -> Tuple[str, DecodingStrategy]:
+    """
+    A private function which decodes bytes into a string, returning the string
+    along with the decoding strategy that was used.
+
+    If an encoding is passed in, then it is always used. Otherwise, a byte
+    order mark is honoured, then a strict UTF-8 decode is attempted, and only
+    if that fails is the encoding detected from a bounded sample.
+
+    The content is decoded directly from its buffer, so that memory views and
+    memory-mapped files are never copied into a bytes object first.
+    """
+    if encoding is not None:
+        return str(toml_content, encoding), "explicit"
+
+    content_start = bytes(toml_content[:4])
+    for byte_order_mark, bom_encoding in _BYTE_ORDER_MARKS:
+        if content_start.startswith(byte_order_mark):
+            return str(toml_content, bom_encoding), "bom"
+
+    try:
+        return str(toml_content, "utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        detected_encoding = _detect_encoding(toml_content=toml_content)
+
+        if detected_encoding is None:
+            raise
+
+        return str(toml_content, detected_encoding), "detected"
+
+
+def _decode_toml_content(
+    toml_content: Union[str, TOMLBuffer], encoding: Optional[str]
+) -> str:
+    """
+    A private function which decodes, if needed, a string or bytes
+    representation of a TOML file into a string.
+    """
+    if isinstance(toml_content, str):
+        return toml_content
+
+    try:
+        toml_content_decoded, strategy = _decode_toml(
+            toml_content=toml_content, encoding=encoding
+        )
+    except UnicodeDecodeError:
+        raise TOMLDecodingError("Issue occured when decoding the TOML source content")
+
+    _DECODING_STATISTICS[strategy] += 1
+    return toml_content_decoded
+
+
+def _parse_toml(
+    toml_content: Union[str, TOMLBuffer], encoding: Optional[str]
+) -> TOMLDocument:
+    """
+    A private function which decodes, if needed, and parses a string or
+    bytes representation of a TOML file into a `tomlkit.TOMLDocument` instance.
+    """
+    return _read_toml(
+        toml_content=_decode_toml_content(toml_content=toml_content, encoding=encoding)
+    )
 
 
-def load_toml_file(toml_source: TOMLSourceFile) -> TOMLDocument:
+def _load_toml(
+    toml_content: Union[str, TOMLBuffer],
+    encoding: Optional[str] = None,
+    lazy: bool = False,
+) -> TOMLDocument:
     """
-    Accepts a string, bytes, bytearray, `Path`, `tomlkit.TOMLDocument`, or
-    Dict[str, Any] instance and converts it into a `tomlkit.TOMLDocument`
+    A private function which accepts either a string, or a bytes-like instance
+    (bytes, bytearray, memoryview, or mmap), being a string or bytes
+    representation of a TOML file respectively, into a `tomlkit.TOMLDocument`
     instance.
 
+    If the process-wide parse cache is enabled, then the document is retrieved
+    from the cache when the same content was already parsed. A lazy document
+    is never cached, since it is not parsed up front.
+    """
+    if lazy:
+        return LazyTOMLDocument.from_string(
+            toml_content=_decode_toml_content(
+                toml_content=toml_content, encoding=encoding
+            )
+        )
+
+    parse_cache = get_parse_cache()
+
+    if parse_cache is None:
+        return _parse_toml(toml_content=toml_content, encoding=encoding)
+
+    cache_key = parse_cache.content_key(toml_content=toml_content, encoding=encoding)
+    toml_document = parse_cache.get(key=cache_key)
+
+    if toml_document is None:
+        toml_document = _parse_toml(toml_content=toml_content, encoding=encoding)
+        parse_cache.put(key=cache_key, toml_document=toml_document)
+
+    return toml_document
+
+
+def _stat_file(file_path: Union[str, Path]) -> Optional[os.stat_result]:
+    """
+    A private function which returns the result of a `stat` call on a path if
+    it links to an existing regular file, otherwise None. As with
+    `os.path.isfile`, strings that cannot be a path return None.
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
+def _load_toml_file_path(
+    file_path: Union[str, Path],
+    file_stat: os.stat_result,
+    encoding: Optional[str],
+    cache: Optional[TOMLFileCache],
+    memory_map: bool,
+    lazy: bool,
+) -> TOMLDocument:
+    """
+    A private function which reads and parses a TOML file into a
+    `tomlkit.TOMLDocument` instance, unless an unchanged version of the file
+    is already in the cache. If `memory_map` is True, the file is decoded
+    directly from a read-only memory map instead of being read into memory.
+    """
+    if lazy:
+        cache = None
+
+    if cache is not None:
+        toml_document = cache.get(
+            path=file_path, file_stat=file_stat, encoding=encoding
+        )
+        if toml_document is not None:
+            return toml_document
+
+    with open(file_path, mode="rb") as file:
+        # An empty file cannot be memory-mapped
+        if memory_map and file_stat.st_size > 0:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as toml_mmap:
+                toml_document = _load_toml(
+                    toml_content=toml_mmap, encoding=encoding, lazy=lazy
+                )
+        else:
+            toml_document = _load_toml(
+                toml_content=file.read(), encoding=encoding, lazy=lazy
+            )
+
+    if cache is not None:
+        cache.put(
+            path=file_path,
+            file_stat=file_stat,
+            toml_document=toml_document,
+            encoding=encoding,
+        )
+
+    return toml_document
+
+
+def load_toml_file(
+    toml_source: TOMLSourceFile,
+    encoding: Optional[str] = None,
+    cache: Optional[TOMLFileCache] = None,
+    memory_map: bool = False,
+    lazy: bool = False,
+) -> TOMLDocument:
+    """
+    Accepts a string, bytes, bytearray, memoryview, `Path`, `tomlkit.TOMLDocument`,
+    or Dict[str, Any] instance and converts it into a `tomlkit.TOMLDocument`
+    instance.
+
+    When reading bytes, whether from a file or from a bytes, bytearray, or
+    memoryview instance, a byte order mark is honoured, and otherwise the content is
+    decoded as UTF-8. Only if the content is not valid UTF-8 is the encoding
+    detected from a sample of the content. The `encoding` argument bypasses
+    all of this, and is always used to decode bytes if passed in.
+
     Args:
-        toml_source (`TOMLSourceFile`): A string, bytes, bytearray, Path,
-            `tomlkit.TOMLDocument`, or Dict[str, Any] instance.
+        toml_source (`TOMLSourceFile`): A string, bytes, bytearray, memoryview,
+            Path, `tomlkit.TOMLDocument`, or Dict[str, Any] instance.
+        encoding (str | None): The encoding used to decode bytes, or None to
+            determine the encoding automatically. Defaults to None.
+        cache (`TOMLFileCache` | None): A `TOMLFileCache` instance used when
+            the source is a path to a file, or None to always read the file.
+            Defaults to None.
+        memory_map (bool): Whether a file is decoded directly from a read-only
+            memory map, rather than first being read into memory as bytes. This
+            lowers the peak memory used when loading very large files. Defaults
+            to False.
+        lazy (bool): Whether a string, bytes, or file source is loaded as a
+            `LazyTOMLDocument`, which only parses each top-level table when it
+            is first accessed. A lazy document is never retrieved from, or
+            stored in, a cache. Defaults to False.
 
     Returns:
         `tomlkit.TOMLDocument`: A `tomlkit.TOMLDocument` instance.
     """
     if isinstance(toml_source, (str, Path)):
-        if os.path.isfile(toml_source):
-            with open(toml_source, mode="rb") as file:
-                toml_content = file.read()
+        file_stat = _stat_file(file_path=toml_source)
 
-            return _load_toml(toml_content=toml_content)
+        if file_stat is not None:
+            return _load_toml_file_path(
+                file_path=toml_source,
+                file_stat=file_stat,
+                encoding=encoding,
+                cache=cache,
+                memory_map=memory_map,
+                lazy=lazy,
+            )
 
         try:
             toml_source_as_path = Path(toml_source)
@@ -86,7 +323,7 @@ def load_toml_file(toml_source: TOMLSourceFile) -> TOMLDocument:
             )
 
         if isinstance(toml_source, str):
-            return _load_toml(toml_content=toml_source)
+            return _load_toml(toml_content=toml_source, lazy=lazy)
         else:
             raise TOMLConversionError(
                 "Unexpected issue occured when loading the source from TOML"
@@ -98,13 +335,12 @@ def load_toml_file(toml_source: TOMLSourceFile) -> TOMLDocument:
 
     # If the source is passed as a bytes object
     elif isinstance(toml_source, bytes):
-        return _load_toml(toml_content=toml_source)
-
-    # In the case where the source is passed as a bytearray object
-    elif isinstance(toml_source, bytearray):
-        toml_source_to_bytes = bytes(toml_source)
+        return _load_toml(toml_content=toml_source, encoding=encoding, lazy=lazy)
 
-        return _load_toml(toml_content=toml_source_to_bytes)
+    # In the case where the source is passed as a bytearray or memoryview object,
+    # which can be decoded directly without first copying it into a bytes object
+    elif isinstance(toml_source, (bytearray, memoryview)):
+        return _load_toml(toml_content=toml_source, encoding=encoding, lazy=lazy)
     else:
         raise TypeError(
             "Expected an instance of TOMLSourceFile, but got "
@@ -1,6 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple
+import fnmatch
+import heapq
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 if TYPE_CHECKING:
     from tomlkit_extras._typing import TOMLHierarchy
@@ -9,7 +27,8 @@ if TYPE_CHECKING:
 def standardize_hierarchy(hierarchy: TOMLHierarchy) -> Hierarchy:
     """
     Accepts a `TOMLHierarchy` instance, being an instance of string or `Hierarchy`,
-    and returns a `Hierarchy` instance.
+    and returns a `Hierarchy` instance. A string is converted to an
+    `InternedHierarchy` instance.
 
     Args:
         hierarchy (`TOMLHierarchy`) A `TOMLHierarchy` instance.
@@ -18,7 +37,7 @@ def standardize_hierarchy(hierarchy: TOMLHierarchy) -> Hierarchy:
         `Hierarchy`: A `Hierarchy` instance.
     """
     if isinstance(hierarchy, str):
-        hierarchy_final = Hierarchy.from_str_hierarchy(hierarchy=hierarchy)
+        hierarchy_final = InternedHierarchy.from_str_hierarchy(hierarchy=hierarchy)
     else:
         hierarchy_final = hierarchy
     return hierarchy_final
@@ -168,7 +187,7 @@ class Hierarchy:
     @property
     def full_hierarchy(self) -> Tuple[str, ...]:
         """Returns a tuple instance of the entire hierarchy."""
-        return tuple(list(self.hierarchy) + [self.attribute])
+        return self.hierarchy + (self.attribute,)
 
     @property
     def base_hierarchy_str(self) -> str:
@@ -242,7 +261,7 @@ class Hierarchy:
         )
 
     def _ancestor_hierarchy_match(
-        self, ancestor_hierarchies: List[str], hierarchies: Set[str]
+        self, ancestor_hierarchies: Sequence[str], hierarchies: Set[str]
     ) -> Optional[str]:
         """
         A private method that returns the first ancestor hierarchy appearing in a
@@ -293,3 +312,666 @@ class Hierarchy:
         """
         parent_hierarchy = Hierarchy.parent_hierarchy(hierarchy=hierarchy)
         return self == parent_hierarchy
+
+
+# Process-wide tables of interned hierarchies, keyed by the tuple of the entire
+# hierarchy and by its string representation. Both tables are cleared once the
+# number of interned hierarchies reaches a limit, to bound their memory
+_MAX_INTERNED_HIERARCHIES = 65_536
+_INTERNED_HIERARCHIES: Dict[Tuple[str, ...], InternedHierarchy] = dict()
+_INTERNED_STR_HIERARCHIES: Dict[str, InternedHierarchy] = dict()
+
+
+class InternedHierarchy(Hierarchy):
+    """
+    An immutable and hashable `Hierarchy`, where each unique hierarchy is
+    represented by a single shared instance. Creating an `InternedHierarchy`
+    with the same levels as an existing one returns the existing instance.
+
+    The tuple and string representations of the entire hierarchy, its depth,
+    and its ancestor hierarchies are computed once when the instance is
+    created. As an `InternedHierarchy` cannot be modified, `add_to_hierarchy`
+    raises an error, and `extend_hierarchy` returns a new hierarchy instead.
+
+    Attributes:
+        hierarchy (Tuple[str, ...]): A tuple representing the base levels of the hierarchy.
+        attribute (str): The final level or attribute of the hierarchy.
+    """
+
+    _full_hierarchy: Tuple[str, ...]
+    _full_hierarchy_str: str
+    _ancestor_hierarchies: Tuple[str, ...]
+    _str_round_trips: bool
+
+    def __new__(cls, hierarchy: Tuple[str, ...], attribute: str) -> InternedHierarchy:
+        full_hierarchy = tuple(hierarchy) + (attribute,)
+        interned = _INTERNED_HIERARCHIES.get(full_hierarchy)
+        if interned is not None:
+            return interned
+
+        interned = super().__new__(cls)
+        ancestor_hierarchies: List[str] = []
+        for level in full_hierarchy:
+            ancestor_hierarchies.append(
+                Hierarchy.create_hierarchy(
+                    hierarchy=ancestor_hierarchies[-1] if ancestor_hierarchies else "",
+                    attribute=level,
+                )
+            )
+
+        object.__setattr__(interned, "hierarchy", full_hierarchy[:-1])
+        object.__setattr__(interned, "attribute", attribute)
+        object.__setattr__(interned, "_full_hierarchy", full_hierarchy)
+        object.__setattr__(
+            interned,
+            "_full_hierarchy_str",
+            ".".join(full_hierarchy) if ".".join(hierarchy) else attribute,
+        )
+        object.__setattr__(
+            interned, "_ancestor_hierarchies", tuple(ancestor_hierarchies)
+        )
+
+        # Comparing with a string can only be done on the string representation
+        # if splitting it gives back the same levels
+        object.__setattr__(
+            interned,
+            "_str_round_trips",
+            tuple(interned._full_hierarchy_str.split(".")) == full_hierarchy,
+        )
+
+        if len(_INTERNED_HIERARCHIES) >= _MAX_INTERNED_HIERARCHIES:
+            _INTERNED_HIERARCHIES.clear()
+            _INTERNED_STR_HIERARCHIES.clear()
+
+        _INTERNED_HIERARCHIES[full_hierarchy] = interned
+        return interned
+
+    def __init__(self, hierarchy: Tuple[str, ...], attribute: str) -> None:
+        # All attributes are set once, when the instance is first created
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} instances are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} instances are immutable")
+
+    def __eq__(self, hierarchy: Any) -> bool:
+        if hierarchy is self:
+            return True
+        elif isinstance(hierarchy, Hierarchy):
+            return self._full_hierarchy == hierarchy.full_hierarchy
+        elif isinstance(hierarchy, str) and self._str_round_trips:
+            return self._full_hierarchy_str == hierarchy
+
+        return super().__eq__(hierarchy)
+
+    def __hash__(self) -> int:
+        # Hashed as the string representation, as an instance is equal to it
+        return hash(self._full_hierarchy_str)
+
+    def __copy__(self) -> InternedHierarchy:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> InternedHierarchy:
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self.__class__, (self.hierarchy, self.attribute))
+
+    @classmethod
+    def from_str_hierarchy(cls, hierarchy: str) -> InternedHierarchy:
+        """
+        A class method which returns an `InternedHierarchy` instance from a string
+        instance of a TOML hierarchy.
+
+        Args:
+            hierarchy (str) A string instance representing a TOML hierarchy.
+
+        Returns:
+            `InternedHierarchy`: An `InternedHierarchy` instance.
+        """
+        interned = _INTERNED_STR_HIERARCHIES.get(hierarchy)
+        if interned is None:
+            *base_levels, attribute = hierarchy.split(".")
+            interned = cls(hierarchy=tuple(base_levels), attribute=attribute)
+            _INTERNED_STR_HIERARCHIES[hierarchy] = interned
+
+        return interned
+
+    @classmethod
+    def from_list_hierarchy(cls, hierarchy: List[str]) -> InternedHierarchy:
+        """
+        A class method which returns an `InternedHierarchy` instance from a list
+        instance of strings representing each individual level in a TOML hierarchy.
+
+        Args:
+            hierarchy (List[str]) A list instance of strings representing each
+                individual level in a TOML hierarchy
+
+        Returns:
+            `InternedHierarchy`: An `InternedHierarchy` instance.
+        """
+        if not hierarchy:
+            raise ValueError("There must be an existing hierarchy")
+
+        return cls(hierarchy=tuple(hierarchy[:-1]), attribute=hierarchy[-1])
+
+    @property
+    def depth(self) -> int:
+        """
+        Returns the depth of the hierarchy, also known as the number of levels
+        in the hierarchy.
+        """
+        return len(self._full_hierarchy)
+
+    @property
+    def full_hierarchy(self) -> Tuple[str, ...]:
+        """Returns a tuple instance of the entire hierarchy."""
+        return self._full_hierarchy
+
+    @property
+    def full_hierarchy_str(self) -> str:
+        """Returns a string instance of the entire hierarchy."""
+        return self._full_hierarchy_str
+
+    @property
+    def ancestor_hierarchies(self) -> List[str]:
+        """
+        Returns a list of strings representing all ancestor hierarchies of the current
+        hierarchy.
+        """
+        return list(self._ancestor_hierarchies)
+
+    @property
+    def parent(self) -> Optional[InternedHierarchy]:
+        """
+        Returns the `InternedHierarchy` of the parent of the current hierarchy,
+        or None if the hierarchy only has a single level.
+        """
+        if not self.hierarchy:
+            return None
+
+        return InternedHierarchy(
+            hierarchy=self.hierarchy[:-1], attribute=self.hierarchy[-1]
+        )
+
+    def shortest_ancestor_hierarchy(self, hierarchies: Set[str]) -> Optional[str]:
+        """
+        Returns the shortest hierarchy appearing in a set of string instances being
+        an ancestor of the current hierarchy.
+
+        Will return None if no hierarchy found in the set is an ancestor of the
+        current hierarchy.
+
+        Args:
+            hierarchies (Set[str]): A set of strings representing TOML hierarchies.
+
+        Returns:
+            str | None: A string instance or None.
+        """
+        return self._ancestor_hierarchy_match(
+            ancestor_hierarchies=self._ancestor_hierarchies, hierarchies=hierarchies
+        )
+
+    def longest_ancestor_hierarchy(self, hierarchies: Set[str]) -> Optional[str]:
+        """
+        Returns the longest hierarchy appearing in a set of string instances being
+        an ancestor of the current hierarchy.
+
+        Will return None if no hierarchy found in the set is an ancestor of the
+        current hierarchy.
+
+        Args:
+            hierarchies (Set[str]): A set of strings representing TOML hierarchies.
+
+        Returns:
+            str | None: A string instance or None.
+        """
+        return self._ancestor_hierarchy_match(
+            ancestor_hierarchies=self._ancestor_hierarchies[::-1],
+            hierarchies=hierarchies,
+        )
+
+    def add_to_hierarchy(self, update: str) -> None:
+        """
+        Raises an error, as an `InternedHierarchy` cannot be modified. Use
+        `extend_hierarchy` to create a new hierarchy with more levels instead.
+
+        Args:
+            update (str): A string instance to append to the existing hierarchy.
+        """
+        raise AttributeError(
+            f"{self.__class__.__name__} instances are immutable, "
+            "use extend_hierarchy instead"
+        )
+
+    def extend_hierarchy(self, update: str) -> InternedHierarchy:
+        """
+        Returns the `InternedHierarchy` with at least one more level appended to
+        the current hierarchy. Returns the current hierarchy if the update is an
+        empty string.
+
+        Args:
+            update (str): A string instance to append to the existing hierarchy.
+
+        Returns:
+            `InternedHierarchy`: An `InternedHierarchy` instance.
+        """
+        if not update:
+            return self
+
+        return InternedHierarchy.from_str_hierarchy(
+            hierarchy=Hierarchy.create_hierarchy(
+                hierarchy=self._full_hierarchy_str, attribute=update
+            )
+        )
+
+
+# The type of the values stored in a `HierarchyTrie`
+_V = TypeVar("_V")
+
+# Characters of a level in a hierarchy pattern that are matched as by `fnmatch`
+_GLOB_CHARACTERS = ("*", "?", "[")
+
+
+class _TrieNode(Generic[_V]):
+    """
+    A private class representing a single level within a `HierarchyTrie`,
+    which holds a value only if its hierarchy was added to the trie.
+    """
+
+    __slots__ = ("hierarchy", "children", "value", "has_value")
+
+    def __init__(self, hierarchy: str) -> None:
+        self.hierarchy = hierarchy
+        self.children: Dict[str, _TrieNode[_V]] = dict()
+        self.value: Optional[_V] = None
+        self.has_value = False
+
+    def iter_nodes(self) -> Iterator[_TrieNode[_V]]:
+        """
+        Iterates through all nodes with a value below the current node, in the
+        order they were first added to the trie, visiting each parent before
+        its children.
+        """
+        stack: List[Iterator[_TrieNode[_V]]] = [iter(self.children.values())]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                continue
+
+            if node.has_value:
+                yield node
+            stack.append(iter(node.children.values()))
+
+
+class HierarchyTrie(Generic[_V]):
+    """
+    A mapping of string TOML hierarchies to values, stored as a trie keyed by
+    each level of the hierarchies.
+
+    Checking if a hierarchy exists, retrieving its value, and finding the
+    longest or shortest ancestor of a hierarchy that exists are all done by
+    walking one node per level, regardless of the number of hierarchies
+    stored. The children and descendants of a hierarchy can also be listed.
+
+    Each method accepts a `TOMLHierarchy` instance, being a string or a
+    `Hierarchy` instance.
+    """
+
+    def __init__(self) -> None:
+        self._root: _TrieNode[_V] = _TrieNode(hierarchy=str())
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        return (node.hierarchy for node in self._root.iter_nodes())
+
+    def __contains__(self, hierarchy: object) -> bool:
+        if not isinstance(hierarchy, (str, Hierarchy)):
+            return False
+
+        node = self._find_node(hierarchy=hierarchy)
+        return node is not None and node.has_value
+
+    def __getitem__(self, hierarchy: TOMLHierarchy) -> _V:
+        node = self._find_node(hierarchy=hierarchy)
+        if node is None or not node.has_value:
+            raise KeyError(str(hierarchy))
+
+        return cast(_V, node.value)
+
+    def __setitem__(self, hierarchy: TOMLHierarchy, value: _V) -> None:
+        node = self._root
+        for level in self._levels(hierarchy=hierarchy):
+            child = node.children.get(level)
+            if child is None:
+                child = _TrieNode(
+                    hierarchy=Hierarchy.create_hierarchy(
+                        hierarchy=node.hierarchy, attribute=level
+                    )
+                )
+                node.children[level] = child
+            node = child
+
+        if not node.has_value:
+            self._size += 1
+
+        node.value = value
+        node.has_value = True
+
+    def __repr__(self) -> str:
+        return f"<HierarchyTrie {len(self)} hierarchies>"
+
+    @staticmethod
+    def _levels(hierarchy: TOMLHierarchy) -> Sequence[str]:
+        """A private method which returns the levels of a `TOMLHierarchy`."""
+        if isinstance(hierarchy, str):
+            return hierarchy.split(".")
+        else:
+            return hierarchy.full_hierarchy
+
+    def _find_node(self, hierarchy: TOMLHierarchy) -> Optional[_TrieNode[_V]]:
+        """
+        A private method which returns the node of a hierarchy, or None if no
+        hierarchy added to the trie starts with it.
+        """
+        node = self._root
+        for level in self._levels(hierarchy=hierarchy):
+            child = node.children.get(level)
+            if child is None:
+                return None
+
+            node = child
+
+        return node
+
+    def _iter_ancestors(self, hierarchy: TOMLHierarchy) -> Iterator[_TrieNode[_V]]:
+        """
+        A private method which iterates through the nodes with a value along a
+        hierarchy, from the shortest to the longest, including the hierarchy
+        itself.
+        """
+        node = self._root
+        for level in self._levels(hierarchy=hierarchy):
+            child = node.children.get(level)
+            if child is None:
+                return
+
+            node = child
+            if node.has_value:
+                yield node
+
+    def get(
+        self, hierarchy: TOMLHierarchy, default: Optional[_V] = None
+    ) -> Optional[_V]:
+        """
+        Returns the value of a hierarchy, or a default if the hierarchy does not
+        exist in the trie.
+
+        Args:
+            hierarchy (`TOMLHierarchy`): A `TOMLHierarchy` instance.
+            default (Any | None): The value to return if the hierarchy does not
+                exist. Defaults to None.
+
+        Returns:
+            Any | None: The value of the hierarchy, or the default.
+        """
+        node = self._find_node(hierarchy=hierarchy)
+        if node is None or not node.has_value:
+            return default
+
+        return node.value
+
+    def values(self) -> Iterator[_V]:
+        """
+        Returns an iterator of the values of all hierarchies in the trie, where
+        the value of each parent comes before those of its children.
+        """
+        return (cast(_V, node.value) for node in self._root.iter_nodes())
+
+    def ordered_values(self, key: Callable[[_V], int]) -> Iterator[_V]:
+        """
+        Returns an iterator of the values of all hierarchies in the trie, sorted
+        by an integer key, where values with an equal key are in the order that
+        `values` returns them.
+
+        The trie is expected to be filled in order of the key, so that of two
+        sibling hierarchies, the one added first has the smallest key of all
+        values at or below it. This holds for the line numbers of the items of
+        a TOML source added in the order they appear, even if tables appear out
+        of order. Only the siblings along one path are kept in memory at once
+        for such a trie, instead of all values.
+
+        Args:
+            key (Callable[[Any], int]): A function returning the key of a value.
+
+        Returns:
+            Iterator[Any]: An iterator of the values of the trie.
+        """
+
+        # The smallest key of a node and all below it, found by following only
+        # the first child of each node, as every node without a value has a
+        # child below it with a value
+        def smallest_key(node: _TrieNode[_V]) -> int:
+            node_keys: List[int] = []
+            while not node.has_value or node.children:
+                if node.has_value:
+                    node_keys.append(key(cast(_V, node.value)))
+                node = next(iter(node.children.values()))
+
+            node_keys.append(key(cast(_V, node.value)))
+            return min(node_keys)
+
+        # Each entry is the key, a sequence number to break ties, a node, and
+        # either an iterator of the remaining siblings of the node, or None if
+        # the entry is for the value of the node itself
+        heap: List[
+            Tuple[int, int, _TrieNode[_V], Optional[Iterator[_TrieNode[_V]]]]
+        ] = []
+        counter = itertools.count()
+
+        def push_siblings(siblings: Iterator[_TrieNode[_V]]) -> None:
+            for node in siblings:
+                node_key = smallest_key(node=node)
+                heapq.heappush(heap, (node_key, next(counter), node, siblings))
+                return
+
+        push_siblings(siblings=iter(self._root.children.values()))
+        while heap:
+            _, _, node, siblings = heapq.heappop(heap)
+            if siblings is None:
+                yield cast(_V, node.value)
+                continue
+
+            push_siblings(siblings=siblings)
+            if node.has_value:
+                node_key = key(cast(_V, node.value))
+                heapq.heappush(heap, (node_key, next(counter), node, None))
+            push_siblings(siblings=iter(node.children.values()))
+
+    def items(self) -> Iterator[Tuple[str, _V]]:
+        """
+        Returns an iterator of tuples of each hierarchy in the trie and its
+        value, where each parent comes before its children.
+        """
+        return (
+            (node.hierarchy, cast(_V, node.value)) for node in self._root.iter_nodes()
+        )
+
+    def hierarchies(self) -> Set[str]:
+        """Returns a set of all hierarchies in the trie."""
+        return set(self)
+
+    def replace_level(self, level: str, trie: HierarchyTrie[_V]) -> None:
+        """
+        Replaces all hierarchies in the trie whose first level is `level` with
+        those of another trie, keeping the position of the level amongst all
+        other first levels. If the other trie has no hierarchies starting with
+        the level, then they are removed.
+
+        The nodes of the other trie are moved rather than copied, so the other
+        trie should not be modified afterwards.
+
+        Args:
+            level (str): The first level of the hierarchies to replace.
+            trie (`HierarchyTrie`): A `HierarchyTrie` instance.
+        """
+        children = self._root.children
+        node = children.get(level)
+        if node is not None:
+            self._size -= node.has_value + sum(1 for _ in node.iter_nodes())
+
+        replacement = trie._root.children.get(level)
+        if replacement is None:
+            children.pop(level, None)
+        else:
+            children[level] = replacement
+            self._size += replacement.has_value + sum(
+                1 for _ in replacement.iter_nodes()
+            )
+
+    def reorder_levels(self, levels: Iterable[str]) -> None:
+        """
+        Reorders the first levels of all hierarchies in the trie, which changes
+        the order hierarchies are iterated through. Any first level not in
+        `levels` is placed after those that are, in its current order.
+
+        Args:
+            levels (Iterable[str]): The first levels in their new order.
+        """
+        children = self._root.children
+        ordered = {level: children[level] for level in levels if level in children}
+        ordered.update(children)
+        self._root.children = ordered
+
+    def longest_ancestor(self, hierarchy: TOMLHierarchy) -> Optional[str]:
+        """
+        Returns the longest hierarchy in the trie that is an ancestor of a
+        hierarchy, which includes the hierarchy itself. Returns None if no
+        ancestor exists in the trie.
+
+        Args:
+            hierarchy (`TOMLHierarchy`): A `TOMLHierarchy` instance.
+
+        Returns:
+            str | None: A string instance or None.
+        """
+        longest_ancestor: Optional[str] = None
+        for node in self._iter_ancestors(hierarchy=hierarchy):
+            longest_ancestor = node.hierarchy
+
+        return longest_ancestor
+
+    def shortest_ancestor(self, hierarchy: TOMLHierarchy) -> Optional[str]:
+        """
+        Returns the shortest hierarchy in the trie that is an ancestor of a
+        hierarchy, which includes the hierarchy itself. Returns None if no
+        ancestor exists in the trie.
+
+        Args:
+            hierarchy (`TOMLHierarchy`): A `TOMLHierarchy` instance.
+
+        Returns:
+            str | None: A string instance or None.
+        """
+        for node in self._iter_ancestors(hierarchy=hierarchy):
+            return node.hierarchy
+
+        return None
+
+    def children(self, hierarchy: TOMLHierarchy) -> List[str]:
+        """
+        Returns a list of the hierarchies in the trie that are exactly one level
+        below a hierarchy.
+
+        Args:
+            hierarchy (`TOMLHierarchy`): A `TOMLHierarchy` instance.
+
+        Returns:
+            List[str]: A list of string hierarchies.
+        """
+        node = self._find_node(hierarchy=hierarchy)
+        if node is None:
+            return []
+
+        return [child.hierarchy for child in node.children.values() if child.has_value]
+
+    def descendants(self, hierarchy: TOMLHierarchy) -> Iterator[str]:
+        """
+        Returns an iterator of all hierarchies in the trie that are below a
+        hierarchy, at any depth, where each parent comes before its children.
+
+        Args:
+            hierarchy (`TOMLHierarchy`): A `TOMLHierarchy` instance.
+
+        Returns:
+            Iterator[str]: An iterator of string hierarchies.
+        """
+        node = self._find_node(hierarchy=hierarchy)
+        if node is None:
+            return iter(())
+
+        return (descendant.hierarchy for descendant in node.iter_nodes())
+
+    def match(self, pattern: str) -> List[Tuple[str, _V]]:
+        """
+        Returns a list of tuples of each hierarchy in the trie that matches
+        a glob-style hierarchy pattern, and its value, in no particular order.
+
+        Each level of the pattern is matched against one level of a hierarchy,
+        where a level of "*" matches any single level, a level of "**" matches
+        any number of levels, including none, and any other level is matched as
+        by the `fnmatch` module. Only the nodes that the pattern can reach are
+        visited, so a pattern made up of literal levels walks a single path.
+
+        Args:
+            pattern (str): A glob-style hierarchy pattern.
+
+        Returns:
+            List[Tuple[str, Any]]: A list of tuples of a string hierarchy and
+                its value.
+        """
+        levels = pattern.split(".")
+        if not all(levels):
+            raise ValueError("A hierarchy pattern must not have an empty level")
+
+        # Each state is a node along with the index of the next level of the
+        # pattern to match. As a "**" level can reach the same state in several
+        # ways, the states already visited are skipped
+        matches: List[Tuple[str, _V]] = []
+        stack: List[Tuple[_TrieNode[_V], int]] = [(self._root, 0)]
+        visited: Set[Tuple[int, int]] = set()
+        while stack:
+            node, index = stack.pop()
+            if (id(node), index) in visited:
+                continue
+            visited.add((id(node), index))
+
+            if index == len(levels):
+                if node.has_value and node is not self._root:
+                    matches.append((node.hierarchy, cast(_V, node.value)))
+                continue
+
+            level = levels[index]
+            if level == "**":
+                stack.append((node, index + 1))
+                stack.extend((child, index) for child in node.children.values())
+            elif level == "*":
+                stack.extend((child, index + 1) for child in node.children.values())
+            elif any(char in level for char in _GLOB_CHARACTERS):
+                stack.extend(
+                    (child, index + 1)
+                    for child_level, child in node.children.items()
+                    if fnmatch.fnmatchcase(child_level, level)
+                )
+            else:
+                child = node.children.get(level)
+                if child is not None:
+                    stack.append((child, index + 1))
+
+        return matches
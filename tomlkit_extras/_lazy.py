@@ -0,0 +1,427 @@
+import io
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import tomlkit
+from tomlkit import TOMLDocument, items
+from tomlkit.container import Container, OutOfOrderTableProxy
+from tomlkit.exceptions import ParseError
+
+from tomlkit_extras._exceptions import TOMLConversionError, TOMLDecodingError
+from tomlkit_extras._scanner import TableHeader, scan_table_headers
+from tomlkit_extras._typing import BodyContainerItem, LazySlot
+
+
+@dataclass
+class _LazyEntry:
+    """
+    A private dataclass representing a run of consecutive table headers that
+    share the same top-level key, along with the raw content of the run, which
+    is only parsed when the top-level key is first accessed.
+    """
+
+    key: str
+    is_array: bool
+    content: str
+
+
+def _parse_lazy_content(toml_content: str) -> TOMLDocument:
+    """
+    A private function which parses part of the content of a lazy document,
+    raising the same errors as when a whole document is parsed.
+    """
+    try:
+        return tomlkit.parse(toml_content)
+    except ParseError:
+        raise TOMLDecodingError("Issue occured when decoding the TOML source content")
+    except Exception:
+        raise TOMLConversionError(
+            "Unexpected issue occured when loading the source from TOML"
+        )
+
+
+def _is_lazy_table_continued(start: TableHeader, header: TableHeader) -> bool:
+    """
+    A private function which returns a boolean indicating whether a header
+    belongs to the table started by another header, being either one of its
+    child tables, or another element of the same top-level array-of-tables.
+    """
+    if start.is_aot_element and header.is_aot_element:
+        return header.keys == start.keys
+
+    return (
+        len(header.keys) > len(start.keys)
+        and header.keys[: len(start.keys)] == start.keys
+    )
+
+
+def _parse_lazy_tables(toml_content: str) -> Iterator[BodyContainerItem]:
+    """
+    A private function which parses the content of a run of tables, yielding
+    each table, or array-of-tables, exactly as `tomlkit` yields them to the
+    document while parsing the whole document.
+
+    Only the public API of `tomlkit` is relied upon. The run is split into the
+    same tables that `tomlkit` yields, each of which is parsed on its own with
+    `tomlkit.parse`. Any indentation before the first header becomes the
+    indentation of the table, as it would be otherwise.
+    """
+    table_contents: List[str] = []
+    table_lines: List[str] = []
+    start: Optional[TableHeader] = None
+
+    for line, header in scan_table_headers(lines=io.StringIO(toml_content, newline="")):
+        if header is not None and (
+            start is None or not _is_lazy_table_continued(start=start, header=header)
+        ):
+            if table_lines:
+                table_contents.append("".join(table_lines))
+
+            table_lines = []
+            start = header
+
+        table_lines.append(line)
+
+    if table_lines:
+        table_contents.append("".join(table_lines))
+
+    for table_content in table_contents:
+        toml_document = tomlkit.parse(table_content)
+
+        # Parsing ends by taking the tables out of parsing mode, which they
+        # must be in for later tables to be merged into them as while parsing
+        toml_document.parsing(True)
+        yield from toml_document.body
+
+
+def _split_toml_content(toml_content: str) -> Tuple[str, List[_LazyEntry]]:
+    """
+    A private function which splits the content of a TOML file, in a single
+    pass, into the content appearing before the first table header, and a list
+    of `_LazyEntry` instances, one for each run of headers with the same
+    top-level key.
+    """
+    preamble_lines: List[str] = []
+    entries: List[_LazyEntry] = []
+    entry_lines: List[str] = []
+
+    for line, header in scan_table_headers(lines=io.StringIO(toml_content, newline="")):
+        if header is not None and (not entries or header.keys[0] != entries[-1].key):
+            if entries:
+                entries[-1].content = "".join(entry_lines)
+
+            entries.append(
+                _LazyEntry(
+                    key=header.keys[0], is_array=header.is_aot_element, content=""
+                )
+            )
+            entry_lines = []
+
+        if entries:
+            entry_lines.append(line)
+        else:
+            preamble_lines.append(line)
+
+    if entries:
+        entries[-1].content = "".join(entry_lines)
+
+    return "".join(preamble_lines), entries
+
+
+class LazyTOMLDocument(TOMLDocument):
+    """
+    A `tomlkit.TOMLDocument` subclass which only parses the fields before the
+    first table header up front, and defers parsing each top-level table, or
+    array-of-tables, until it is first accessed.
+
+    Accessing a top-level key, through `__getitem__`, `get`, `item`, or any
+    function that retrieves from the document by hierarchy, parses only the
+    tables under that key. Any operation that needs the whole document, such
+    as iterating, rendering with `as_string`, unwrapping, accessing `body`,
+    or modifying the document, first parses all remaining tables. Once fully
+    parsed, the document is identical to one returned by `tomlkit.parse`.
+
+    Since tables are parsed on access, a syntax error within a table is only
+    raised, as a `TOMLDecodingError`, when that table is first accessed.
+    """
+
+    def __init__(self, parsed: bool = False) -> None:
+        super().__init__(parsed=parsed)
+        self._lazy_entries: List[_LazyEntry] = []
+        self._pending_entries: Dict[str, List[int]] = {}
+        self._slots: List[LazySlot] = []
+        self._table_keys_before: List[Optional[str]] = []
+
+    @classmethod
+    def from_string(cls, toml_content: str) -> "LazyTOMLDocument":
+        """
+        Creates a `LazyTOMLDocument` instance from the string representation
+        of a TOML file, indexing the table headers in a single pass and only
+        parsing the content before the first table header.
+
+        Args:
+            toml_content (str): A string representation of a TOML file.
+
+        Returns:
+            `LazyTOMLDocument`: A `LazyTOMLDocument` instance.
+        """
+        preamble_content, entries = _split_toml_content(toml_content=toml_content)
+        preamble = _parse_lazy_content(toml_content=preamble_content)
+
+        toml_document = cls()
+        toml_document._lazy_entries = entries
+        toml_document._slots = [
+            ((-1, index), key, item) for index, (key, item) in enumerate(preamble.body)
+        ]
+
+        # The key of the last table added to the document before each entry,
+        # which is needed to merge split tables the way tomlkit does. Tables
+        # under an array-of-tables are merged into it, so never added
+        table_key: Optional[str] = (
+            preamble._table_keys[-1].key if preamble._table_keys else None
+        )
+        array_keys: Set[str] = set()
+        for index, entry in enumerate(entries):
+            pending_entries = toml_document._pending_entries.setdefault(entry.key, [])
+            if entry.is_array and not pending_entries:
+                array_keys.add(entry.key)
+
+            pending_entries.append(index)
+            toml_document._table_keys_before.append(table_key)
+            if entry.key not in array_keys:
+                table_key = entry.key
+
+        toml_document._rebuild_body()
+        return toml_document
+
+    @property
+    def unparsed_keys(self) -> Tuple[str, ...]:
+        """
+        Returns a tuple of the top-level keys whose tables have not yet been
+        parsed, in the order they first appear in the document.
+        """
+        return tuple(self._pending_entries)
+
+    def _rebuild_body(self) -> None:
+        """
+        A private method which rebuilds the body, and the key map, of the
+        document from the items that have been parsed so far, in the order
+        they appear in the document.
+        """
+        dict.clear(self)
+        super().__init__(parsed=False)
+
+        for _, key, item in self._slots:
+            self._raw_append(key, item)
+
+    def _merge_entries(self, key: str, slots: List[LazySlot]) -> List[LazySlot]:
+        """
+        A private method which parses each run of tables under a top-level key,
+        and appends each table, in parsing mode, to a container holding any
+        items with the same key that were already parsed. This reproduces how
+        `tomlkit` merges the tables while parsing the whole document.
+        """
+        merged_container = TOMLDocument(parsed=True)
+        origins: List[Tuple[int, int]] = []
+
+        for origin, slot_key, item in slots:
+            merged_container._raw_append(slot_key, item)
+            origins.append(origin)
+
+        merged_container.parsing(True)
+
+        try:
+            for entry_index in self._pending_entries[key]:
+                # While parsing, whether a table split across the document is
+                # merged or kept out-of-order depends on the last table parsed
+                table_key = self._table_keys_before[entry_index]
+                merged_container._table_keys = (
+                    [] if table_key is None else [items.SingleKey(table_key)]
+                )
+
+                entry = self._lazy_entries[entry_index]
+                for item_key, item in _parse_lazy_tables(toml_content=entry.content):
+                    body_length = len(merged_container.body)
+                    merged_container.append(item_key, item)
+                    origins.extend(
+                        (entry_index, index)
+                        for index in range(body_length, len(merged_container.body))
+                    )
+        except Exception:
+            raise TOMLDecodingError(
+                "Issue occured when decoding the TOML source content"
+            )
+
+        merged_container.parsing(False)
+        return [
+            (origin, item_key, item)
+            for origin, (item_key, item) in zip(origins, merged_container.body)
+        ]
+
+    def _materialize(self, keys: Iterable[str]) -> None:
+        """
+        A private method which parses the tables under each of the top-level
+        keys, merging them with any items with the same key that appear before
+        the first table header, exactly as `tomlkit` does when parsing the
+        whole document.
+        """
+        keys_to_parse = {key for key in keys if key in self._pending_entries}
+        if not keys_to_parse:
+            return
+
+        slots: List[LazySlot] = []
+        slots_by_key: DefaultDict[str, List[LazySlot]] = defaultdict(list)
+        for slot in self._slots:
+            _, slot_key, _ = slot
+            if slot_key is not None and slot_key.key in keys_to_parse:
+                slots_by_key[slot_key.key].append(slot)
+            else:
+                slots.append(slot)
+
+        for key in keys_to_parse:
+            slots.extend(self._merge_entries(key=key, slots=slots_by_key[key]))
+
+        for key in keys_to_parse:
+            del self._pending_entries[key]
+
+        slots.sort(key=lambda slot: slot[0])
+        self._slots = slots
+        self._rebuild_body()
+
+        # Once every table is parsed, the document no longer needs its index
+        if not self._pending_entries:
+            self._lazy_entries = []
+            self._slots = []
+            self._table_keys_before = []
+
+    def _materialize_all(self) -> None:
+        """A private method which parses all tables that are yet to be parsed."""
+        if self._pending_entries:
+            self._materialize(keys=list(self._pending_entries))
+
+    def item(
+        self, key: Union[items.Key, str]
+    ) -> Union[items.Item, OutOfOrderTableProxy]:
+        self._materialize(keys=[key.key if isinstance(key, items.Key) else key])
+        return super().item(key)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, (str, items.Key)):
+            key_string = key.key if isinstance(key, items.Key) else key
+            if key_string in self._pending_entries:
+                return True
+
+        return super().__contains__(key)
+
+    @property
+    def body(self) -> List[Tuple[Optional[items.Key], items.Item]]:
+        self._materialize_all()
+        return super().body
+
+    @property
+    def value(self) -> Dict[Any, Any]:
+        self._materialize_all()
+        return super().value
+
+    def unwrap(self) -> Dict[str, Any]:
+        self._materialize_all()
+        return super().unwrap()
+
+    def as_string(self) -> str:
+        self._materialize_all()
+        return super().as_string()
+
+    def last_item(self) -> Optional[items.Item]:
+        self._materialize_all()
+        return super().last_item()
+
+    def add(self, key: Any, item: Any = None) -> Container:
+        self._materialize_all()
+        return super().add(key, item)
+
+    def append(self, key: Any, item: Any, validate: bool = True) -> Container:
+        self._materialize_all()
+        return super().append(key, item, validate=validate)
+
+    def remove(self, key: Union[items.Key, str]) -> Container:
+        self._materialize_all()
+        return super().remove(key)
+
+    def setdefault(self, key: Union[items.Key, str], default: Any = None) -> Any:
+        self._materialize_all()
+        return super().setdefault(key, default)
+
+    def copy(self) -> "LazyTOMLDocument":
+        self._materialize_all()
+        return super().copy()
+
+    def __copy__(self) -> "LazyTOMLDocument":
+        self._materialize_all()
+        return super().__copy__()
+
+    def __reduce__(self) -> Any:
+        self._materialize_all()
+        return super().__reduce__()
+
+    def __reduce_ex__(self, protocol: int) -> Any:  # type: ignore[override]
+        self._materialize_all()
+        return super().__reduce_ex__(protocol)
+
+    def __len__(self) -> int:
+        self._materialize_all()
+        return super().__len__()
+
+    def __iter__(self) -> Iterator[str]:
+        self._materialize_all()
+        return super().__iter__()
+
+    def __setitem__(self, key: Union[items.Key, str], value: Any) -> None:
+        self._materialize_all()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Union[items.Key, str]) -> None:
+        self._materialize_all()
+        super().__delitem__(key)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize_all()
+        return super().__eq__(other)
+
+    def __str__(self) -> str:
+        self._materialize_all()
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        self._materialize_all()
+        return super().__repr__()
+
+    def _insert_at(self, idx: int, key: Union[items.Key, str], item: Any) -> Container:
+        self._materialize_all()
+        return super()._insert_at(idx, key, item)
+
+    def _insert_after(
+        self, key: Union[items.Key, str], other_key: Union[items.Key, str], item: Any
+    ) -> Container:
+        self._materialize_all()
+        return super()._insert_after(key, other_key, item)
+
+    def _replace_at(
+        self,
+        idx: Union[int, Tuple[int, ...]],
+        new_key: Union[items.Key, str],
+        value: items.Item,
+    ) -> None:
+        self._materialize_all()
+        super()._replace_at(idx, new_key, value)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from tomlkit_extras._hierarchy import Hierarchy
+from tomlkit_extras._typing import MutationListener
+
+# Listeners of each TOML source, keyed by the id of the source. Both the source
+# and its listeners are weakly referenced, so that neither is kept alive only
+# because a listener was added
+_LISTENERS: Dict[int, Tuple[weakref.ref[Any], List[weakref.WeakMethod[Any]]]] = {}
+
+
+def add_mutation_listener(toml_source: Any, listener: MutationListener) -> None:
+    """
+    Adds a listener to a TOML source, which is called after each modification
+    of the source made through `container_insert`, `attribute_insert`,
+    `general_insert`, `bulk_insert`, `update_toml_source`, or
+    `delete_from_toml_source`.
+
+    The listener is called with a set of the first levels of all hierarchies
+    that were modified, which is empty if only the top-level space of the
+    source was modified. The listener must be a bound method, and is removed
+    once its instance is garbage collected.
+
+    Args:
+        toml_source (Any): The TOML source to listen to.
+        listener (`MutationListener`): A bound method.
+    """
+    source_id = id(toml_source)
+    if source_id not in _LISTENERS:
+        source_ref = weakref.ref(toml_source, lambda _: _LISTENERS.pop(source_id, None))
+        _LISTENERS[source_id] = (source_ref, [])
+
+    _LISTENERS[source_id][1].append(weakref.WeakMethod(listener))
+
+
+def notify_mutation(
+    toml_source: Any, hierarchies: Iterable[Optional[Hierarchy]]
+) -> None:
+    """
+    Calls all listeners of a TOML source after it was modified at each of
+    `hierarchies`, where a hierarchy of None is the top-level space of the
+    source. Does nothing if the source has no listeners.
+
+    Args:
+        toml_source (Any): The TOML source that was modified.
+        hierarchies (Iterable[`Hierarchy` | None]): The hierarchies that were
+            modified.
+    """
+    entry = _LISTENERS.get(id(toml_source))
+    if entry is None:
+        return
+
+    source_ref, listener_refs = entry
+    if source_ref() is not toml_source:
+        return
+
+    levels: Set[str] = {
+        hierarchy.full_hierarchy[0]
+        for hierarchy in hierarchies
+        if hierarchy is not None
+    }
+    for listener_ref in list(listener_refs):
+        listener = listener_ref()
+        if listener is None:
+            listener_refs.remove(listener_ref)
+        else:
+            listener(levels)
@@ -0,0 +1,209 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple, cast
+
+import tomlkit
+
+# A line which is a table header, [table] or [[array-of-tables]], optionally
+# followed by a comment
+_TABLE_HEADER_LINE = re.compile(
+    r"^[ \t]*(?P<open>\[\[?)[ \t]*(?P<key>.+?)[ \t]*(?P<close>\]\]?)[ \t]*(#.*)?\r?\n?$"
+)
+
+# A dotted key made up of only bare keys, which can be split without parsing
+_BARE_DOTTED_KEY = re.compile(r"^[A-Za-z0-9_-]+(?:[ \t]*\.[ \t]*[A-Za-z0-9_-]+)*$")
+
+# Characters that can change the state of the scanner within a line
+_SCANNER_SPECIAL = re.compile(r"[\"'\[\]{}#]")
+
+
+@dataclass(frozen=True)
+class TableHeader:
+    """
+    Dataclass representing a table header found while scanning the lines of
+    a TOML file.
+
+    Attributes:
+        keys (Tuple[str, ...]): The keys making up the hierarchy of the table.
+        is_array (bool): Whether the header is an array-of-tables header.
+        line_no (int): The line number of the header, indexed at 1.
+    """
+
+    keys: Tuple[str, ...]
+    is_array: bool
+    line_no: int
+
+    @property
+    def is_aot_element(self) -> bool:
+        """
+        Returns a boolean indicating whether the header starts a new element of
+        a top-level array-of-tables.
+        """
+        return self.is_array and len(self.keys) == 1
+
+
+class _ScannerState:
+    """
+    A private class which tracks whether the scanner is within a multi-line
+    string, or within a value that spans multiple lines, such as an array.
+    Table headers are only recognized when neither is the case.
+    """
+
+    def __init__(self) -> None:
+        self.delimiter: Optional[str] = None
+        self.depth = 0
+
+    @property
+    def at_top_level(self) -> bool:
+        """
+        Returns a boolean indicating whether the next line starts outside of
+        any string or value.
+        """
+        return self.delimiter is None and self.depth == 0
+
+    def update(self, line: str) -> None:
+        """
+        Updates the state of the scanner with the contents of a line.
+
+        Args:
+            line (str): A line from a TOML file.
+        """
+        index = 0
+        while index < len(line):
+            if self.delimiter is not None:
+                index = self._close_multiline_string(line=line, index=index)
+                if self.delimiter is not None:
+                    return
+                continue
+
+            match = _SCANNER_SPECIAL.search(line, index)
+            if match is None:
+                return
+
+            char = match.group()
+            index = match.end()
+
+            if char == "#":
+                return
+            elif char in "\"'":
+                if line.startswith(char * 2, index):
+                    self.delimiter = char * 3
+                    index += 2
+                else:
+                    index = _skip_string(line=line, index=index, quote=char)
+            elif char in "[{":
+                self.depth += 1
+            else:
+                self.depth -= 1
+
+    def _close_multiline_string(self, line: str, index: int) -> int:
+        """
+        Searches for the closing delimiter of the current multi-line string
+        within a line, returning the index after it, or the length of the line
+        if the string does not end on this line.
+        """
+        delimiter = cast(str, self.delimiter)
+        while True:
+            end = line.find(delimiter, index)
+            if end == -1:
+                return len(line)
+
+            # Within a basic string, a delimiter preceded by an odd number of
+            # backslashes is escaped
+            backslashes = 0
+            while (
+                delimiter == '"""'
+                and end - backslashes > index
+                and line[end - backslashes - 1] == "\\"
+            ):
+                backslashes += 1
+
+            if backslashes % 2 == 0:
+                break
+            index = end + 1
+
+        # Up to two quotes may directly precede the delimiter, as part of the
+        # string itself
+        close = end + 3
+        while close < len(line) and close < end + 5 and line[close] == delimiter[0]:
+            close += 1
+
+        self.delimiter = None
+        return close
+
+
+def _skip_string(line: str, index: int, quote: str) -> int:
+    """
+    A private function which returns the index directly after a single-line
+    string, where `index` is the index directly after its opening quote.
+    """
+    while index < len(line):
+        char = line[index]
+        if char == "\\" and quote == '"':
+            index += 2
+            continue
+
+        index += 1
+        if char == quote:
+            break
+
+    return index
+
+
+def _split_header_key(key: str) -> Tuple[str, ...]:
+    """
+    A private function which splits the dotted key of a table header into
+    its individual keys. Keys that are quoted are parsed by tomlkit.
+    """
+    if _BARE_DOTTED_KEY.match(key) is not None:
+        return tuple(part.strip() for part in key.split("."))
+
+    keys: List[str] = []
+    container: Mapping[str, Any] = tomlkit.parse(f"[{key}]\n")
+    while container:
+        next_key = next(iter(container))
+        keys.append(next_key)
+        container = container[next_key]
+
+    return tuple(keys)
+
+
+def scan_table_headers(
+    lines: Iterable[str],
+) -> Iterator[Tuple[str, Optional[TableHeader]]]:
+    """
+    Scans the lines of a TOML file one at a time, yielding each line along
+    with the `TableHeader` instance if the line is a table header, or None
+    otherwise.
+
+    Lines within multi-line strings or multi-line arrays are never mistaken
+    for table headers, regardless of what they contain.
+
+    Args:
+        lines (Iterable[str]): An iterable of the lines of a TOML file, each
+            including its line ending.
+
+    Returns:
+        Iterator[Tuple[str, `TableHeader` | None]]: An iterator of tuples, each
+            containing a line and a `TableHeader` instance or None.
+    """
+    state = _ScannerState()
+
+    for line_index, line in enumerate(lines):
+        header: Optional[TableHeader] = None
+
+        if state.at_top_level:
+            match = _TABLE_HEADER_LINE.match(line)
+            if match is not None and len(match.group("open")) == len(
+                match.group("close")
+            ):
+                header = TableHeader(
+                    keys=_split_header_key(key=match.group("key")),
+                    is_array=len(match.group("open")) == 2,
+                    line_no=line_index + 1,
+                )
+
+        if header is None:
+            state.update(line=line)
+
+        yield line, header
@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+from tomlkit import items
+
+from tomlkit_extras._file_validator import _read_toml
+from tomlkit_extras._hierarchy import Hierarchy
+from tomlkit_extras._scanner import TableHeader, scan_table_headers
+from tomlkit_extras._typing import StreamedTable
+
+
+def _starts_new_entry(current: Optional[TableHeader], header: TableHeader) -> bool:
+    """
+    A private function which determines if a table header starts a new
+    top-level table or array-of-tables element, or if it belongs to the
+    current one.
+    """
+    return (
+        current is None
+        or header.keys[0] != current.keys[0]
+        or (current.is_aot_element and header.is_aot_element)
+    )
+
+
+def _materialize_entry(header: TableHeader, lines: List[str]) -> StreamedTable:
+    """
+    A private function which parses the lines of a single top-level table or
+    array-of-tables element, and returns it along with its hierarchy and the
+    line number of its header.
+    """
+    toml_document = _read_toml(toml_content="".join(lines))
+    toml_entry = toml_document[header.keys[0]]
+
+    table: items.Table
+    if isinstance(toml_entry, items.AoT):
+        table = toml_entry[0]
+    else:
+        table = toml_entry
+
+    hierarchy = Hierarchy.from_list_hierarchy(hierarchy=[header.keys[0]])
+    return hierarchy, table, header.line_no
+
+
+def iter_toml_tables(
+    toml_path: Union[str, Path], encoding: Optional[str] = None
+) -> Iterator[StreamedTable]:
+    """
+    Scans a TOML file incrementally, yielding one top-level table, or one
+    element of a top-level array-of-tables, at a time. Each is yielded as a
+    tuple of its `Hierarchy`, the `tomlkit.items.Table` instance, and the line
+    number of its header, indexed at 1.
+
+    A top-level table is yielded together with all of its sub-tables that
+    directly follow it, and an array-of-tables element is yielded together
+    with any of its own sub-tables. Since the file is never loaded as a whole,
+    memory is bounded by the largest single table rather than the whole file.
+
+    Fields that appear before the first table header are not yielded. If a
+    top-level table is split into several parts, by other tables appearing
+    in-between, then each part is yielded separately.
+
+    Args:
+        toml_path (str | `Path`): A string or `Path` instance of a file path.
+        encoding (str | None): The encoding of the file, or None to read the
+            file as UTF-8, honouring a UTF-8 byte order mark. Defaults to None.
+
+    Returns:
+        Iterator[`StreamedTable`]: An iterator of `StreamedTable` tuples.
+    """
+    current_header: Optional[TableHeader] = None
+    current_lines: List[str] = []
+
+    with open(
+        toml_path, mode="r", encoding=encoding or "utf-8-sig", newline=""
+    ) as file:
+        for line, header in scan_table_headers(lines=file):
+            if header is not None and _starts_new_entry(
+                current=current_header, header=header
+            ):
+                if current_header is not None:
+                    yield _materialize_entry(header=current_header, lines=current_lines)
+
+                current_header = header
+                current_lines = []
+
+            if current_header is not None:
+                current_lines.append(line)
+
+    if current_header is not None:
+        yield _materialize_entry(header=current_header, lines=current_lines)
@@ -1,6 +1,18 @@
+import mmap
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 if sys.version_info >= (3, 10):
     from typing import TypeAlias
@@ -10,12 +22,22 @@ else:
 from tomlkit import TOMLDocument, items
 from tomlkit.container import OutOfOrderTableProxy
 
-from tomlkit_extras._hierarchy import Hierarchy
+from tomlkit_extras._hierarchy import Hierarchy, HierarchyTrie
 
 TOMLSourceFile: TypeAlias = Union[
-    str, bytes, bytearray, Path, TOMLDocument, Dict[str, Any]
+    str, bytes, bytearray, memoryview, Path, TOMLDocument, Dict[str, Any]
 ]
 
+# Bytes-like types that a string representation of a TOML file can be decoded from
+TOMLBuffer: TypeAlias = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# The strategy used to decode bytes into a string when loading a TOML file
+DecodingStrategy: TypeAlias = Literal["explicit", "bom", "utf-8", "detected"]
+
+# The signature of a file cached by TOMLFileCache, a tuple of the modification
+# time in nanoseconds, size, and inode of the file, and the encoding used
+FileSignature: TypeAlias = Tuple[int, int, int, Optional[str]]
+
 # The return type of get_comments function, returning a tuple where the first item
 # is the line number where the comment is located and the second is the comment
 ContainerComment: TypeAlias = Tuple[int, str]
@@ -40,6 +62,26 @@ Retrieval: TypeAlias = Union[TOMLValidReturn, List[items.Item]]
 # Valid hierarchy types in most functions in package
 TOMLHierarchy: TypeAlias = Union[str, Hierarchy]
 
+# A collection of string hierarchies, either as a set or indexed in a trie
+HierarchyCollection: TypeAlias = Union[Set[str], HierarchyTrie[Any]]
+
+# A single insertion for the bulk_insert function, a tuple of the hierarchy, key,
+# value, position, and whether the position is an attribute position
+BulkInsertion: TypeAlias = Tuple[Optional[TOMLHierarchy], Optional[str], Any, int, bool]
+
+# An insertion from the bulk_insert function resolved to the index within the
+# original body where it will be spliced, along with its key and item
+PlannedSplice: TypeAlias = Tuple[int, str, items.Item]
+
+# A tuple yielded by the iter_toml_tables function, containing the hierarchy of
+# a top-level table or array-of-tables element, the table, and its line number
+StreamedTable: TypeAlias = Tuple[Hierarchy, items.Table, int]
+
+# An item within the body of a lazily parsed document, along with its origin,
+# being the index of the run of tables it was parsed from (-1 for the fields
+# before the first table header) and its index within that run
+LazySlot: TypeAlias = Tuple[Tuple[int, int], Optional[items.Key], items.Item]
+
 # Various types that have to do with tomlkit types that contain a body of fields,
 # tables, and stylings.
 BodyContainerItem: TypeAlias = Tuple[Optional[items.Key], items.Item]
@@ -48,6 +90,7 @@ BodyContainerItemDecomposed: TypeAlias = Tuple[Optional[str], items.Item]
 BodyContainer: TypeAlias = Union[
     TOMLDocument, items.Table, items.InlineTable, items.Array, OutOfOrderTableProxy
 ]
+DictLikeContainer: TypeAlias = Union[TOMLDocument, items.Table, items.InlineTable]
 BodyContainerInOrder: TypeAlias = Union[
     TOMLDocument, items.Table, items.InlineTable, items.Array
 ]
@@ -63,7 +106,9 @@ TOMLSource: TypeAlias = Union[
 ]
 
 # Valid input tomlkit types for the TOMLDocumentDescriptor class
-DescriptorInput: TypeAlias = Union[TOMLDocument, items.Table, items.AoT, items.Array]
+DescriptorInput: TypeAlias = Union[
+    TOMLDocument, items.Table, items.AoT, items.Array, OutOfOrderTableProxy
+]
 
 # Tomlkit types that can have comments in the top-level space
 AnnotatedContainer: TypeAlias = Union[
@@ -80,6 +125,14 @@ ContainerLike: TypeAlias = Union[
     items.InlineTable,
 ]
 
+# A parsing task of the descriptor parser, a generator yielding a new task for
+# each nested structure, which is run before the yielding task is resumed
+ParserTask: TypeAlias = Iterator[Any]
+
+# A function called after a TOML source is modified through the library, with
+# the first levels of all hierarchies that were modified within the source
+MutationListener: TypeAlias = Callable[[Set[str]], None]
+
 # Literals identifying the TOML item type for a given descriptor
 StyleItem: TypeAlias = Literal["whitespace", "comment"]
 TableItem: TypeAlias = Literal["table", "inline-table"]
@@ -100,3 +153,16 @@ Item: TypeAlias = Literal[
 ParentItem: TypeAlias = Literal[
     "document", "table", "inline-table", "super-table", "array", "array-of-tables"
 ]
+
+# Kinds of items that a TOMLDocumentDescriptor can be limited to describing
+ItemKind: TypeAlias = Literal[
+    "field", "table", "array-of-tables", "comment", "whitespace"
+]
+
+# Where a comment found by a TOMLDocumentDescriptor appears, being on its own line,
+# after a field or table on the same line, or between the items of an array
+CommentKind: TypeAlias = Literal["standalone", "trailing", "array-item"]
+
+# How an item differs between two TOMLDocumentDescriptor instances, being only in
+# the new descriptor, only in the old descriptor, or in both with another value
+ChangeKind: TypeAlias = Literal["added", "removed", "changed"]
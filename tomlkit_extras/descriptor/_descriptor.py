@@ -1,15 +1,37 @@
 from __future__ import annotations
 
-from typing import List, Optional, cast
+import functools
+import gc
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from tomlkit import TOMLDocument, items
 from tomlkit.container import OutOfOrderTableProxy
 
-from tomlkit_extras._hierarchy import Hierarchy
+from tomlkit_extras._hierarchy import Hierarchy, standardize_hierarchy
+from tomlkit_extras._mutations import add_mutation_listener
 from tomlkit_extras._typing import (
     BodyContainerInOrder,
+    BodyContainerItem,
     BodyContainerItems,
     DescriptorInput,
+    ItemKind,
+    ParserTask,
     StyleItem,
     Stylings,
     Table,
@@ -18,22 +40,44 @@ from tomlkit_extras._typing import (
 )
 from tomlkit_extras._utils import decompose_body_item, get_container_body
 from tomlkit_extras.descriptor._descriptors import (
+    AnyDescriptor,
     AoTDescriptor,
     FieldDescriptor,
     StyleDescriptor,
     TableDescriptor,
 )
+from tomlkit_extras.descriptor._filters import DescriptorFilter, count_skipped_lines
 from tomlkit_extras.descriptor._helpers import LineCounter, get_item_type
+from tomlkit_extras.descriptor._indexes import (
+    CommentEntry,
+    CommentIndex,
+    LevelIndex,
+    LineIndex,
+    LineLookup,
+    PathIndex,
+    ValueIndex,
+)
 from tomlkit_extras.descriptor._retriever import DescriptorRetriever
 from tomlkit_extras.descriptor._store import DescriptorStore
 from tomlkit_extras.descriptor._types import ItemInfo, ItemPosition, TOMLStatistics
-from tomlkit_extras.toml._out_of_order import fix_out_of_order_table
+from tomlkit_extras.toml._out_of_order import OutOfOrderTableView
+
+# Types of items within an array that are described, all other items within an
+# array are only counted towards the positions of the items that follow them
+_ARRAY_CHILD_TYPES = (items.Array, items.InlineTable, items.Comment, items.Whitespace)
+
+# The number of partitions a document is split into for each worker process,
+# so that the work stays balanced when partitions differ in size
+_PARTITIONS_PER_WORKER = 4
+
+# The document being described, set once within each worker process
+_WORKER_DOCUMENT: Optional[TOMLDocument] = None
 
 
 class _TOMLParser:
     """
-    A private parser class that houses all logic to accurately recursively parse
-    through various `tomlkit` types. These types include `tomlkit.items.Array`,
+    A private parser class that houses all logic to accurately parse through
+    various `tomlkit` types. These types include `tomlkit.items.Array`,
     `tomlkit.items.InlineTable`, `tomlkit.items.Comment`, `tomlkit.items.Whitespace`,
     `tomlkit.items.AoT`, and `tomlkit.items.Table` among others.
     """
@@ -44,21 +88,43 @@ class _TOMLParser:
         store: DescriptorStore,
         toml_statistics: TOMLStatistics,
         top_level_only: bool,
+        descriptor_filter: Optional[DescriptorFilter] = None,
     ) -> None:
         self._line_counter = line_counter
         self._store = store
         self._toml_statistics = toml_statistics
 
         self.top_level_only = top_level_only
+        self.descriptor_filter = descriptor_filter
+
+    def run(self, task: ParserTask) -> None:
+        """
+        Runs a parsing task to completion using an explicit stack of tasks
+        rather than recursion, so that structures of any depth can be parsed.
 
-    def _generate_descriptor_from_aot(self, array: items.AoT, info: ItemInfo) -> None:
+        Each task is a generator that yields a new task for each nested
+        structure it encounters. The new task is pushed onto the stack and run
+        to completion before the task that yielded it is resumed, which
+        visits every item in the same order a recursive traversal would.
+        """
+        stack: List[ParserTask] = [task]
+        while stack:
+            task = next(stack[-1], None)
+            if task is None:
+                stack.pop()
+            else:
+                stack.append(task)
+
+    def _generate_descriptor_from_aot(
+        self, array: items.AoT, info: ItemInfo
+    ) -> ParserTask:
         """
         Private method that parses all objects within a `tomlkit.items.AoT`
         instance.
 
-        Initial pre-processing of the array-of-tables occurs, and then the main
-        recursive method `_generate_descriptor` is called to continue parsing any
-        nested structures.
+        Initial pre-processing of the array-of-tables occurs, and then a task
+        of the main parsing method `_generate_descriptor` is yielded for each
+        table to continue parsing any nested structures.
         """
         array_name = cast(str, array.name)
         hierarchy = Hierarchy.create_hierarchy(
@@ -75,7 +141,7 @@ class _TOMLParser:
         )
 
         # Iterate through each table in the body of the array and run the
-        # main recursive parsing method on the table
+        # main parsing method on the table
         for index, table in enumerate(array.body):
             self._toml_statistics.add_table(table=table)
             table_item_info = ItemInfo.from_parent_type(
@@ -84,37 +150,35 @@ class _TOMLParser:
                 toml_item=table,
                 parent_type="array-of-tables",
                 from_aot=True,
+                position=ItemPosition(attribute=index + 1, container=index + 1),
             )
 
-            # Run the main recursive parsing method on the table
-            table_item_info.position = ItemPosition(index + 1, index + 1)
-            self._generate_descriptor(container=table, info=table_item_info)
+            # Run the main parsing method on the table
+            yield self._generate_descriptor(container=table, info=table_item_info)
 
-    def _parse_array(self, toml_item: items.Array, info: ItemInfo) -> None:
+    def _parse_array(self, toml_item: items.Array, info: ItemInfo) -> ParserTask:
         """Private method to parse through `items.Array` instances."""
         self._store.update_field_descriptor(item=toml_item, info=info)
-        self._generate_descriptor(container=toml_item, info=info)
+        yield self._generate_descriptor(container=toml_item, info=info)
         self._store.update_array_comment(array=toml_item, info=info)
 
         # Add array to TOML summary statistics
         self._toml_statistics.add_array(item=toml_item)
 
-        # Add a single line to line counter and update both attribute
-        # and container positions
+        # Add a single line to line counter
         self._line_counter.add_line()
-        info.position.update_positions()
 
-    def _parse_inline_table(self, toml_item: items.InlineTable, info: ItemInfo) -> None:
+    def _parse_inline_table(
+        self, toml_item: items.InlineTable, info: ItemInfo
+    ) -> ParserTask:
         """Private method to parse through `items.InlineTable` instances."""
-        self._generate_descriptor(container=toml_item, info=info)
+        yield self._generate_descriptor(container=toml_item, info=info)
 
         # Add inline-table to TOML summary statistics
         self._toml_statistics.add_inline_table(table=toml_item)
 
-        # Add a single line to line counter and update both attribute
-        # and container positions
+        # Add a single line to line counter
         self._line_counter.add_line()
-        info.position.update_positions()
 
     def _parse_stylings(self, toml_item: Stylings, info: ItemInfo) -> None:
         """Private method to parse through `items.Whitespace`/`items.Comment` instances."""
@@ -125,29 +189,35 @@ class _TOMLParser:
         self._toml_statistics.add_comment(item=toml_item)
 
         # Add the number of new lines appearing in the styling to
-        # the line counter and update only the container position
+        # the line counter
         self._line_counter.add_lines(lines=number_of_newlines)
-        info.position.update_body_position()
 
-    def _parse_array_of_tables(self, toml_item: items.AoT, info: ItemInfo) -> None:
+    def _parse_array_of_tables(
+        self, toml_item: items.AoT, info: ItemInfo
+    ) -> ParserTask:
         """Private method to parse through `items.AoT` instances."""
-        self._generate_descriptor_from_aot(array=toml_item, info=info)
+        yield from self._generate_descriptor_from_aot(array=toml_item, info=info)
 
         # Add array to TOML summary statistics
         self._toml_statistics.add_aot()
 
-        # Update both attribute and container positions
-        info.position.update_positions()
-
-    def _parse_table(self, toml_item: items.Table, info: ItemInfo) -> None:
+    def _parse_table(self, toml_item: items.Table, info: ItemInfo) -> ParserTask:
         """Private method to parse through `items.Table` instances."""
-        self._generate_descriptor(container=toml_item, info=info)
+        yield self._generate_descriptor(container=toml_item, info=info)
 
         # Add table to TOML summary statistics
         self._toml_statistics.add_table(table=toml_item)
 
-        # Update boh attribute and container positions
-        info.position.update_positions()
+    def _parse_out_of_order_table(
+        self, toml_item: OutOfOrderTableView, info: ItemInfo
+    ) -> ParserTask:
+        """
+        Private method to parse through `OutOfOrderTableView` instances. Each
+        component table is parsed in the order it appears in the document, so
+        that nothing is copied, and line numbers follow the components.
+        """
+        for table in toml_item.components:
+            yield self._parse_table(toml_item=table, info=info)
 
     def _parse_others(
         self, toml_item: items.Item, info: ItemInfo, container: BodyContainerInOrder
@@ -159,19 +229,25 @@ class _TOMLParser:
                 self._line_counter.add_line()
 
             self._toml_statistics.add_field(item=toml_item)
-        info.position.update_positions()
 
     def _generate_descriptor(
-        self, container: BodyContainerInOrder, info: ItemInfo
-    ) -> None:
+        self,
+        container: BodyContainerInOrder,
+        info: ItemInfo,
+        body_items: Optional[BodyContainerItems] = None,
+    ) -> ParserTask:
         """
-        Private recursive method that traverses an entire `BodyContainerInOrder`
-        instance, being a `tomlkit` type `tomlkit.TOMLDocument`, `tomlkit.items.Table`,
+        Private method that traverses an entire `BodyContainerInOrder` instance,
+        being a `tomlkit` type `tomlkit.TOMLDocument`, `tomlkit.items.Table`,
         `tomlkit.items.InlineTable`, or `tomlkit.items.Array`.
 
         During traversal, each field, table, array, and styling (comment and
         whitespace) is parsed and a custom/curated set of data points are collected
-        for each item parsed.
+        for each item parsed. Nested structures are not parsed directly, instead
+        a task is yielded for each, to be run by the `run` method.
+
+        If `body_items` is passed, then only those items from the body of the
+        container are parsed, rather than the whole body.
         """
         position = ItemPosition.default_position()
         new_hierarchy = Hierarchy.create_hierarchy(
@@ -193,52 +269,95 @@ class _TOMLParser:
         # Since an inline table is contained only on a single line, and thus
         # on the same line as the table header, only update the line counter
         # if parsing a tomlkit.TOMLDocument or tomlkit.items.Table instance
-        table_body_items: BodyContainerItems = get_container_body(toml_source=container)
+        table_body_items: BodyContainerItems = (
+            body_items
+            if body_items is not None
+            else get_container_body(toml_source=container)
+        )
+        is_array = isinstance(container, items.Array)
         if isinstance(container, TOMLDocument) or is_non_super_table:
             self._line_counter.add_line()
 
         # Iterate through each item appearing in the body of the tomlkit object
         for toml_body_item in table_body_items:
             item_key, toml_item = decompose_body_item(body_item=toml_body_item)
+
+            # Nothing is collected for an item within an array that is neither a
+            # styling nor a nested structure, so only its position is updated
+            if is_array and not isinstance(toml_item, _ARRAY_CHILD_TYPES):
+                position = position.next_positions()
+                continue
+
             toml_item_info = ItemInfo.from_body_item(
                 hierarchy=new_hierarchy,
                 container_info=info,
                 body_item=(item_key, toml_item),
+                position=position,
             )
 
-            # Set the position property for the active item
-            toml_item_info.position = position
+            # An item that is filtered out is skipped along with everything
+            # nested within it, only counting the lines and positions it takes
+            # up. A styling is filtered by the hierarchy of its container
+            is_styling = isinstance(toml_item, (items.Comment, items.Whitespace))
+            if self.descriptor_filter is not None and not self.descriptor_filter.keeps(
+                hierarchy=(
+                    new_hierarchy
+                    if is_styling
+                    else Hierarchy.create_hierarchy(
+                        hierarchy=new_hierarchy, attribute=item_key or str()
+                    )
+                ),
+                item_type=toml_item_info.item_type,
+            ):
+                self._line_counter.add_lines(
+                    lines=count_skipped_lines(toml_item=toml_item, container=container)
+                )
+                position = (
+                    position.next_body_position()
+                    if is_styling
+                    else position.next_positions()
+                )
+                continue
 
-            # If the item is an out-of-order table, then fix and update the
-            # item type attribute
+            # If the item is an out-of-order table, then a task is yielded to
+            # parse each of its component tables, without copying them
             if isinstance(toml_item, OutOfOrderTableProxy):
-                toml_item = fix_out_of_order_table(table=toml_item)
-                toml_item_info.item_type = "table"
+                yield self._parse_out_of_order_table(
+                    toml_item=OutOfOrderTableView.from_proxy(table=toml_item),
+                    info=toml_item_info,
+                )
 
-            # If an array is encountered, the function is run recursively since
-            # an array can contain stylings and nested tomlkit.items.Item objects
-            if isinstance(toml_item, items.Array):
-                self._parse_array(toml_item=toml_item, info=toml_item_info)
+            # If an array is encountered, a task is yielded since an array can
+            # contain stylings and nested tomlkit.items.Item objects
+            elif isinstance(toml_item, items.Array):
+                yield self._parse_array(toml_item=toml_item, info=toml_item_info)
 
-            # If an inline table is parsed, the function is run recursively since
-            # an inline table can contain nested tomlkit.items.Item objects
+            # If an inline table is parsed, a task is yielded since an inline
+            # table can contain nested tomlkit.items.Item objects
             elif isinstance(toml_item, items.InlineTable):
-                self._parse_inline_table(toml_item=toml_item, info=toml_item_info)
+                yield self._parse_inline_table(toml_item=toml_item, info=toml_item_info)
 
             # If one of the two styling objects are encountered, then the
-            # styling is added to the store. No recursive call as stylings
-            # cannot contain nested tomlkit objects
-            elif isinstance(toml_item, (items.Comment, items.Whitespace)):
-                self._parse_stylings(toml_item=toml_item, info=toml_item_info)
+            # styling is added to the store. No task is yielded as stylings
+            # cannot contain nested tomlkit objects. Only the container
+            # position is updated, as a styling is not an attribute
+            elif is_styling:
+                self._parse_stylings(
+                    toml_item=cast(Stylings, toml_item), info=toml_item_info
+                )
+                position = position.next_body_position()
+                continue
 
-            # For an array-of-tables, recursive call is made as arrays can
-            # contain any tomlkit object nested within except a tomlkit.TOMLDocument
+            # For an array-of-tables, a task is yielded as arrays can contain
+            # any tomlkit object nested within except a tomlkit.TOMLDocument
             elif isinstance(toml_item, items.AoT) and not self.top_level_only:
-                self._parse_array_of_tables(toml_item=toml_item, info=toml_item_info)
+                yield self._parse_array_of_tables(
+                    toml_item=toml_item, info=toml_item_info
+                )
 
-            # For a non-inline table, make a recursive call
+            # For a non-inline table, a task is yielded
             elif isinstance(toml_item, items.Table) and not self.top_level_only:
-                self._parse_table(toml_item=toml_item, info=toml_item_info)
+                yield self._parse_table(toml_item=toml_item, info=toml_item_info)
 
             # Otherwise the object is a generic tomlkit.items.Item
             elif not isinstance(toml_item, (items.Table, items.AoT)):
@@ -246,6 +365,208 @@ class _TOMLParser:
                     toml_item=toml_item, info=toml_item_info, container=container
                 )
 
+            # Skipped when only the top-level space is parsed
+            else:
+                continue
+
+            # Update both attribute and container positions
+            position = position.next_positions()
+
+
+@dataclass
+class _DescribedPartition:
+    """
+    A private dataclass holding all that is collected from parsing a partition
+    of a document on its own, being the store, the statistics, and the number
+    of lines counted.
+    """
+
+    store: DescriptorStore
+    toml_statistics: TOMLStatistics
+    number_of_lines: int
+
+
+@dataclass
+class _Segment:
+    """
+    A private dataclass representing a single item in the top-level space of a
+    document described by a live `TOMLDocumentDescriptor`, along with the
+    partition described from the item alone.
+
+    The `level` is the first level of the hierarchies of the item, or None for
+    a styling. The `positions` are the number of attributes and items the
+    segment takes up. The line and position offsets are those currently
+    applied to the line numbers and positions within the partition.
+    """
+
+    toml_item: items.Item
+    level: Optional[str]
+    partition: _DescribedPartition
+    positions: ItemPosition
+    line_offset: int
+    position_offset: ItemPosition
+
+
+def _partition_document(
+    toml_document: TOMLDocument, workers: int
+) -> List[Tuple[int, int]]:
+    """
+    A private function which splits the body of a document into contiguous
+    partitions, each a tuple of the start and stop indices within the body.
+    Partitions only ever start at a top-level table or array-of-tables, and
+    any items before the first table are part of the first partition.
+    """
+    body = toml_document.body
+    table_starts = [0] + [
+        index
+        for index, (_, toml_item) in enumerate(body)
+        if index and isinstance(toml_item, (items.Table, items.AoT))
+    ]
+
+    number_of_partitions = min(len(table_starts), workers * _PARTITIONS_PER_WORKER)
+    step = len(table_starts) / number_of_partitions
+    partition_starts = [
+        table_starts[int(index * step)] for index in range(number_of_partitions)
+    ]
+    return list(zip(partition_starts, [*partition_starts[1:], len(body)]))
+
+
+def _unwrap_field_values(store: DescriptorStore) -> None:
+    """
+    A private function which unwraps the value of every `FieldDescriptor` in
+    a store.
+    """
+    table_descriptors: List[TableDescriptor] = list(store.tables._tables.values())
+    for array_of_tables in store.array_of_tables._array_of_tables.values():
+        for array in array_of_tables.aots:
+            for tables in array.tables.values():
+                table_descriptors.extend(tables)
+
+    for field_descriptor in store.document._document_fields.values():
+        _ = field_descriptor.value
+
+    for table_descriptor in table_descriptors:
+        for field_descriptor in table_descriptor.fields.values():
+            _ = field_descriptor.value
+
+
+def _initialize_worker(toml_document: TOMLDocument) -> None:
+    """
+    A private function which stores the document being described, run once
+    when each worker process starts.
+    """
+    global _WORKER_DOCUMENT
+    _WORKER_DOCUMENT = toml_document
+
+
+def _describe_body_items(
+    toml_document: TOMLDocument,
+    body_items: BodyContainerItems,
+    unwrap_values: bool,
+    descriptor_filter: Optional[DescriptorFilter],
+) -> _DescribedPartition:
+    """
+    A private function which parses items from the body of a document as if
+    they were the only content of the document, with line numbers and positions
+    counted from the start of the document.
+    """
+    line_counter = LineCounter()
+    store = DescriptorStore(line_counter=line_counter, unwrap_values=unwrap_values)
+    toml_statistics = TOMLStatistics()
+    toml_parser = _TOMLParser(
+        line_counter=line_counter,
+        store=store,
+        toml_statistics=toml_statistics,
+        top_level_only=False,
+        descriptor_filter=descriptor_filter,
+    )
+
+    container_info = ItemInfo.from_parent_type(
+        key=str(), hierarchy=str(), toml_item=toml_document
+    )
+    toml_parser.run(
+        task=toml_parser._generate_descriptor(
+            container=toml_document, info=container_info, body_items=body_items
+        )
+    )
+    return _DescribedPartition(
+        store=store,
+        toml_statistics=toml_statistics,
+        number_of_lines=line_counter.line_no,
+    )
+
+
+def _describe_partition(
+    partition: Tuple[int, int],
+    unwrap_values: bool,
+    descriptor_filter: Optional[DescriptorFilter],
+) -> bytes:
+    """
+    A private function, run in a worker process, which parses a partition of
+    the document and returns the pickled `_DescribedPartition` instance.
+    """
+    toml_document = cast(TOMLDocument, _WORKER_DOCUMENT)
+    start, stop = partition
+
+    described_partition = _describe_body_items(
+        toml_document=toml_document,
+        body_items=toml_document.body[start:stop],
+        unwrap_values=unwrap_values,
+        descriptor_filter=descriptor_filter,
+    )
+
+    # Plain values are far cheaper to send back to the main process than the
+    # tomlkit items, so they are unwrapped before the partition is returned
+    if unwrap_values:
+        _unwrap_field_values(store=described_partition.store)
+
+    return pickle.dumps(described_partition, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _describe_segment(
+    toml_document: TOMLDocument,
+    body_item: BodyContainerItem,
+    unwrap_values: bool,
+    descriptor_filter: Optional[DescriptorFilter],
+) -> _Segment:
+    """
+    A private function which parses a single item in the top-level space of a
+    document, and returns it as a `_Segment` instance with no offsets applied.
+    """
+    item_key, toml_item = decompose_body_item(body_item=body_item)
+    is_styling = isinstance(toml_item, (items.Comment, items.Whitespace))
+    return _Segment(
+        toml_item=toml_item,
+        level=item_key.split(".")[0] if item_key is not None else None,
+        partition=_describe_body_items(
+            toml_document=toml_document,
+            body_items=[body_item],
+            unwrap_values=unwrap_values,
+            descriptor_filter=descriptor_filter,
+        ),
+        positions=ItemPosition(attribute=int(not is_styling), container=1),
+        line_offset=0,
+        position_offset=ItemPosition(attribute=0, container=0),
+    )
+
+
+def _load_partition(pickled_partition: bytes) -> _DescribedPartition:
+    """
+    A private function which unpickles a `_DescribedPartition` instance sent
+    back by a worker process.
+
+    The garbage collector is paused while unpickling, as the many objects
+    created at once would otherwise trigger repeated collections, which take
+    several times longer than the unpickling itself.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(pickled_partition)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
 
 class TOMLDocumentDescriptor:
     """
@@ -253,46 +574,139 @@ class TOMLDocumentDescriptor:
     information for all fields, tables and stylings appearing in a
     `DescriptorInput` instance. A `DescriptorInput` instance is a `tomlkit`
     type of either `tomlkit.TOMLDocument`, `tomlkit.items.Table`,
-    `tomlkit.items.AoT`, or `tomlkit.items.Array`.
+    `tomlkit.items.AoT`, `tomlkit.items.Array`, or
+    `tomlkit.container.OutOfOrderTableProxy`.
 
     Parsing occurs within the constructor. Methods are provided to retrieve
     basic summary statistics about the TOML file, and to extract granular
     information about fields, tables, or stylings appearing at a specific
     hierarchy.
 
-    All out-of-order tables appearing in the TOML file will automatically be
-    fixed when parsing. Thus, the line numbers may be innacurate for these
-    TOML files.
+    Out-of-order tables are parsed without being fixed or copied. Each of
+    their component tables is parsed in the order it appears in the TOML file,
+    so line numbers follow the original position of each component.
+
+    The items described can be limited by hierarchy, kind, and depth. An item
+    that is filtered out is skipped along with everything nested within it,
+    only counting the lines and positions it takes up, so that all items that
+    are described have the same line numbers and positions as they would if
+    nothing was filtered out. A table or array-of-tables that is not included,
+    but may contain included items, is described without its own fields or
+    stylings.
 
     Args:
         toml_source (`DescriptorInput`): A `tomlkit` type of either
             `tomlkit.TOMLDocument`, `tomlkit.items.Table`, `tomlkit.items.AoT`,
-            or `tomlkit.items.Array`
+            `tomlkit.items.Array`, or `tomlkit.container.OutOfOrderTableProxy`
         top_level_only (bool): A boolean value that indicates whether only the
             top-level space of the `DescriptorInput` structure should be parsed.
             Defaults to False.
+        unwrap_values (bool): A boolean value that indicates whether the `value`
+            of each `FieldDescriptor` is unwrapped from its `tomlkit` item, which
+            only happens on first access. If False, the `tomlkit` item itself
+            is returned and never unwrapped. Defaults to True.
+        workers (int | None): The number of worker processes used to parse a
+            `tomlkit.TOMLDocument` instance. If greater than one, the document
+            is split at its top-level tables and arrays-of-tables, and each
+            part is parsed in a separate process, producing the same result as
+            parsing in a single process. Since the parts are sent back to the
+            main process, values are unwrapped in the worker processes, and if
+            `unwrap_values` is False, each `tomlkit` item returned is a copy.
+            Ignored for other types, or if `top_level_only` is True. Defaults
+            to None, parsing in a single process.
+        live (bool): A boolean value that indicates whether the descriptor is
+            bound to a `tomlkit.TOMLDocument` instance and kept up to date with
+            it. After each modification of the document made through
+            `container_insert`, `attribute_insert`, `general_insert`,
+            `bulk_insert`, `update_toml_source`, or `delete_from_toml_source`,
+            with the document as the `toml_source`, only the top-level items
+            that were modified are parsed again, and the line numbers and
+            positions of all items after them are shifted. Modifications made
+            in any other way are not tracked. Cannot be combined with
+            `top_level_only` or `workers`. Defaults to False.
+        include (Iterable[str] | None): Hierarchy patterns of the items to
+            describe, each either a hierarchy, or a glob pattern as supported by
+            the `fnmatch` module. An item is included if its hierarchy, or the
+            hierarchy of any structure it is nested in, matches a pattern. If
+            None, then all items are described. Defaults to None.
+        exclude (Iterable[str] | None): Hierarchy patterns of the items not to
+            describe, matched in the same way as `include`, and taking precedence
+            over it. Defaults to None.
+        item_kinds (Iterable[`ItemKind`] | None): The kinds of items to describe,
+            any of "field", "table", "array-of-tables", "comment", or
+            "whitespace". Arrays are fields, and inline tables are tables. If
+            None, then all kinds are described. Defaults to None.
+        max_depth (int | None): The maximum number of levels in the hierarchy of
+            any item described, where a styling is one level deeper than the
+            structure it appears in. If None, then items at any depth are
+            described. Defaults to None.
     """
 
     def __init__(
-        self, toml_source: DescriptorInput, top_level_only: bool = False
+        self,
+        toml_source: DescriptorInput,
+        top_level_only: bool = False,
+        unwrap_values: bool = True,
+        workers: Optional[int] = None,
+        live: bool = False,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        item_kinds: Optional[Iterable[ItemKind]] = None,
+        max_depth: Optional[int] = None,
     ) -> None:
         if not isinstance(
-            toml_source, (TOMLDocument, items.Table, items.AoT, items.Array)
+            toml_source,
+            (TOMLDocument, items.Table, items.AoT, items.Array, OutOfOrderTableProxy),
         ):
             raise TypeError(
                 "Expected an instance of DescriptorInput, but got "
                 f"{type(toml_source).__name__}"
             )
 
+        if workers is not None and workers < 1:
+            raise ValueError("The number of workers must be positive")
+
+        if live and not isinstance(toml_source, TOMLDocument):
+            raise TypeError(
+                "A live descriptor can only be bound to a tomlkit.TOMLDocument, "
+                f"but got {type(toml_source).__name__}"
+            )
+
+        if live and (top_level_only or workers is not None):
+            raise ValueError(
+                "A live descriptor cannot be combined with top_level_only or workers"
+            )
+
         self.top_level_only = top_level_only
+        self.unwrap_values = unwrap_values
+        self.live = live
+
+        # Only filter items if any of the filter options are passed
+        self._descriptor_filter: Optional[DescriptorFilter] = None
+        if any(
+            option is not None for option in (include, exclude, item_kinds, max_depth)
+        ):
+            self._descriptor_filter = DescriptorFilter(
+                include=include,
+                exclude=exclude,
+                item_kinds=item_kinds,
+                max_depth=max_depth,
+            )
         self.top_level_type: TopLevelItem = cast(
             TopLevelItem, get_item_type(toml_item=toml_source)
         )
-        self.top_level_hierarchy: Optional[str] = (
-            toml_source.name
-            if isinstance(toml_source, (items.AoT, items.Table))
-            else None
-        )
+        # An out-of-order table is parsed through a view of its components
+        out_of_order_table: Optional[OutOfOrderTableView] = None
+        if isinstance(toml_source, OutOfOrderTableProxy):
+            out_of_order_table = OutOfOrderTableView.from_proxy(table=toml_source)
+
+        self.top_level_hierarchy: Optional[str]
+        if isinstance(toml_source, (items.AoT, items.Table)):
+            self.top_level_hierarchy = toml_source.name
+        elif out_of_order_table is not None:
+            self.top_level_hierarchy = out_of_order_table.parent.name
+        else:
+            self.top_level_hierarchy = None
 
         # Tracker for number of lines in TOML
         self._line_counter = LineCounter()
@@ -301,7 +715,9 @@ class TOMLDocumentDescriptor:
         self._toml_statistics = TOMLStatistics()
 
         # Descriptor store
-        self._store = DescriptorStore(line_counter=self._line_counter)
+        self._store = DescriptorStore(
+            line_counter=self._line_counter, unwrap_values=self.unwrap_values
+        )
 
         # TOML parser
         self._toml_parser = _TOMLParser(
@@ -309,6 +725,7 @@ class TOMLDocumentDescriptor:
             store=self._store,
             toml_statistics=self._toml_statistics,
             top_level_only=self.top_level_only,
+            descriptor_filter=self._descriptor_filter,
         )
 
         # Descriptor retriever
@@ -318,8 +735,16 @@ class TOMLDocumentDescriptor:
             top_level_hierarchy=self.top_level_hierarchy,
         )
 
-        if isinstance(toml_source, (items.Table, items.AoT)):
-            update_key = toml_source.name
+        # Indexes of all hierarchies and line numbers, each only built once the
+        # first query that uses it is made
+        self._path_index: Optional[PathIndex] = None
+        self._line_index: Optional[LineIndex] = None
+        self._value_index: Optional[ValueIndex] = None
+        self._comment_index: Optional[CommentIndex] = None
+        self._level_index: Optional[LevelIndex] = None
+
+        if isinstance(toml_source, (items.Table, items.AoT, OutOfOrderTableProxy)):
+            update_key = self.top_level_hierarchy
             assert (
                 update_key is not None
             ), "table or array-of-tables must have a string name"
@@ -330,19 +755,244 @@ class TOMLDocumentDescriptor:
             key=update_key, hierarchy=str(), toml_item=toml_source
         )
 
+        # A document is only split into partitions if parsed by multiple workers
+        partitions: List[Tuple[int, int]] = []
+        if (
+            workers is not None
+            and workers > 1
+            and isinstance(toml_source, TOMLDocument)
+            and not self.top_level_only
+        ):
+            partitions = _partition_document(toml_document=toml_source, workers=workers)
+
+        # The segments of each item in the top-level space of a live descriptor
+        self._segments: List[_Segment] = []
+
         # Initialize the main functionality depending on whether the source
-        # is an array-of-tables or not
-        if isinstance(toml_source, items.AoT):
-            self._toml_parser._generate_descriptor_from_aot(
-                array=toml_source, info=container_info
+        # is an array-of-tables, is split into multiple partitions, or is live
+        if self.live:
+            self._live_document = cast(TOMLDocument, toml_source)
+            self._update_segments(levels=set())
+            add_mutation_listener(
+                toml_source=toml_source, listener=self._update_segments
+            )
+        elif out_of_order_table is not None:
+            # As with a table, the components themselves are not counted
+            for table in out_of_order_table.components:
+                self._toml_parser.run(
+                    task=self._toml_parser._generate_descriptor(
+                        container=table, info=container_info
+                    )
+                )
+        elif isinstance(toml_source, items.AoT):
+            self._toml_parser.run(
+                task=self._toml_parser._generate_descriptor_from_aot(
+                    array=toml_source, info=container_info
+                )
+            )
+        elif len(partitions) > 1:
+            self._describe_partitions(
+                toml_document=cast(TOMLDocument, toml_source),
+                partitions=partitions,
+                workers=cast(int, workers),
             )
         else:
-            self._toml_parser._generate_descriptor(
-                container=toml_source, info=container_info
+            self._toml_parser.run(
+                task=self._toml_parser._generate_descriptor(
+                    container=cast(BodyContainerInOrder, toml_source),
+                    info=container_info,
+                )
             )
 
         self._line_counter.reset_line_no()
 
+    def _describe_partitions(
+        self,
+        toml_document: TOMLDocument,
+        partitions: List[Tuple[int, int]],
+        workers: int,
+    ) -> None:
+        """
+        A private method which parses each partition of a document in a pool of
+        worker processes, and merges the results into the store, in the order
+        the partitions appear in the document.
+
+        Each partition is parsed as if it was the only content of the document,
+        so the line numbers, and the positions of items in the top-level space,
+        are offset by the lines and items of all partitions before it.
+        """
+        body = toml_document.body
+        line_offset = 0
+        position_offset = ItemPosition(attribute=0, container=0)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(toml_document,),
+        ) as executor:
+            pickled_partitions = executor.map(
+                functools.partial(
+                    _describe_partition,
+                    unwrap_values=self.unwrap_values,
+                    descriptor_filter=self._descriptor_filter,
+                ),
+                partitions,
+            )
+
+            for (start, stop), pickled_partition in zip(partitions, pickled_partitions):
+                described_partition = _load_partition(
+                    pickled_partition=pickled_partition
+                )
+                described_partition.store.shift(
+                    line_offset=line_offset, position_offset=position_offset
+                )
+                self._store.merge(store=described_partition.store)
+                self._toml_statistics.merge(
+                    toml_statistics=described_partition.toml_statistics
+                )
+
+                # The line of the document itself is counted in each partition
+                line_offset += described_partition.number_of_lines - 1
+
+                # Stylings only count towards the container position
+                number_of_stylings = sum(
+                    isinstance(toml_item, (items.Comment, items.Whitespace))
+                    for _, toml_item in body[start:stop]
+                )
+                position_offset = position_offset.offset_by(
+                    ItemPosition(
+                        attribute=stop - start - number_of_stylings,
+                        container=stop - start,
+                    )
+                )
+
+    def _update_segments(self, levels: Set[str]) -> None:
+        """
+        A private method which brings the store and statistics of a live
+        descriptor up to date with the top-level space of its document, called
+        after each modification of the document at the given first `levels`.
+
+        Each item in the top-level space is parsed on its own, as a segment.
+        Only the segments of items that were added, or modified at one of the
+        `levels`, are parsed again, along with the segments next to those and
+        next to removed items, as the whitespace around an item can change with
+        it. The line numbers and positions of all other segments are shifted
+        by the lines and items before them, and the tables and array-of-tables
+        are only replaced for the first levels of the segments parsed again.
+        """
+        toml_document = self._live_document
+        body = toml_document.body
+        old_segments = self._segments
+        segments_by_item: Dict[int, _Segment] = {
+            id(segment.toml_item): segment for segment in old_segments
+        }
+
+        # Items next to a removed item are parsed again
+        body_item_ids = {id(toml_item) for _, toml_item in body}
+        stale_item_ids: Set[int] = set()
+        for index, segment in enumerate(old_segments):
+            if id(segment.toml_item) not in body_item_ids:
+                stale_item_ids.update(
+                    id(neighbour.toml_item)
+                    for neighbour in old_segments[max(index - 1, 0) : index + 2]
+                )
+
+        reused_segments: List[Optional[_Segment]] = []
+        for _, toml_item in body:
+            reused_segment = segments_by_item.get(id(toml_item))
+            if reused_segment is not None and reused_segment.level in levels:
+                reused_segment = None
+            reused_segments.append(reused_segment)
+
+        # Items next to an added or modified item are parsed again
+        changed_indices = [
+            index
+            for index, reused_segment in enumerate(reused_segments)
+            if reused_segment is None
+        ]
+        for index in changed_indices:
+            if index > 0:
+                reused_segments[index - 1] = None
+            if index + 1 < len(reused_segments):
+                reused_segments[index + 1] = None
+
+        for index, (_, toml_item) in enumerate(body):
+            if id(toml_item) in stale_item_ids:
+                reused_segments[index] = None
+
+        reused_ids = {id(segment) for segment in reused_segments if segment is not None}
+        changed_levels: Set[Optional[str]] = {
+            segment.level for segment in old_segments if id(segment) not in reused_ids
+        }
+
+        segments: List[_Segment] = []
+        for body_item, reused_segment in zip(body, reused_segments):
+            if reused_segment is None:
+                reused_segment = _describe_segment(
+                    toml_document=toml_document,
+                    body_item=body_item,
+                    unwrap_values=self.unwrap_values,
+                    descriptor_filter=self._descriptor_filter,
+                )
+                changed_levels.add(reused_segment.level)
+            segments.append(reused_segment)
+
+        # Shift each segment to the lines and items before it, the line of the
+        # document itself is counted in each segment
+        line_offset = 0
+        position_offset = ItemPosition(attribute=0, container=0)
+        stores_by_level: Dict[str, List[DescriptorStore]] = dict()
+        toml_statistics = TOMLStatistics()
+        for segment in segments:
+            store = segment.partition.store
+            if (
+                segment.line_offset != line_offset
+                or segment.position_offset != position_offset
+            ):
+                store.shift(
+                    line_offset=line_offset - segment.line_offset,
+                    position_offset=ItemPosition(
+                        attribute=(
+                            position_offset.attribute
+                            - segment.position_offset.attribute
+                        ),
+                        container=(
+                            position_offset.container
+                            - segment.position_offset.container
+                        ),
+                    ),
+                )
+                segment.line_offset = line_offset
+                segment.position_offset = position_offset
+
+            line_offset += segment.partition.number_of_lines - 1
+            position_offset = position_offset.offset_by(segment.positions)
+
+            if segment.level is not None:
+                stores_by_level.setdefault(segment.level, []).append(store)
+            toml_statistics.merge(toml_statistics=segment.partition.toml_statistics)
+
+        for level in changed_levels:
+            if level is not None:
+                self._store.replace_level(
+                    level=level, stores=stores_by_level.get(level, [])
+                )
+        self._store.reorder_levels(levels=stores_by_level)
+
+        # The document store only holds items of the top-level space, so it is
+        # rebuilt from all segments to keep them in the order of the document
+        self._store.document.clear()
+        for segment in segments:
+            self._store.document.merge(store=segment.partition.store.document)
+
+        self._segments = segments
+        self._toml_statistics = toml_statistics
+        self._path_index = None
+        self._line_index = None
+        self._value_index = None
+        self._comment_index = None
+        self._level_index = None
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}"
@@ -503,3 +1153,310 @@ class TOMLDocumentDescriptor:
             List[`StyleDescriptor`]: A list of `StyleDescriptor` instances.
         """
         return self._retriever.get_stylings(styling=styling, hierarchy=hierarchy)
+
+    def iter_fields(self) -> Iterator[FieldDescriptor]:
+        """
+        Returns an iterator of all fields, including arrays and those within an
+        array-of-tables, where each field is represented by a `FieldDescriptor`
+        object, in the order they appear in the TOML source.
+
+        Fields are yielded lazily from the store, so no list of all fields is
+        created.
+
+        Returns:
+            Iterator[`FieldDescriptor`]: An iterator of `FieldDescriptor` instances.
+        """
+        return self._retriever.iter_fields()
+
+    def iter_tables(self) -> Iterator[TableDescriptor]:
+        """
+        Returns an iterator of all tables, including inline tables and those
+        within an array-of-tables, where each table is represented by a
+        `TableDescriptor` object, in the order they appear in the TOML source.
+
+        Returns:
+            Iterator[`TableDescriptor`]: An iterator of `TableDescriptor` instances.
+        """
+        return self._retriever.iter_tables()
+
+    def iter_aots(self) -> Iterator[AoTDescriptor]:
+        """
+        Returns an iterator of all array-of-tables, where each array is
+        represented by a `AoTDescriptor` object, in the order they appear in the
+        TOML source.
+
+        Returns:
+            Iterator[`AoTDescriptor`]: An iterator of `AoTDescriptor` instances.
+        """
+        return self._retriever.iter_aots()
+
+    def iter_stylings(
+        self, styling: Optional[StyleItem] = None
+    ) -> Iterator[StyleDescriptor]:
+        """
+        Returns an iterator of all stylings (comments or whitespace) appearing
+        anywhere in the TOML source, where each styling is represented by a
+        `StyleDescriptor` object, in the order they appear.
+
+        If "whitespace" is passed only whitespace stylings will be yielded. If
+        "comment" is passed only comment stylings will be yielded. If it is None,
+        then all stylings will be yielded.
+
+        Args:
+            styling (`StyleItem` | None): A literal that identifies the type of
+                styling to yield. Can be either "whitespace" or "comment". Is
+                optional and defaults to None.
+
+        Returns:
+            Iterator[`StyleDescriptor`]: An iterator of `StyleDescriptor` instances.
+        """
+        return self._retriever.iter_stylings(styling=styling)
+
+    def walk(self) -> Iterator[AnyDescriptor]:
+        """
+        Returns an iterator of all fields, tables, array-of-tables, and stylings
+        in the TOML source, in the order they appear, where each table and
+        array-of-tables comes before the items within it.
+
+        Descriptors are yielded lazily, by merging the fields, tables, and
+        stylings already stored in order of line number, so only the next
+        descriptor of each structure that is open at the current line is held
+        in memory. Iterating through a very large array-of-tables therefore
+        does not create any list of its tables or fields.
+
+        The descriptor should not be modified, or updated in live mode, while
+        iterating.
+
+        Returns:
+            Iterator[`AnyDescriptor`]: An iterator of `FieldDescriptor`,
+                `TableDescriptor`, `AoTDescriptor`, and `StyleDescriptor`
+                instances.
+        """
+        return self._retriever.walk()
+
+    def find(self, pattern: str) -> List[AnyDescriptor]:
+        """
+        Retrieves all fields, tables, and array-of-tables whose hierarchy
+        matches a glob-style hierarchy pattern, in the order they appear in the
+        TOML source. Tables and fields within an array-of-tables are included.
+
+        Each level of the pattern matches one level of a hierarchy, where "*"
+        matches any single level, "**" matches any number of levels, including
+        none, and any other level may use the wildcards of the `fnmatch`
+        module. For example, "servers.*.port" matches the port field of each
+        table directly within "servers", and "tool.**.version" matches a
+        version field at any depth within "tool".
+
+        An index of all hierarchies is built on the first query and reused for
+        all that follow, so that each query only visits the hierarchies that
+        the pattern can reach.
+
+        Args:
+            pattern (str): A glob-style hierarchy pattern.
+
+        Returns:
+            List[`AnyDescriptor`]: A list of `FieldDescriptor`, `TableDescriptor`,
+                and `AoTDescriptor` instances.
+        """
+        if self._path_index is None:
+            self._path_index = PathIndex(descriptors=self.walk())
+
+        return self._path_index.find(pattern=pattern)
+
+    def at_line(self, line_no: int) -> Optional[LineLookup]:
+        """
+        Retrieves the innermost field, table, array-of-tables, or styling at a
+        line of the TOML source, along with all tables it appears within, as a
+        `LineLookup` object. Returns None if no item covers the line, such as a
+        line past the end of the TOML source, or a blank line when whitespace
+        is not described.
+
+        The innermost item is the last one to start on the closest line at or
+        before the line, such as a field of an inline table rather than the
+        inline table. Whitespace is only returned if no other item starts on
+        that line. A line within a multi-line array that no styling covers,
+        such as the line closing it, is returned as the array.
+
+        An index of all line numbers is built on the first query and reused for
+        all that follow, so that each query is a binary search.
+
+        Args:
+            line_no (int): A line number.
+
+        Returns:
+            `LineLookup` | None: A `LineLookup` instance or None.
+        """
+        if self._line_index is None:
+            self._line_index = LineIndex(descriptors=self.walk())
+
+        return self._line_index.at_line(line_no=line_no)
+
+    def in_range(self, start: int, end: int) -> List[AnyDescriptor]:
+        """
+        Retrieves all fields, tables, array-of-tables, and stylings starting
+        within a range of lines of the TOML source, including both the first
+        and last line, in the order they appear.
+
+        Args:
+            start (int): The first line of the range.
+            end (int): The last line of the range.
+
+        Returns:
+            List[`AnyDescriptor`]: A list of `FieldDescriptor`, `TableDescriptor`,
+                `AoTDescriptor`, and `StyleDescriptor` instances.
+        """
+        if self._line_index is None:
+            self._line_index = LineIndex(descriptors=self.walk())
+
+        return self._line_index.in_range(start=start, end=end)
+
+    def fields_by_type(
+        self, value_type: Type[Any], hierarchy: Optional[TOMLHierarchy] = None
+    ) -> List[FieldDescriptor]:
+        """
+        Retrieves all fields, including arrays and those within an
+        array-of-tables, whose value is exactly of a type, in the order they
+        appear in the TOML source. If a `TOMLHierarchy` object is passed, then
+        only the fields within that hierarchy are retrieved.
+
+        The type is that of the unwrapped value, such as `bool` or
+        `datetime.datetime`, even if the descriptor was built without unwrapping
+        values. Subclasses are not matched, so `int` does not match booleans.
+
+        An index of all fields by the type and value is built on the first query
+        and reused for all that follow, so that each query is a dictionary
+        lookup.
+
+        Args:
+            value_type (Type[Any]): The type of the value.
+            hierarchy (`TOMLHierarchy` | None) A `TOMLHierarchy` instance. Is
+                optional and defaults to None.
+
+        Returns:
+            List[`FieldDescriptor`]: A list of `FieldDescriptor` instances.
+        """
+        if self._value_index is None:
+            self._value_index = ValueIndex(fields=self.iter_fields())
+
+        return self._value_index.fields_by_type(
+            value_type=value_type,
+            hierarchy=(
+                standardize_hierarchy(hierarchy=hierarchy)
+                if hierarchy is not None
+                else None
+            ),
+        )
+
+    def fields_with_value(
+        self, value: Any, hierarchy: Optional[TOMLHierarchy] = None
+    ) -> List[FieldDescriptor]:
+        """
+        Retrieves all fields, including those within an array-of-tables, whose
+        value is equal to, and of the same type as, a hashable value, in the
+        order they appear in the TOML source. If a `TOMLHierarchy` object is
+        passed, then only the fields within that hierarchy are retrieved.
+
+        Values are compared once unwrapped, even if the descriptor was built
+        without unwrapping values. As the types must match, `True` does not
+        match a field with a value of `1`. Arrays are never matched, as they
+        cannot be hashed.
+
+        Args:
+            value (Any): A hashable value.
+            hierarchy (`TOMLHierarchy` | None) A `TOMLHierarchy` instance. Is
+                optional and defaults to None.
+
+        Returns:
+            List[`FieldDescriptor`]: A list of `FieldDescriptor` instances.
+        """
+        if self._value_index is None:
+            self._value_index = ValueIndex(fields=self.iter_fields())
+
+        return self._value_index.fields_with_value(
+            value=value,
+            hierarchy=(
+                standardize_hierarchy(hierarchy=hierarchy)
+                if hierarchy is not None
+                else None
+            ),
+        )
+
+    def comments_with_prefix(
+        self, prefix: str, hierarchy: Optional[TOMLHierarchy] = None
+    ) -> List[CommentEntry]:
+        """
+        Retrieves all comments whose text, without the leading "#" and any
+        whitespace, starts with a prefix, such as "TODO", in the order they
+        appear in the TOML source. Each comment is represented by a
+        `CommentEntry` object. If a `TOMLHierarchy` object is passed, then only
+        the comments belonging to that hierarchy, or any within it, are
+        retrieved.
+
+        Comments on their own line, comments after a field or table on the same
+        line, and comments between the items of an array are all retrieved.
+
+        An index of all comments is built on the first query and reused for all
+        that follow, so that each prefix is found by binary search.
+
+        Args:
+            prefix (str): The start of the text of the comments.
+            hierarchy (`TOMLHierarchy` | None) A `TOMLHierarchy` instance. Is
+                optional and defaults to None.
+
+        Returns:
+            List[`CommentEntry`]: A list of `CommentEntry` instances.
+        """
+        if self._comment_index is None:
+            self._comment_index = CommentIndex(descriptors=self.walk())
+
+        return self._comment_index.with_prefix(
+            prefix=prefix,
+            hierarchy=(
+                standardize_hierarchy(hierarchy=hierarchy)
+                if hierarchy is not None
+                else None
+            ),
+        )
+
+    def search_comments(
+        self,
+        pattern: Union[str, Pattern[str]],
+        hierarchy: Optional[TOMLHierarchy] = None,
+    ) -> List[CommentEntry]:
+        """
+        Retrieves all comments in which a regular expression matches anywhere,
+        such as "@deprecated", in the order they appear in the TOML source.
+        Each comment is represented by a `CommentEntry` object, and is searched
+        as written, including the leading "#". If a `TOMLHierarchy` object is
+        passed, then only the comments belonging to that hierarchy, or any
+        within it, are retrieved.
+
+        Args:
+            pattern (str | `re.Pattern`): A regular expression.
+            hierarchy (`TOMLHierarchy` | None) A `TOMLHierarchy` instance. Is
+                optional and defaults to None.
+
+        Returns:
+            List[`CommentEntry`]: A list of `CommentEntry` instances.
+        """
+        if self._comment_index is None:
+            self._comment_index = CommentIndex(descriptors=self.walk())
+
+        return self._comment_index.search(
+            pattern=pattern,
+            hierarchy=(
+                standardize_hierarchy(hierarchy=hierarchy)
+                if hierarchy is not None
+                else None
+            ),
+        )
+
+    def _get_level_index(self) -> LevelIndex:
+        """
+        Private method which returns an index of all structures grouped by the
+        first level of their hierarchy, building it on the first call.
+        """
+        if self._level_index is None:
+            self._level_index = LevelIndex(descriptors=self.walk())
+
+        return self._level_index
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
 import copy
-import inspect
 import itertools
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, List, Optional, Set, Type, TypeVar, cast
+from dataclasses import dataclass, replace
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from tomlkit import items
 
 from tomlkit_extras._exceptions import InvalidStylingError
-from tomlkit_extras._hierarchy import Hierarchy
+from tomlkit_extras._hierarchy import Hierarchy, InternedHierarchy
 from tomlkit_extras._typing import (
     AoTItem,
     FieldItem,
@@ -27,26 +38,74 @@ from tomlkit_extras.descriptor._helpers import (
     CommentDescriptor,
     create_comment_descriptor,
 )
-from tomlkit_extras.descriptor._types import ItemInfo
+from tomlkit_extras.descriptor._types import ItemInfo, ItemPosition
 
 _WHITESPACE_PATTERN = r"^[ \n\r]*$"
 
 Descriptor = TypeVar("Descriptor", bound="AbstractDescriptor")
 
+# The names of the members shown in the repr of each descriptor class
+_REPR_MEMBERS: Dict[Type[AbstractDescriptor], Tuple[str, ...]] = dict()
+
 
 def _chain_stylings(styles: Dict[str, List[StyleDescriptor]]) -> List[StyleDescriptor]:
     """A private function which flattens a list of lists of `StyleDescriptor` objects."""
     return list(itertools.chain.from_iterable(styles.values()))
 
 
+def _shift_comment(
+    comment: Optional[CommentDescriptor], line_offset: int
+) -> Optional[CommentDescriptor]:
+    """
+    A private function which returns a `CommentDescriptor` with its line number
+    shifted by an offset, or None if there is no comment.
+    """
+    if comment is None:
+        return None
+
+    return CommentDescriptor(
+        comment=comment.comment, line_no=comment.line_no + line_offset
+    )
+
+
+def _get_repr_members(descriptor_class: Type[AbstractDescriptor]) -> Tuple[str, ...]:
+    """
+    A private function which returns the names of the public properties and
+    slots of a descriptor class, that are shown in its repr. The properties
+    are sorted by name and followed by the slots in the order they are
+    declared, excluding any names in the `__special__` set of the class.
+    """
+    if descriptor_class not in _REPR_MEMBERS:
+        properties: Set[str] = set()
+        slots: List[str] = []
+
+        for parent_class in reversed(descriptor_class.__mro__):
+            for member_name, member_value in vars(parent_class).items():
+                if isinstance(member_value, property):
+                    properties.add(member_name)
+
+            slots.extend(getattr(parent_class, "__slots__", ()))
+
+        _REPR_MEMBERS[descriptor_class] = tuple(
+            member_name
+            for member_name in [*sorted(properties), *slots]
+            if not member_name.startswith("_")
+            and member_name not in descriptor_class.__special__
+        )
+
+    return _REPR_MEMBERS[descriptor_class]
+
+
 def _from_info_to_hierarchy(info: ItemInfo) -> Hierarchy:
     """
     A private function which converts a string hierarchy from an `ItemInfo` object
-    into a `Hierarchy`.
+    into an `InternedHierarchy`.
     """
-    hierarchy = Hierarchy.from_str_hierarchy(info.hierarchy)
-    hierarchy.add_to_hierarchy(update=info.key)
-    return hierarchy
+    return InternedHierarchy.from_str_hierarchy(
+        hierarchy=Hierarchy.create_hierarchy(
+            hierarchy=info.hierarchy, attribute=info.key
+        )
+    )
 
 
 @dataclass
@@ -57,6 +116,8 @@ class AoTDescriptors:
     `_TOMLParser`.
     """
 
+    __slots__ = ("aots",)
+
     aots: List[AoTDescriptor]
 
     def get_array(self) -> AoTDescriptor:
@@ -91,6 +152,8 @@ class StylingDescriptors:
             are lists of `StyleDescriptor` corresponding to the whitespaces.
     """
 
+    __slots__ = ("comments", "whitespace")
+
     comments: Dict[str, List[StyleDescriptor]]
     whitespace: Dict[str, List[StyleDescriptor]]
 
@@ -184,8 +247,30 @@ class StylingDescriptors:
         else:
             current_source[styling_value].append(styling_position)
 
+    def _shift_line_numbers(self, line_offset: int) -> None:
+        """
+        Private method that shifts the line numbers of all stylings by an offset.
+        """
+        for styles in (self.comments, self.whitespace):
+            for style_descriptors in styles.values():
+                for styling in style_descriptors:
+                    styling.line_no += line_offset
+
+    def _merge(self, stylings: StylingDescriptors) -> None:
+        """
+        Private method that adds all stylings of another `StylingDescriptors`
+        instance, after those already in the store.
+        """
+        for styles, current_source in [
+            (stylings.comments, self.comments),
+            (stylings.whitespace, self.whitespace),
+        ]:
+            for styling_value, style_descriptors in styles.items():
+                current_source.setdefault(styling_value, []).extend(style_descriptors)
+
 
 class AbstractDescriptor(ABC):
+    __slots__ = ("_item_info",)
     __special__: ClassVar[Set[str]] = set()
 
     """
@@ -207,7 +292,7 @@ class AbstractDescriptor(ABC):
     """
 
     def __init__(self, item_info: ItemInfo) -> None:
-        self._item_info = copy.deepcopy(item_info)
+        self._item_info = item_info
 
     def copy(self: Descriptor) -> Descriptor:
         """Returns a shallow copy of the object."""
@@ -219,17 +304,10 @@ class AbstractDescriptor(ABC):
 
     def __repr__(self) -> str:
         repr_body: List[str] = []
-        all_members: Dict[str, Any] = dict(
-            dict(inspect.getmembers(self.__class__)), **self.__dict__
-        )
-
-        for member_name, member_value in all_members.items():
-            if not member_name.startswith("_") and member_name not in self.__special__:
-                if isinstance(member_value, property):
-                    member_value = member_value.__get__(self)
-
-                if not callable(member_value):
-                    repr_body.append(f"    {member_name}={member_value},\n")
+        for member_name in _get_repr_members(descriptor_class=self.__class__):
+            member_value = getattr(self, member_name)
+            if not callable(member_value):
+                repr_body.append(f"    {member_name}={member_value},\n")
 
         repr_string = f"{self.__class__.__name__}(\n{''.join(repr_body)})"
         return repr_string
@@ -271,6 +349,18 @@ class AbstractDescriptor(ABC):
         """
         return self._item_info.parent_type
 
+    def _offset_position(self, offset: ItemPosition) -> None:
+        """
+        A private method that offsets the position of the structure within its
+        parent, for a structure that follows others which were parsed separately.
+        """
+        if not offset.attribute and not offset.container:
+            return
+
+        self._item_info = replace(
+            self._item_info, position=self._item_info.position.offset_by(offset)
+        )
+
 
 class AttributeDescriptor(AbstractDescriptor):
     """
@@ -284,6 +374,8 @@ class AttributeDescriptor(AbstractDescriptor):
             other key value pairs (fields, tables) within the parent.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Returns the name of the TOML structure."""
@@ -306,6 +398,7 @@ class AttributeDescriptor(AbstractDescriptor):
 
 
 class FieldDescriptor(AttributeDescriptor):
+    __slots__ = ("line_no", "comment", "stylings", "_value", "_unwrapped")
     __special__: ClassVar[Set[str]] = {"stylings"}
 
     """
@@ -326,7 +419,9 @@ class FieldDescriptor(AttributeDescriptor):
             either 'field' or 'array'.
         line_no (int): An integer line number marking the beginning of the
             structure.
-        value (Any): The value of the field.
+        value (Any): The value of the field, unwrapped from the `tomlkit` item
+            on first access, or the `tomlkit` item itself if the descriptor
+            was built without unwrapping values.
         value_type (Type[Any]): The type of the field value.
         comment (`CommentDescriptor` | None): A `CommentDescriptor` instance,
             correspondng to the comment associated with the structure. Can
@@ -339,16 +434,20 @@ class FieldDescriptor(AttributeDescriptor):
         self,
         line_no: int,
         info: ItemInfo,
-        value: Any,
+        item: items.Item,
         comment: Optional[CommentDescriptor],
         stylings: StylingDescriptors,
+        unwrap_value: bool = True,
     ) -> None:
         super().__init__(item_info=info)
         self.line_no = line_no
-        self.value = value
         self.comment = comment
         self.stylings = stylings
 
+        # The item is only unwrapped on the first access of the value
+        self._value: Any = item
+        self._unwrapped = not unwrap_value
+
     @property
     def item_type(self) -> FieldItem:
         """
@@ -357,6 +456,17 @@ class FieldDescriptor(AttributeDescriptor):
         """
         return cast(FieldItem, self._item_info.item_type)
 
+    @property
+    def value(self) -> Any:
+        """
+        Returns the value of the field. The `tomlkit` item is unwrapped on the
+        first access, and the unwrapped value is cached.
+        """
+        if not self._unwrapped:
+            self._value = safe_unwrap(structure=self._value)
+            self._unwrapped = True
+        return self._value
+
     @property
     def value_type(self) -> Type[Any]:
         """Returns the type of the field value."""
@@ -364,7 +474,7 @@ class FieldDescriptor(AttributeDescriptor):
 
     @classmethod
     def _from_toml_item(
-        cls, item: items.Item, info: ItemInfo, line_no: int
+        cls, item: items.Item, info: ItemInfo, line_no: int, unwrap_value: bool
     ) -> FieldDescriptor:
         """
         Private class method which generates an instance of `FieldDescriptor` for
@@ -379,9 +489,13 @@ class FieldDescriptor(AttributeDescriptor):
             comment_line_no = find_comment_line_no(line_no=line_no, item=item)
 
         comment = create_comment_descriptor(item=item, line_no=comment_line_no)
-        value = safe_unwrap(structure=item)
         return cls(
-            line_no=line_no, info=info, value=value, comment=comment, stylings=stylings
+            line_no=line_no,
+            info=info,
+            item=item,
+            comment=comment,
+            stylings=stylings,
+            unwrap_value=unwrap_value,
         )
 
     def _update_comment(self, item: items.Array, line_no: int) -> None:
@@ -391,8 +505,18 @@ class FieldDescriptor(AttributeDescriptor):
         comment_line_no = find_comment_line_no(line_no=line_no, item=item)
         self.comment = create_comment_descriptor(item=item, line_no=comment_line_no)
 
+    def _shift_line_numbers(self, line_offset: int) -> None:
+        """
+        A private method that shifts the line numbers of the field, its comment
+        and its stylings by an offset.
+        """
+        self.line_no += line_offset
+        self.comment = _shift_comment(comment=self.comment, line_offset=line_offset)
+        self.stylings._shift_line_numbers(line_offset=line_offset)
+
 
 class TableDescriptor(AttributeDescriptor):
+    __slots__ = ("line_no", "comment", "stylings", "_fields")
     __special__: ClassVar[Set[str]] = {"stylings", "fields"}
 
     """
@@ -477,15 +601,26 @@ class TableDescriptor(AttributeDescriptor):
         return cls(line_no=line_no, info=info, comment=comment, stylings=stylings)
 
     def _add_field(
-        self, item: items.Item, info: ItemInfo, line_no: int
+        self, item: items.Item, info: ItemInfo, line_no: int, unwrap_value: bool
     ) -> FieldDescriptor:
         """A private method that adds a field to the existing store of fields."""
         field_descriptor = FieldDescriptor._from_toml_item(
-            item=item, info=info, line_no=line_no
+            item=item, info=info, line_no=line_no, unwrap_value=unwrap_value
         )
         self._fields.update({info.key: field_descriptor})
         return field_descriptor
 
+    def _shift_line_numbers(self, line_offset: int) -> None:
+        """
+        A private method that shifts the line numbers of the table, its comment,
+        its stylings and its fields by an offset.
+        """
+        self.line_no += line_offset
+        self.comment = _shift_comment(comment=self.comment, line_offset=line_offset)
+        self.stylings._shift_line_numbers(line_offset=line_offset)
+        for field_descriptor in self._fields.values():
+            field_descriptor._shift_line_numbers(line_offset=line_offset)
+
 
 class StyleDescriptor(AbstractDescriptor):
     """
@@ -515,6 +650,8 @@ class StyleDescriptor(AbstractDescriptor):
             styling.
     """
 
+    __slots__ = ("style", "line_no")
+
     def __init__(self, style: str, line_no: int, info: ItemInfo) -> None:
         super().__init__(item_info=info)
         self.style = style
@@ -538,6 +675,7 @@ class StyleDescriptor(AbstractDescriptor):
 
 
 class AoTDescriptor(AttributeDescriptor):
+    __slots__ = ("line_no", "_tables")
     __special__: ClassVar[Set[str]] = {"tables"}
 
     """
@@ -624,3 +762,17 @@ class AoTDescriptor(AttributeDescriptor):
             self._tables[hierarchy] = [table_descriptor]
         else:
             self._tables[hierarchy].append(table_descriptor)
+
+    def _shift_line_numbers(self, line_offset: int) -> None:
+        """
+        A private method that shifts the line numbers of the array and all of
+        its tables by an offset.
+        """
+        self.line_no += line_offset
+        for tables in self._tables.values():
+            for table_descriptor in tables:
+                table_descriptor._shift_line_numbers(line_offset=line_offset)
+
+
+# Any descriptor of a single item within a TOML source
+AnyDescriptor = Union[FieldDescriptor, TableDescriptor, AoTDescriptor, StyleDescriptor]
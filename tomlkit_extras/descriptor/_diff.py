@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from tomlkit_extras._hierarchy import Hierarchy
+from tomlkit_extras._typing import ChangeKind, Item
+from tomlkit_extras.descriptor._descriptor import TOMLDocumentDescriptor
+from tomlkit_extras.descriptor._descriptors import FieldDescriptor
+from tomlkit_extras.descriptor._helpers import FrozenSlots
+from tomlkit_extras.descriptor._indexes import (
+    CommentEntry,
+    IndexedContainer,
+    IndexedLevel,
+    _get_unwrapped_value,
+)
+
+
+@dataclass(frozen=True)
+class DescriptorChange(FrozenSlots):
+    """
+    A dataclass representing a single difference between two
+    `TOMLDocumentDescriptor` instances, returned by `diff_descriptors`.
+
+    Attributes:
+        change (`ChangeKind`): A literal identifying the difference, being
+            "added", "removed", or "changed".
+        item_type (`Item`): The type of the item, being "field", "array",
+            "table", "inline-table", "super-table", "array-of-tables", or
+            "comment".
+        hierarchy (`Hierarchy` | None): The hierarchy of the item, or None for
+            a comment on its own line in the top-level space.
+        old_value (Any): The unwrapped value of a field, or the comment as
+            written, in the old descriptor. Is None for a table or
+            array-of-tables, or if the item was added.
+        new_value (Any): The unwrapped value of a field, or the comment as
+            written, in the new descriptor. Is None for a table or
+            array-of-tables, or if the item was removed.
+        old_line_no (int | None): The line number of the item in the old
+            descriptor, or None if the item was added.
+        new_line_no (int | None): The line number of the item in the new
+            descriptor, or None if the item was removed.
+    """
+
+    __slots__ = (
+        "change",
+        "item_type",
+        "hierarchy",
+        "old_value",
+        "new_value",
+        "old_line_no",
+        "new_line_no",
+    )
+
+    change: ChangeKind
+    item_type: Item
+    hierarchy: Optional[Hierarchy]
+    old_value: Any
+    new_value: Any
+    old_line_no: Optional[int]
+    new_line_no: Optional[int]
+
+
+def _field_change(
+    change: ChangeKind,
+    old_field: Optional[FieldDescriptor],
+    new_field: Optional[FieldDescriptor],
+) -> DescriptorChange:
+    """
+    A private function which returns a `DescriptorChange` for a field that is
+    in either or both descriptors.
+    """
+    field = new_field if new_field is not None else old_field
+    assert field is not None, "field must be in at least one descriptor"
+    return DescriptorChange(
+        change=change,
+        item_type=field.item_type,
+        hierarchy=field.hierarchy,
+        old_value=_unwrapped_value(field=old_field),
+        new_value=_unwrapped_value(field=new_field),
+        old_line_no=old_field.line_no if old_field is not None else None,
+        new_line_no=new_field.line_no if new_field is not None else None,
+    )
+
+
+def _unwrapped_value(field: Optional[FieldDescriptor]) -> Any:
+    """
+    A private function which returns the unwrapped value of a field, or None if
+    there is no field.
+    """
+    return _get_unwrapped_value(field=field) if field is not None else None
+
+
+def _comment_change(
+    change: ChangeKind, comment_entry: CommentEntry
+) -> DescriptorChange:
+    """
+    A private function which returns a `DescriptorChange` for a comment that is
+    only in one of the descriptors.
+    """
+    return DescriptorChange(
+        change=change,
+        item_type="comment",
+        hierarchy=comment_entry.hierarchy,
+        old_value=comment_entry.comment if change == "removed" else None,
+        new_value=comment_entry.comment if change == "added" else None,
+        old_line_no=comment_entry.line_no if change == "removed" else None,
+        new_line_no=comment_entry.line_no if change == "added" else None,
+    )
+
+
+def _container_changes(
+    change: ChangeKind, container: IndexedContainer
+) -> List[DescriptorChange]:
+    """
+    A private function which returns the changes for a structure that is only
+    in one of the descriptors, being the structure itself, along with all of
+    its fields and comments.
+    """
+    changes: List[DescriptorChange] = []
+    descriptor = container.descriptor
+    if descriptor is not None:
+        changes.append(
+            DescriptorChange(
+                change=change,
+                item_type=descriptor.item_type,
+                hierarchy=descriptor.hierarchy,
+                old_value=None,
+                new_value=None,
+                old_line_no=descriptor.line_no if change == "removed" else None,
+                new_line_no=descriptor.line_no if change == "added" else None,
+            )
+        )
+
+    for field in container.fields.values():
+        changes.append(
+            _field_change(
+                change=change,
+                old_field=field if change == "removed" else None,
+                new_field=field if change == "added" else None,
+            )
+        )
+
+    changes.extend(
+        _comment_change(change=change, comment_entry=comment_entry)
+        for comment_entry in container.comments
+    )
+    return changes
+
+
+def _matched_container_changes(
+    old_container: IndexedContainer, new_container: IndexedContainer
+) -> List[DescriptorChange]:
+    """
+    A private function which returns the changes between the fields and
+    comments of a structure that is in both descriptors.
+    """
+    changes: List[DescriptorChange] = []
+
+    for hierarchy, old_field in old_container.fields.items():
+        new_field = new_container.fields.get(hierarchy)
+        if new_field is None:
+            changes.append(
+                _field_change(change="removed", old_field=old_field, new_field=None)
+            )
+            continue
+
+        old_value = _unwrapped_value(field=old_field)
+        new_value = _unwrapped_value(field=new_field)
+
+        # The types are compared as well, as 1, 1.0, and true are all equal
+        if (
+            old_field.item_type != new_field.item_type
+            or type(old_value) is not type(new_value)
+            or old_value != new_value
+        ):
+            changes.append(
+                _field_change(
+                    change="changed", old_field=old_field, new_field=new_field
+                )
+            )
+
+    for hierarchy, new_field in new_container.fields.items():
+        if hierarchy not in old_container.fields:
+            changes.append(
+                _field_change(change="added", old_field=None, new_field=new_field)
+            )
+
+    # Comments have no name, so are matched by hierarchy and text, where a
+    # comment that only moved to another line is not a change
+    unmatched: Dict[Tuple[str, str], List[CommentEntry]] = dict()
+    for comment_entry in old_container.comments:
+        unmatched.setdefault(
+            (str(comment_entry.hierarchy), comment_entry.comment), []
+        ).append(comment_entry)
+
+    added: List[CommentEntry] = []
+    for comment_entry in new_container.comments:
+        old_entries = unmatched.get(
+            (str(comment_entry.hierarchy), comment_entry.comment)
+        )
+        if old_entries:
+            old_entries.pop(0)
+        else:
+            added.append(comment_entry)
+
+    changes.extend(
+        _comment_change(change="removed", comment_entry=comment_entry)
+        for old_entries in unmatched.values()
+        for comment_entry in old_entries
+    )
+    changes.extend(
+        _comment_change(change="added", comment_entry=comment_entry)
+        for comment_entry in added
+    )
+    return changes
+
+
+def _level_changes(
+    old_level: Optional[IndexedLevel], new_level: Optional[IndexedLevel]
+) -> List[DescriptorChange]:
+    """
+    A private function which returns the changes between all structures of a
+    level, where a level can be missing from either descriptor.
+    """
+    old_containers = old_level.containers if old_level is not None else dict()
+    new_containers = new_level.containers if new_level is not None else dict()
+    changes: List[DescriptorChange] = []
+
+    for key, old_container in old_containers.items():
+        new_container = new_containers.get(key)
+        if new_container is None:
+            changes.extend(
+                _container_changes(change="removed", container=old_container)
+            )
+            continue
+
+        changes.extend(
+            _matched_container_changes(
+                old_container=old_container, new_container=new_container
+            )
+        )
+
+    for key, new_container in new_containers.items():
+        if key not in old_containers:
+            changes.extend(_container_changes(change="added", container=new_container))
+
+    return changes
+
+
+def diff_descriptors(
+    old: TOMLDocumentDescriptor, new: TOMLDocumentDescriptor
+) -> List[DescriptorChange]:
+    """
+    Returns all differences between two `TOMLDocumentDescriptor` instances,
+    being the fields, tables, array-of-tables, tables of an array-of-tables,
+    and comments that were added, removed, or changed. Each difference is
+    represented by a `DescriptorChange` object.
+
+    Structures are matched by type, hierarchy, and position amongst those with
+    the same type and hierarchy, fields are matched by hierarchy, and comments
+    are matched by hierarchy and text. A field is changed if its unwrapped
+    value or its type differs. Items that only moved to another line, along
+    with whitespace, are not differences.
+
+    The structures of each descriptor are grouped by the first level of their
+    hierarchy, with a digest of the contents of each level. A level with the
+    same digest in both descriptors is skipped without comparing any of its
+    structures, and the digests are kept by each descriptor, so that a
+    descriptor can be compared against many others.
+
+    Args:
+        old (`TOMLDocumentDescriptor`): The descriptor to compare from.
+        new (`TOMLDocumentDescriptor`): The descriptor to compare to.
+
+    Returns:
+        List[`DescriptorChange`]: A list of `DescriptorChange` instances.
+    """
+    if not isinstance(old, TOMLDocumentDescriptor) or not isinstance(
+        new, TOMLDocumentDescriptor
+    ):
+        raise TypeError("Expected two instances of TOMLDocumentDescriptor")
+
+    old_levels = old._get_level_index().levels
+    new_levels = new._get_level_index().levels
+    changes: List[DescriptorChange] = []
+
+    for level, old_level in old_levels.items():
+        new_level = new_levels.get(level)
+        if new_level is not None and new_level.digest == old_level.digest:
+            continue
+
+        changes.extend(_level_changes(old_level=old_level, new_level=new_level))
+
+    for level, new_level in new_levels.items():
+        if level not in old_levels:
+            changes.extend(_level_changes(old_level=None, new_level=new_level))
+
+    return changes
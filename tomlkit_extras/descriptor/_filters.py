@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import fnmatch
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, get_args
+
+from tomlkit import items
+
+from tomlkit_extras._typing import BodyContainerInOrder, Item, ItemKind
+from tomlkit_extras._utils import get_container_body
+
+# The kind of item that each type of item is filtered as
+_ITEM_KINDS: Dict[Item, ItemKind] = {
+    "field": "field",
+    "array": "field",
+    "table": "table",
+    "inline-table": "table",
+    "super-table": "table",
+    "array-of-tables": "array-of-tables",
+    "comment": "comment",
+    "whitespace": "whitespace",
+}
+
+# Characters that make a hierarchy pattern a glob pattern
+_GLOB_CHARACTERS = ("*", "?", "[")
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    A private function which returns the part of a pattern before its first
+    glob character, being the whole pattern if it has none.
+    """
+    indices = [pattern.find(char) for char in _GLOB_CHARACTERS if char in pattern]
+    return pattern[: min(indices)] if indices else pattern
+
+
+def count_skipped_lines(toml_item: items.Item, container: BodyContainerInOrder) -> int:
+    """
+    A function which returns the number of lines that the parser of a
+    `TOMLDocumentDescriptor` would count for an item and everything nested
+    within it, without describing any of it. Used to keep the line numbers of
+    all items after an item that is skipped the same as if it were described.
+    """
+    lines = 0
+    stack: List[Tuple[items.Item, bool]] = [
+        (toml_item, isinstance(container, (items.Array, items.InlineTable)))
+    ]
+    while stack:
+        item, nested = stack.pop()
+        if isinstance(item, (items.Comment, items.Whitespace)):
+            lines += item.as_string().count("\n")
+        elif isinstance(item, (items.Array, items.InlineTable)):
+            lines += 1
+            stack.extend(
+                (child, True) for _, child in get_container_body(toml_source=item)
+            )
+        elif isinstance(item, items.AoT):
+            stack.extend((table, False) for table in item.body)
+        elif isinstance(item, items.Table):
+            lines += int(not item.is_super_table())
+            stack.extend((child, False) for _, child in item.value.body)
+        elif not nested:
+            lines += 1
+
+    return lines
+
+
+class DescriptorFilter:
+    """
+    A class which decides which items a `TOMLDocumentDescriptor` describes,
+    based on the hierarchy, kind, and depth of each item.
+
+    Hierarchy patterns are either a hierarchy, matching that hierarchy and all
+    that are nested within it, or a glob pattern, as supported by the `fnmatch`
+    module, matching all hierarchies that it matches and all that are nested
+    within them. The depth of an item is the number of levels in its hierarchy,
+    where a styling is one level deeper than the structure it appears in.
+
+    A table or array-of-tables that is not included, but contains items that
+    may be included, is still described, without any of its own fields or
+    stylings, so that the included items can be reached. In the same way, a
+    table or array-of-tables of a kind that is not described is still
+    described if it contains items that may be, so that `item_kinds` never
+    hides the fields or stylings nested within a structure.
+
+    Args:
+        include (Iterable[str] | None): Hierarchy patterns of the items to
+            describe. If None, then all items are described. Defaults to None.
+        exclude (Iterable[str] | None): Hierarchy patterns of the items not to
+            describe, taking precedence over `include`. Defaults to None.
+        item_kinds (Iterable[`ItemKind`] | None): The kinds of items to describe.
+            If None, then all kinds are described. Defaults to None.
+        max_depth (int | None): The maximum depth of any item described. If None,
+            then items at any depth are described. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        item_kinds: Optional[Iterable[ItemKind]] = None,
+        max_depth: Optional[int] = None,
+    ) -> None:
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("The maximum depth must not be negative")
+
+        all_item_kinds: FrozenSet[str] = frozenset(get_args(ItemKind))
+        self.item_kinds: FrozenSet[str] = (
+            frozenset(item_kinds) if item_kinds is not None else all_item_kinds
+        )
+        if not self.item_kinds <= all_item_kinds:
+            raise ValueError(
+                "Item kinds must be one of " + ", ".join(sorted(all_item_kinds))
+            )
+
+        self.include: Optional[Tuple[str, ...]] = (
+            tuple(include) if include is not None else None
+        )
+        self.exclude: Tuple[str, ...] = tuple(exclude) if exclude is not None else ()
+        self.max_depth = max_depth
+
+        # Literal prefixes of include patterns, and whether each pattern is a
+        # glob pattern, to decide whether any hierarchy nested within a
+        # hierarchy may be included
+        self._include_prefixes: Set[Tuple[str, bool]] = {
+            (
+                _literal_prefix(pattern=pattern),
+                _literal_prefix(pattern=pattern) != pattern,
+            )
+            for pattern in self.include or ()
+        }
+
+        # Whether each hierarchy seen matches, or is nested in a hierarchy that
+        # matches, any of the include or exclude patterns
+        self._included: Dict[str, bool] = dict()
+        self._excluded: Dict[str, bool] = dict()
+
+    def _matches(
+        self, hierarchy: str, patterns: Tuple[str, ...], matches: Dict[str, bool]
+    ) -> bool:
+        """
+        A private method which returns True if a hierarchy, or any hierarchy it
+        is nested in, matches any of the patterns. Results are cached for each
+        hierarchy.
+        """
+        matched = matches.get(hierarchy)
+        if matched is None:
+            matched = any(
+                fnmatch.fnmatchcase(hierarchy, pattern) for pattern in patterns
+            ) or (
+                bool(hierarchy)
+                and self._matches(
+                    hierarchy=hierarchy.rpartition(".")[0],
+                    patterns=patterns,
+                    matches=matches,
+                )
+            )
+            matches[hierarchy] = matched
+
+        return matched
+
+    def _may_include_nested(self, hierarchy: str) -> bool:
+        """
+        A private method which returns True if a hierarchy nested within a
+        hierarchy may match any of the include patterns.
+        """
+        hierarchy_prefix = hierarchy + "."
+        return any(
+            prefix.startswith(hierarchy_prefix)
+            or (is_glob and hierarchy_prefix.startswith(prefix))
+            for prefix, is_glob in self._include_prefixes
+        )
+
+    def keeps(self, hierarchy: str, item_type: Item) -> bool:
+        """
+        Returns True if an item is described, given its hierarchy, or the
+        hierarchy of the structure it appears in if a styling, and the type of
+        the item. A table or array-of-tables that is not kept is skipped along
+        with everything nested within it.
+
+        The kinds of items described only decide whether an item is described,
+        never whether the items nested within it are reached, so a table or
+        array-of-tables of a kind not described is still kept if any item
+        nested within it may be described.
+
+        Args:
+            hierarchy (str): The hierarchy of the item.
+            item_type (`Item`): The type of the item.
+
+        Returns:
+            bool: A boolean indicating whether the item is described.
+        """
+        item_kind = _ITEM_KINDS[item_type]
+        is_structure = item_kind in {"table", "array-of-tables"}
+        is_kept_kind = item_kind in self.item_kinds
+        if not is_kept_kind and not is_structure:
+            return False
+
+        depth = hierarchy.count(".") + 1 if hierarchy else 0
+        if self.max_depth is not None:
+            if item_kind in {"comment", "whitespace"}:
+                depth += 1
+
+            # Any item nested within a structure is at least one level deeper
+            if depth > self.max_depth or (not is_kept_kind and depth >= self.max_depth):
+                return False
+
+        if self._matches(
+            hierarchy=hierarchy, patterns=self.exclude, matches=self._excluded
+        ):
+            return False
+
+        if self.include is None or self._matches(
+            hierarchy=hierarchy, patterns=self.include, matches=self._included
+        ):
+            return True
+
+        return is_structure and self._may_include_nested(hierarchy=hierarchy)
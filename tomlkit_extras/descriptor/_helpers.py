@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Set, Union
+from typing import Any, Optional, Set, Tuple, Union
 
 from tomlkit import TOMLDocument, items
 from tomlkit.container import OutOfOrderTableProxy
@@ -10,8 +10,23 @@ from tomlkit_extras._hierarchy import Hierarchy
 from tomlkit_extras._typing import Item, TOMLValidReturn
 
 
+class FrozenSlots:
+    """
+    A mixin for frozen dataclasses that declare `__slots__`, which have no
+    `__dict__` and cannot be assigned to, allowing them to be copied, deep
+    copied and pickled by calling the constructor with the value of each
+    slot. The slots must be declared in the same order as the fields.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        slots: Tuple[str, ...] = self.__slots__
+        return self.__class__, tuple(getattr(self, slot) for slot in slots)
+
+
 @dataclass(frozen=True)
-class CommentDescriptor:
+class CommentDescriptor(FrozenSlots):
     """
     A dataclass which provides detail for a comment that is directly
     associated with a particular field or table.
@@ -21,6 +36,8 @@ class CommentDescriptor:
         line_no (int): An integer line number where the comment is located.
     """
 
+    __slots__ = ("comment", "line_no")
+
     comment: str
     line_no: int
 
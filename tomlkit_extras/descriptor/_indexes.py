@@ -0,0 +1,686 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import re
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from tomlkit import items
+
+from tomlkit_extras._hierarchy import Hierarchy, HierarchyTrie
+from tomlkit_extras._typing import CommentKind
+from tomlkit_extras._utils import safe_unwrap
+from tomlkit_extras.descriptor._descriptors import (
+    AnyDescriptor,
+    AoTDescriptor,
+    FieldDescriptor,
+    StyleDescriptor,
+    TableDescriptor,
+)
+from tomlkit_extras.descriptor._helpers import FrozenSlots
+
+
+def _container_hierarchy(descriptor: AnyDescriptor) -> str:
+    """
+    A private function which returns the hierarchy of the structure that a
+    descriptor appears in, being the hierarchy of a styling itself, or an
+    empty string for the top-level space.
+    """
+    if isinstance(descriptor, StyleDescriptor):
+        hierarchy = descriptor.hierarchy
+        return str(hierarchy) if hierarchy is not None else str()
+
+    return Hierarchy.parent_hierarchy(hierarchy=str(descriptor.hierarchy))
+
+
+@dataclass(frozen=True)
+class LineLookup(FrozenSlots):
+    """
+    A dataclass returned by `TOMLDocumentDescriptor.at_line`, with the innermost
+    item at a line and the tables it appears within.
+
+    Attributes:
+        descriptor (`AnyDescriptor`): The `FieldDescriptor`, `TableDescriptor`,
+            `AoTDescriptor`, or `StyleDescriptor` of the item.
+        tables (Tuple[`TableDescriptor`, ...]): The tables, including inline
+            tables and tables of an array-of-tables, that the item appears
+            within, from the outermost to the innermost.
+    """
+
+    __slots__ = ("descriptor", "tables")
+
+    descriptor: AnyDescriptor
+    tables: Tuple[TableDescriptor, ...]
+
+
+@dataclass(frozen=True)
+class CommentEntry(FrozenSlots):
+    """
+    A dataclass representing a single comment found by a `TOMLDocumentDescriptor`,
+    being a comment on its own line, a comment after a field or table on the
+    same line, or a comment between the items of an array.
+
+    Attributes:
+        comment (str): The comment as written, starting with "#".
+        line_no (int): An integer line number where the comment is located.
+        hierarchy (`Hierarchy` | None): The hierarchy of the table, field, or
+            array the comment belongs to, or None if it is a comment on its own
+            line in the top-level space.
+        kind (`CommentKind`): A literal identifying where the comment appears,
+            being "standalone", "trailing", or "array-item".
+    """
+
+    __slots__ = ("comment", "line_no", "hierarchy", "kind")
+
+    comment: str
+    line_no: int
+    hierarchy: Optional[Hierarchy]
+    kind: CommentKind
+
+    @property
+    def text(self) -> str:
+        """
+        Returns the text of the comment, without the leading "#" characters and
+        surrounding whitespace.
+        """
+        return self.comment.lstrip("#").strip()
+
+
+def _get_comment_entry(descriptor: AnyDescriptor) -> Optional[CommentEntry]:
+    """
+    A private function which returns a `CommentEntry` for a comment styling, or
+    for the comment after a field or table, or None if the descriptor has no
+    comment.
+    """
+    if isinstance(descriptor, StyleDescriptor):
+        if descriptor.item_type != "comment":
+            return None
+
+        return CommentEntry(
+            comment=descriptor.style,
+            line_no=descriptor.line_no,
+            hierarchy=descriptor.hierarchy,
+            kind="array-item" if descriptor.parent_type == "array" else "standalone",
+        )
+    elif isinstance(descriptor, AoTDescriptor) or descriptor.comment is None:
+        return None
+
+    return CommentEntry(
+        comment=descriptor.comment.comment,
+        line_no=descriptor.comment.line_no,
+        hierarchy=descriptor.hierarchy,
+        kind="trailing",
+    )
+
+
+def _get_unwrapped_value(field: FieldDescriptor) -> Any:
+    """
+    A private function which returns the value of a field as an unwrapped
+    Python object, even if the descriptor was built without unwrapping values.
+    """
+    value = field.value
+    if isinstance(value, items.Item):
+        value = safe_unwrap(structure=value)
+
+    return value
+
+
+class PathIndex:
+    """
+    An index of all fields, tables, and array-of-tables of a
+    `TOMLDocumentDescriptor` by hierarchy, used to find those whose hierarchy
+    matches a glob-style hierarchy pattern.
+
+    The hierarchies are stored in a `HierarchyTrie`, so a query only visits
+    the levels of the trie that the pattern can reach, rather than every
+    hierarchy in the document.
+
+    Args:
+        descriptors (Iterable[`AnyDescriptor`]): All descriptors of a
+            `TOMLDocumentDescriptor`, in the order they appear. Any
+            `StyleDescriptor` instances are skipped.
+    """
+
+    def __init__(self, descriptors: Iterable[AnyDescriptor]) -> None:
+        # Each descriptor is stored along with its position amongst all
+        # descriptors, so that matches can be put back in document order
+        self._index: HierarchyTrie[List[Tuple[int, AnyDescriptor]]] = HierarchyTrie()
+
+        for position, descriptor in enumerate(descriptors):
+            if isinstance(descriptor, StyleDescriptor):
+                continue
+
+            indexed = self._index.get(hierarchy=descriptor.hierarchy)
+            if indexed is None:
+                self._index[descriptor.hierarchy] = [(position, descriptor)]
+            else:
+                indexed.append((position, descriptor))
+
+    def find(self, pattern: str) -> List[AnyDescriptor]:
+        """
+        Returns all fields, tables, and array-of-tables whose hierarchy matches
+        a glob-style hierarchy pattern, in the order they appear.
+
+        Args:
+            pattern (str): A glob-style hierarchy pattern.
+
+        Returns:
+            List[`AnyDescriptor`]: A list of `FieldDescriptor`, `TableDescriptor`,
+                and `AoTDescriptor` instances.
+        """
+        matches: List[Tuple[int, AnyDescriptor]] = [
+            indexed
+            for _, descriptors in self._index.match(pattern=pattern)
+            for indexed in descriptors
+        ]
+        matches.sort(key=lambda indexed: indexed[0])
+        return [descriptor for _, descriptor in matches]
+
+
+class LineIndex:
+    """
+    An index of all descriptors of a `TOMLDocumentDescriptor` by line number,
+    used to find the items at a line, or within a range of lines, by binary
+    search.
+
+    Along with each descriptor, the position of the innermost table it appears
+    within is stored, so that the enclosing tables of an item are found by
+    following one position per level.
+
+    The last line of each descriptor is stored as well, being the last line of
+    a styling, or the line that closes an array, and the line of any other
+    item, so that lines not covered by any item, such as those past the end
+    of the document, are found.
+
+    Args:
+        descriptors (Iterable[`AnyDescriptor`]): All descriptors of a
+            `TOMLDocumentDescriptor`, in the order they appear.
+    """
+
+    def __init__(self, descriptors: Iterable[AnyDescriptor]) -> None:
+        self._descriptors: List[AnyDescriptor] = []
+        self._line_numbers: List[int] = []
+
+        # The position of the innermost table each descriptor appears within,
+        # or -1 if it appears within none
+        self._parents: List[int] = []
+
+        # The last line of each descriptor, and the last line of any descriptor
+        # up to and including each position
+        self._end_line_numbers: List[int] = []
+        self._covered_line_numbers: List[int] = []
+
+        # The position of the last table seen with each hierarchy, being the
+        # table that any item seen afterwards with that hierarchy appears in,
+        # and likewise for the last array seen with each hierarchy
+        last_tables: Dict[str, int] = dict()
+        last_arrays: Dict[str, int] = dict()
+
+        # The positions of arrays without any stylings described, which are
+        # taken to end on the line before the next item
+        unstyled_arrays: Set[int] = set()
+        for position, descriptor in enumerate(descriptors):
+            parent = -1
+            hierarchy = _container_hierarchy(descriptor=descriptor)
+            while hierarchy:
+                if hierarchy in last_tables:
+                    parent = last_tables[hierarchy]
+                    break
+                hierarchy = Hierarchy.parent_hierarchy(hierarchy=hierarchy)
+
+            end_line_no = descriptor.line_no
+            if isinstance(descriptor, StyleDescriptor):
+                newlines = descriptor.style.count("\n")
+                end_line_no += max(newlines - 1, 0)
+
+                # An array ends on the line after the last newline within it
+                array_position = last_arrays.get(str(descriptor.hierarchy))
+                if descriptor.parent_type == "array" and array_position is not None:
+                    unstyled_arrays.discard(array_position)
+                    self._end_line_numbers[array_position] = max(
+                        self._end_line_numbers[array_position],
+                        descriptor.line_no + newlines,
+                    )
+            elif descriptor.item_type == "array":
+                last_arrays[str(descriptor.hierarchy)] = position
+                unstyled_arrays.add(position)
+
+            self._descriptors.append(descriptor)
+            self._line_numbers.append(descriptor.line_no)
+            self._end_line_numbers.append(end_line_no)
+            self._parents.append(parent)
+            if isinstance(descriptor, TableDescriptor):
+                last_tables[str(descriptor.hierarchy)] = position
+
+        for array_position in unstyled_arrays:
+            if array_position + 1 < len(self._line_numbers):
+                self._end_line_numbers[array_position] = max(
+                    self._end_line_numbers[array_position],
+                    self._line_numbers[array_position + 1] - 1,
+                )
+
+        for end_line_no in self._end_line_numbers:
+            self._covered_line_numbers.append(
+                max(end_line_no, self._covered_line_numbers[-1])
+                if self._covered_line_numbers
+                else end_line_no
+            )
+
+    def at_line(self, line_no: int) -> Optional[LineLookup]:
+        """
+        Returns the innermost item at a line, along with the tables it appears
+        within. Returns None if no item covers the line, such as a line past
+        the end of the document, or a blank line whose whitespace is not
+        described.
+
+        The innermost item is the last one to start on the closest line at or
+        before the line, where whitespace is only returned if no other item
+        starts on that line. If that item ends before the line, then the last
+        item before it which covers the line is returned instead, such as an
+        array for the line that closes it.
+
+        Args:
+            line_no (int): A line number.
+
+        Returns:
+            `LineLookup` | None: A `LineLookup` instance or None.
+        """
+        position = bisect.bisect_right(self._line_numbers, line_no) - 1
+        if position < 0 or self._covered_line_numbers[position] < line_no:
+            return None
+
+        while self._end_line_numbers[position] < line_no:
+            position -= 1
+
+        closest_line_no = self._line_numbers[position]
+        for other_position in range(position, -1, -1):
+            if self._line_numbers[other_position] != closest_line_no:
+                break
+
+            descriptor = self._descriptors[other_position]
+            if descriptor.item_type != "whitespace":
+                position = other_position
+                break
+
+        tables: List[TableDescriptor] = []
+        parent = self._parents[position]
+        while parent >= 0:
+            tables.append(cast(TableDescriptor, self._descriptors[parent]))
+            parent = self._parents[parent]
+
+        return LineLookup(
+            descriptor=self._descriptors[position], tables=tuple(reversed(tables))
+        )
+
+    def in_range(self, start: int, end: int) -> List[AnyDescriptor]:
+        """
+        Returns all items that start within a range of lines, including both
+        the first and last line, in the order they appear.
+
+        Args:
+            start (int): The first line of the range.
+            end (int): The last line of the range.
+
+        Returns:
+            List[`AnyDescriptor`]: A list of `FieldDescriptor`, `TableDescriptor`,
+                `AoTDescriptor`, and `StyleDescriptor` instances.
+        """
+        if end < start:
+            raise ValueError("The last line must not be before the first line")
+
+        return self._descriptors[
+            bisect.bisect_left(self._line_numbers, start) : bisect.bisect_right(
+                self._line_numbers, end
+            )
+        ]
+
+
+class ValueIndex:
+    """
+    An index of all fields of a `TOMLDocumentDescriptor` by the type of their
+    value, and by the value itself if it can be hashed, used to find fields
+    with a dictionary lookup rather than a walk through every field.
+
+    Values are indexed as unwrapped Python objects, even if the descriptor was
+    built without unwrapping values. A value is indexed along with its type,
+    so that `True` and `1`, which are equal, are kept apart. Arrays cannot be
+    hashed, so are only indexed by type.
+
+    Args:
+        fields (Iterable[`FieldDescriptor`]): All fields of a
+            `TOMLDocumentDescriptor`, in the order they appear.
+    """
+
+    def __init__(self, fields: Iterable[FieldDescriptor]) -> None:
+        self._fields_by_type: Dict[Type[Any], List[FieldDescriptor]] = dict()
+        self._fields_by_value: Dict[Tuple[Type[Any], Any], List[FieldDescriptor]] = (
+            dict()
+        )
+
+        for field in fields:
+            value = _get_unwrapped_value(field=field)
+            value_type = type(value)
+            self._fields_by_type.setdefault(value_type, []).append(field)
+            if isinstance(value, Hashable):
+                self._fields_by_value.setdefault((value_type, value), []).append(field)
+
+    @staticmethod
+    def _fields_within(
+        fields: List[FieldDescriptor], hierarchy: Optional[Hierarchy]
+    ) -> List[FieldDescriptor]:
+        """
+        A private static method which returns the fields that appear within a
+        hierarchy, or all fields if the hierarchy is None.
+        """
+        if hierarchy is None:
+            return list(fields)
+
+        prefix = str(hierarchy) + "."
+        return [field for field in fields if str(field.hierarchy).startswith(prefix)]
+
+    def fields_by_type(
+        self, value_type: Type[Any], hierarchy: Optional[Hierarchy] = None
+    ) -> List[FieldDescriptor]:
+        """
+        Returns all fields whose value is exactly of a type, in the order they
+        appear, optionally only those within a hierarchy.
+
+        Args:
+            value_type (Type[Any]): The type of the value.
+            hierarchy (`Hierarchy` | None): A `Hierarchy` instance. Defaults to
+                None.
+
+        Returns:
+            List[`FieldDescriptor`]: A list of `FieldDescriptor` instances.
+        """
+        return self._fields_within(
+            fields=self._fields_by_type.get(value_type, []), hierarchy=hierarchy
+        )
+
+    def fields_with_value(
+        self, value: Any, hierarchy: Optional[Hierarchy] = None
+    ) -> List[FieldDescriptor]:
+        """
+        Returns all fields whose value is equal to, and of the same type as, a
+        hashable value, in the order they appear, optionally only those within
+        a hierarchy.
+
+        Args:
+            value (Any): A hashable value.
+            hierarchy (`Hierarchy` | None): A `Hierarchy` instance. Defaults to
+                None.
+
+        Returns:
+            List[`FieldDescriptor`]: A list of `FieldDescriptor` instances.
+        """
+        if not isinstance(value, Hashable):
+            raise TypeError(
+                f"Expected a hashable value, but got {type(value).__name__}"
+            )
+
+        return self._fields_within(
+            fields=self._fields_by_value.get((type(value), value), []),
+            hierarchy=hierarchy,
+        )
+
+
+class CommentIndex:
+    """
+    An index of all comments of a `TOMLDocumentDescriptor`, collected in a
+    single pass over its descriptors, used to search comments by the start of
+    their text or by a regular expression.
+
+    The text of each comment is also kept in sorted order, so that all
+    comments whose text starts with a prefix are found by binary search.
+
+    Args:
+        descriptors (Iterable[`AnyDescriptor`]): All descriptors of a
+            `TOMLDocumentDescriptor`, in the order they appear.
+    """
+
+    def __init__(self, descriptors: Iterable[AnyDescriptor]) -> None:
+        entries: List[CommentEntry] = []
+        for descriptor in descriptors:
+            comment_entry = _get_comment_entry(descriptor=descriptor)
+            if comment_entry is not None:
+                entries.append(comment_entry)
+
+        # The comment after a multi-line array is on its last line, so may come
+        # after comments that were collected later
+        entries.sort(key=lambda entry: entry.line_no)
+        self._entries = entries
+
+        # The text of each comment, with its position, in sorted order
+        self._sorted_texts: List[Tuple[str, int]] = sorted(
+            (entry.text, position) for position, entry in enumerate(entries)
+        )
+
+    def _entries_within(
+        self, positions: Iterable[int], hierarchy: Optional[Hierarchy]
+    ) -> List[CommentEntry]:
+        """
+        A private method which returns the entries at the positions, in the
+        order they appear, that belong to a hierarchy or any hierarchy within
+        it. All entries are returned if the hierarchy is None.
+        """
+        entries = [self._entries[position] for position in sorted(positions)]
+        if hierarchy is None:
+            return entries
+
+        hierarchy_str = str(hierarchy)
+        prefix = hierarchy_str + "."
+        return [
+            entry
+            for entry in entries
+            if entry.hierarchy is not None
+            and (
+                str(entry.hierarchy) == hierarchy_str
+                or str(entry.hierarchy).startswith(prefix)
+            )
+        ]
+
+    def with_prefix(
+        self, prefix: str, hierarchy: Optional[Hierarchy] = None
+    ) -> List[CommentEntry]:
+        """
+        Returns all comments whose text starts with a prefix, in the order they
+        appear, optionally only those within a hierarchy.
+
+        Args:
+            prefix (str): The start of the text of the comments.
+            hierarchy (`Hierarchy` | None): A `Hierarchy` instance. Defaults to
+                None.
+
+        Returns:
+            List[`CommentEntry`]: A list of `CommentEntry` instances.
+        """
+        start = bisect.bisect_left(self._sorted_texts, (prefix, -1))
+        positions: List[int] = []
+        for text, position in self._sorted_texts[start:]:
+            if not text.startswith(prefix):
+                break
+            positions.append(position)
+
+        return self._entries_within(positions=positions, hierarchy=hierarchy)
+
+    def search(
+        self, pattern: Union[str, Pattern[str]], hierarchy: Optional[Hierarchy] = None
+    ) -> List[CommentEntry]:
+        """
+        Returns all comments, as written, in which a regular expression matches
+        anywhere, in the order they appear, optionally only those within a
+        hierarchy.
+
+        Args:
+            pattern (str | `re.Pattern`): A regular expression.
+            hierarchy (`Hierarchy` | None): A `Hierarchy` instance. Defaults to
+                None.
+
+        Returns:
+            List[`CommentEntry`]: A list of `CommentEntry` instances.
+        """
+        search = re.compile(pattern).search
+        return self._entries_within(
+            positions=(
+                position
+                for position, entry in enumerate(self._entries)
+                if search(entry.comment)
+            ),
+            hierarchy=hierarchy,
+        )
+
+
+@dataclass
+class IndexedContainer:
+    """
+    A dataclass representing a structure within a `LevelIndex` that can hold
+    fields or comments, being the top-level space, a table, an inline table, a
+    table of an array-of-tables, or an array-of-tables itself.
+
+    Attributes:
+        descriptor (`TableDescriptor` | `AoTDescriptor` | None): The descriptor
+            of the structure, or None for the top-level space.
+        fields (Dict[str, `FieldDescriptor`]): The fields directly within the
+            structure, by string hierarchy.
+        comments (List[`CommentEntry`]): The comments within the structure,
+            including those after its fields and those within its arrays.
+    """
+
+    __slots__ = ("descriptor", "fields", "comments")
+
+    descriptor: Optional[Union[TableDescriptor, AoTDescriptor]]
+    fields: Dict[str, FieldDescriptor]
+    comments: List[CommentEntry]
+
+
+# The key of an IndexedContainer, being the type of the structure, its string
+# hierarchy, and its position amongst all structures of that type and hierarchy
+ContainerKey = Tuple[str, str, int]
+
+
+@dataclass
+class IndexedLevel:
+    """
+    A dataclass representing all structures within a `LevelIndex` whose
+    hierarchy starts with the same first level, along with a digest of their
+    contents.
+
+    Attributes:
+        containers (Dict[`ContainerKey`, `IndexedContainer`]): The structures
+            of the level, by key, in the order they appear.
+        digest (bytes): A digest of the fields, values, and comments of all
+            structures of the level, excluding line numbers.
+    """
+
+    __slots__ = ("containers", "digest")
+
+    containers: Dict[ContainerKey, IndexedContainer]
+    digest: bytes
+
+
+class LevelIndex:
+    """
+    An index of all structures of a `TOMLDocumentDescriptor`, grouped by the
+    first level of their hierarchy, in the same way as the levels that a live
+    descriptor updates. The top-level space is grouped under a level of None.
+
+    Each level has a digest of its contents, so that two levels with the same
+    digest can be treated as identical without comparing their structures.
+
+    Args:
+        descriptors (Iterable[`AnyDescriptor`]): All descriptors of a
+            `TOMLDocumentDescriptor`, in the order they appear.
+    """
+
+    def __init__(self, descriptors: Iterable[AnyDescriptor]) -> None:
+        document = IndexedContainer(descriptor=None, fields=dict(), comments=[])
+        containers_by_level: Dict[
+            Optional[str], Dict[ContainerKey, IndexedContainer]
+        ] = {None: {("document", str(), 0): document}}
+
+        # The number of structures seen of each type and hierarchy, and the last
+        # table seen with each hierarchy, which holds any fields and comments
+        # with that hierarchy seen afterwards
+        occurrences: Dict[Tuple[str, str], int] = dict()
+        last_tables: Dict[str, IndexedContainer] = dict()
+
+        def find_container(hierarchy: str) -> IndexedContainer:
+            while hierarchy:
+                if hierarchy in last_tables:
+                    return last_tables[hierarchy]
+                hierarchy = Hierarchy.parent_hierarchy(hierarchy=hierarchy)
+
+            return document
+
+        for descriptor in descriptors:
+            if isinstance(descriptor, (TableDescriptor, AoTDescriptor)):
+                hierarchy = str(descriptor.hierarchy)
+                occurrence = occurrences.get((descriptor.item_type, hierarchy), 0)
+                occurrences[(descriptor.item_type, hierarchy)] = occurrence + 1
+
+                container = IndexedContainer(
+                    descriptor=descriptor, fields=dict(), comments=[]
+                )
+                containers_by_level.setdefault(hierarchy.split(".")[0], dict())[
+                    (descriptor.item_type, hierarchy, occurrence)
+                ] = container
+                if isinstance(descriptor, TableDescriptor):
+                    last_tables[hierarchy] = container
+            elif isinstance(descriptor, FieldDescriptor):
+                container = find_container(
+                    hierarchy=Hierarchy.parent_hierarchy(
+                        hierarchy=str(descriptor.hierarchy)
+                    )
+                )
+                container.fields[str(descriptor.hierarchy)] = descriptor
+            else:
+                style_hierarchy = descriptor.hierarchy
+                container = find_container(
+                    hierarchy=str(style_hierarchy) if style_hierarchy else str()
+                )
+
+            comment_entry = _get_comment_entry(descriptor=descriptor)
+            if comment_entry is not None:
+                container.comments.append(comment_entry)
+
+        self.levels: Dict[Optional[str], IndexedLevel] = {
+            level: IndexedLevel(
+                containers=containers, digest=self._get_digest(containers=containers)
+            )
+            for level, containers in containers_by_level.items()
+        }
+
+    @staticmethod
+    def _get_digest(containers: Dict[ContainerKey, IndexedContainer]) -> bytes:
+        """
+        A private static method which returns a digest of the keys, field hierarchies,
+        unwrapped values, and comments of the structures of a level.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for key, container in containers.items():
+            digest.update(repr(key).encode())
+            for hierarchy, field in container.fields.items():
+                digest.update(
+                    repr((hierarchy, _get_unwrapped_value(field=field))).encode()
+                )
+
+            for comment_entry in container.comments:
+                digest.update(
+                    repr((str(comment_entry.hierarchy), comment_entry.comment)).encode()
+                )
+
+        return digest.digest()
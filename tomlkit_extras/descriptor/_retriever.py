@@ -1,5 +1,6 @@
+import heapq
 import itertools
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union, cast
 
 from tomlkit_extras._exceptions import (
     InvalidArrayOfTablesError,
@@ -10,6 +11,7 @@ from tomlkit_extras._exceptions import (
 from tomlkit_extras._hierarchy import Hierarchy, standardize_hierarchy
 from tomlkit_extras._typing import StyleItem, TOMLHierarchy, TopLevelItem
 from tomlkit_extras.descriptor._descriptors import (
+    AnyDescriptor,
     AoTDescriptor,
     AoTDescriptors,
     FieldDescriptor,
@@ -19,6 +21,23 @@ from tomlkit_extras.descriptor._descriptors import (
 )
 from tomlkit_extras.descriptor._store import DescriptorStore
 
+# An item reached while walking through a store, being either a descriptor or
+# all array-of-tables of a hierarchy
+_WalkItem = Union[AnyDescriptor, AoTDescriptors]
+
+
+def _table_line_no(table: TableDescriptor) -> int:
+    """A private function which returns the line number of a table."""
+    return table.line_no
+
+
+def _aots_line_no(array_of_tables: AoTDescriptors) -> int:
+    """
+    A private function which returns the line number of the first array of an
+    `AoTDescriptors` instance.
+    """
+    return array_of_tables.aots[0].line_no
+
 
 class DescriptorRetriever:
     """
@@ -37,6 +56,10 @@ class DescriptorRetriever:
     Within an array-of-tables:
     - fields (including arrays)
     - tables (including inline tables)
+
+    Iterators are also provided, that lazily yield all fields, tables,
+    array-of-tables, or stylings, whether or not they are within an
+    array-of-tables, in the order they appear in the TOML source.
     """
 
     def __init__(
@@ -144,7 +167,7 @@ class DescriptorRetriever:
             raise InvalidHierarchyError(
                 "Hierarchy does not exist in set of valid hierarchies",
                 hierarchy_obj,
-                self._store.tables.hierarchies,
+                self._store.tables.hierarchy_index,
             )
 
         return self._store.tables.get(hierarchy=hierarchy_as_str)
@@ -184,7 +207,7 @@ class DescriptorRetriever:
                 raise InvalidHierarchyError(
                     "Hierarchy does not exist in set of valid hierarchies",
                     hierarchy_obj,
-                    self._store.tables.hierarchies,
+                    self._store.tables.hierarchy_index,
                 )
 
             # Retrieve the TableDescriptor instance from the table store
@@ -222,7 +245,7 @@ class DescriptorRetriever:
             raise InvalidArrayOfTablesError(
                 "Hierarchy does not map to an existing array of tables",
                 hierarchy_obj,
-                self._store.array_of_tables.hierarchies,
+                self._store.array_of_tables.hierarchy_index,
             )
 
         array_of_tables: AoTDescriptors = self._store.array_of_tables.get(
@@ -239,15 +262,17 @@ class DescriptorRetriever:
         """
         # There is a need to identify the part of the hierarchy that
         # corresponds to the array-of-tables
-        longest_hierarchy = hierarchy_obj.longest_ancestor_hierarchy(
-            hierarchies=self._store.array_of_tables.hierarchies
+        longest_hierarchy = (
+            self._store.array_of_tables.hierarchy_index.longest_ancestor(
+                hierarchy=hierarchy_obj
+            )
         )
 
         if longest_hierarchy is None:
             raise InvalidHierarchyError(
                 "Hierarchy does not exist in set of valid hierarchies",
                 hierarchy_obj,
-                self._store.array_of_tables.hierarchies,
+                self._store.array_of_tables.hierarchy_index,
             )
 
         # Grab all AoTDescriptor instances from the retrieved array
@@ -334,3 +359,176 @@ class DescriptorRetriever:
             )
 
         return field_descriptors
+
+    def _walk(
+        self,
+        descriptor_types: Tuple[Type[AnyDescriptor], ...],
+        styling: Optional[StyleItem] = None,
+    ) -> Iterator[AnyDescriptor]:
+        """
+        Private method that lazily yields all descriptors of the given types, in
+        the order they appear in the TOML source.
+
+        The fields and stylings of each table, the tables of each
+        array-of-tables, and the tables and array-of-tables of the stores, are
+        each already in order of line number. These streams are merged with a
+        heap holding only the next descriptor of each stream, where the streams
+        within a descriptor are only added once the descriptor is reached.
+        """
+        walks_stylings = StyleDescriptor in descriptor_types
+        walks_contents = walks_stylings or FieldDescriptor in descriptor_types
+        walks_tables = walks_contents or TableDescriptor in descriptor_types
+
+        # Each entry is the line number of an item, a sequence number to break
+        # ties, the item, and the stream the item was taken from
+        heap: List[Tuple[int, int, _WalkItem, Iterator[_WalkItem]]] = []
+        counter = itertools.count()
+
+        def push(stream: Iterator[_WalkItem]) -> None:
+            for walk_item in stream:
+                line_no = (
+                    _aots_line_no(array_of_tables=walk_item)
+                    if isinstance(walk_item, AoTDescriptors)
+                    else walk_item.line_no
+                )
+                heapq.heappush(heap, (line_no, next(counter), walk_item, stream))
+                return
+
+        def push_stylings(stylings: StylingDescriptors) -> None:
+            if styling != "whitespace":
+                for comments in stylings.comments.values():
+                    push(stream=iter(comments))
+
+            if styling != "comment":
+                for whitespace in stylings.whitespace.values():
+                    push(stream=iter(whitespace))
+
+        def push_contents(
+            fields: Dict[str, FieldDescriptor], stylings: StylingDescriptors
+        ) -> None:
+            push(stream=iter(fields.values()))
+            if walks_stylings:
+                push_stylings(stylings=stylings)
+
+        if walks_contents:
+            push_contents(
+                fields=self._store.document._document_fields,
+                stylings=self._store.document._document_stylings,
+            )
+
+        if walks_tables:
+            push(
+                stream=self._store.tables.hierarchy_index.ordered_values(
+                    key=_table_line_no
+                )
+            )
+
+        push(
+            stream=self._store.array_of_tables.hierarchy_index.ordered_values(
+                key=_aots_line_no
+            )
+        )
+
+        while heap:
+            _, _, walk_item, stream = heapq.heappop(heap)
+            push(stream=stream)
+
+            # The type is checked directly, as descriptors are abstract classes
+            # for which isinstance checks are slower
+            walk_item_type = type(walk_item)
+            if walk_item_type is AoTDescriptors:
+                push(stream=iter(cast(AoTDescriptors, walk_item).aots))
+                continue
+            elif walk_item_type is AoTDescriptor and walks_tables:
+                for tables in cast(AoTDescriptor, walk_item).tables.values():
+                    push(stream=iter(tables))
+            elif walk_item_type is TableDescriptor and walks_contents:
+                table = cast(TableDescriptor, walk_item)
+                push_contents(fields=table.fields, stylings=table.stylings)
+            elif walk_item_type is FieldDescriptor and walks_stylings:
+                push_stylings(stylings=cast(FieldDescriptor, walk_item).stylings)
+
+            if walk_item_type in descriptor_types:
+                yield cast(AnyDescriptor, walk_item)
+
+    def iter_fields(self) -> Iterator[FieldDescriptor]:
+        """
+        Returns an iterator of all fields, including arrays and those within an
+        array-of-tables, where each field is represented by a `FieldDescriptor`
+        object, in the order they appear in the TOML source.
+
+        Returns:
+            Iterator[`FieldDescriptor`]: An iterator of `FieldDescriptor` instances.
+        """
+        return cast(
+            Iterator[FieldDescriptor], self._walk(descriptor_types=(FieldDescriptor,))
+        )
+
+    def iter_tables(self) -> Iterator[TableDescriptor]:
+        """
+        Returns an iterator of all tables, including inline tables and those
+        within an array-of-tables, where each table is represented by a
+        `TableDescriptor` object, in the order they appear in the TOML source.
+
+        Returns:
+            Iterator[`TableDescriptor`]: An iterator of `TableDescriptor` instances.
+        """
+        return cast(
+            Iterator[TableDescriptor], self._walk(descriptor_types=(TableDescriptor,))
+        )
+
+    def iter_aots(self) -> Iterator[AoTDescriptor]:
+        """
+        Returns an iterator of all array-of-tables, where each array is
+        represented by a `AoTDescriptor` object, in the order they appear in the
+        TOML source.
+
+        Returns:
+            Iterator[`AoTDescriptor`]: An iterator of `AoTDescriptor` instances.
+        """
+        return cast(
+            Iterator[AoTDescriptor], self._walk(descriptor_types=(AoTDescriptor,))
+        )
+
+    def iter_stylings(self, styling: Optional[StyleItem]) -> Iterator[StyleDescriptor]:
+        """
+        Returns an iterator of all stylings (comments or whitespace), where each
+        styling is represented by a `StyleDescriptor` object, in the order they
+        appear in the TOML source.
+
+        If "whitespace" is passed only whitespace stylings will be yielded. If
+        "comment" is passed only comment stylings will be yielded. If it is None,
+        then all stylings will be yielded.
+
+        Args:
+            styling (`StyleItem` | None): A literal that identifies the type of
+                styling to yield. Can be either "whitespace" or "comment".
+                Alternatively, this is an optional parameter and can be None.
+
+        Returns:
+            Iterator[`StyleDescriptor`]: An iterator of `StyleDescriptor` instances.
+        """
+        return cast(
+            Iterator[StyleDescriptor],
+            self._walk(descriptor_types=(StyleDescriptor,), styling=styling),
+        )
+
+    def walk(self) -> Iterator[AnyDescriptor]:
+        """
+        Returns an iterator of all fields, tables, array-of-tables, and stylings,
+        in the order they appear in the TOML source. Each table and
+        array-of-tables comes before the items within it.
+
+        Returns:
+            Iterator[`AnyDescriptor`]: An iterator of `FieldDescriptor`,
+                `TableDescriptor`, `AoTDescriptor`, and `StyleDescriptor`
+                instances.
+        """
+        return self._walk(
+            descriptor_types=(
+                FieldDescriptor,
+                TableDescriptor,
+                AoTDescriptor,
+                StyleDescriptor,
+            )
+        )
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from tomlkit import TOMLDocument, items
+from tomlkit.container import OutOfOrderTableProxy
+
+from tomlkit_extras._hierarchy import Hierarchy
+from tomlkit_extras._typing import BodyContainerInOrder, DescriptorInput
+from tomlkit_extras._utils import decompose_body_item, get_container_body
+from tomlkit_extras.descriptor._types import TOMLStatistics
+from tomlkit_extras.toml._out_of_order import OutOfOrderTableView
+
+
+class TOMLSourceStatistics(TOMLStatistics):
+    """
+    A sub-class of `TOMLStatistics` returned by `collect_statistics`, which,
+    in addition to the number of each type of structure, keeps track of where
+    fields and tables appear and how large the values are.
+
+    The depth of a field or table is the number of levels in its hierarchy, in
+    the same way as for the items of a `TOMLDocumentDescriptor`. Fields are
+    counted in the same way as for `number_of_fields`, so arrays and inline
+    tables are not counted as fields.
+
+    Attributes:
+        fields_per_depth (Dict[int, int]): The number of fields at each depth.
+        tables_per_depth (Dict[int, int]): The number of tables, including
+            inline tables and tables in arrays of tables, at each depth.
+        fields_per_table (Dict[str, int]): The number of fields directly within
+            each table and inline table, by hierarchy. The fields of all tables
+            in an array of tables are counted under the same hierarchy.
+        value_bytes (int): The total size in bytes, encoded as UTF-8, of all
+            values other than tables and arrays, as written in the TOML source.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fields_per_depth: Dict[int, int] = dict()
+        self.tables_per_depth: Dict[int, int] = dict()
+        self.fields_per_table: Dict[str, int] = dict()
+        self.value_bytes = 0
+
+    def merge(self, toml_statistics: TOMLStatistics) -> None:
+        """
+        Given another `TOMLStatistics` instance, will add each of its counts
+        to the counts of this instance. If a `TOMLSourceStatistics` instance,
+        then the counts per depth and per table, and the size of all values,
+        are added as well.
+        """
+        super().merge(toml_statistics=toml_statistics)
+        if isinstance(toml_statistics, TOMLSourceStatistics):
+            for counts, other_counts in (
+                (self.fields_per_depth, toml_statistics.fields_per_depth),
+                (self.tables_per_depth, toml_statistics.tables_per_depth),
+            ):
+                for depth, count in other_counts.items():
+                    counts[depth] = counts.get(depth, 0) + count
+
+            for hierarchy, count in toml_statistics.fields_per_table.items():
+                self.fields_per_table[hierarchy] = (
+                    self.fields_per_table.get(hierarchy, 0) + count
+                )
+
+            self.value_bytes += toml_statistics.value_bytes
+
+    def _add_table_at(self, hierarchy: str) -> None:
+        """
+        Private method which counts a table, or inline table, at a hierarchy
+        towards the number of tables at its depth.
+        """
+        depth = hierarchy.count(".") + 1 if hierarchy else 0
+        self.tables_per_depth[depth] = self.tables_per_depth.get(depth, 0) + 1
+        self.fields_per_table.setdefault(hierarchy, 0)
+
+
+def collect_statistics(toml_source: DescriptorInput) -> TOMLSourceStatistics:
+    """
+    Collects the same summary statistics as a `TOMLDocumentDescriptor`, along
+    with the number of fields and tables at each depth, the number of fields
+    in each table, and the size of all values, without creating any
+    descriptors.
+
+    The TOML source is walked once, with an explicit stack rather than
+    recursion, and a hierarchy is only created for each table, inline table,
+    array, and array of tables, not for each field.
+
+    Args:
+        toml_source (`DescriptorInput`): A `tomlkit` type of either
+            `tomlkit.TOMLDocument`, `tomlkit.items.Table`, `tomlkit.items.AoT`,
+            `tomlkit.items.Array`, or `tomlkit.container.OutOfOrderTableProxy`.
+
+    Returns:
+        `TOMLSourceStatistics`: A `TOMLSourceStatistics` instance.
+    """
+    toml_statistics = TOMLSourceStatistics()
+
+    # Each container still to be walked, along with its hierarchy
+    stack: List[Tuple[BodyContainerInOrder, str]] = []
+
+    # As with a TOMLDocumentDescriptor, a table passed in is not counted itself,
+    # but the tables of an array of tables passed in are
+    if isinstance(toml_source, OutOfOrderTableProxy):
+        out_of_order_table = OutOfOrderTableView.from_proxy(table=toml_source)
+        hierarchy = out_of_order_table.parent.name or str()
+        toml_statistics.fields_per_table.setdefault(hierarchy, 0)
+        stack.extend((table, hierarchy) for table in out_of_order_table.components)
+    elif isinstance(toml_source, items.AoT):
+        hierarchy = toml_source.name or str()
+        for table in toml_source.body:
+            toml_statistics.add_table(table=table)
+            toml_statistics._add_table_at(hierarchy=hierarchy)
+            stack.append((table, hierarchy))
+    elif isinstance(toml_source, items.Table):
+        hierarchy = toml_source.name or str()
+        toml_statistics.fields_per_table.setdefault(hierarchy, 0)
+        stack.append((toml_source, hierarchy))
+    elif isinstance(toml_source, (TOMLDocument, items.Array)):
+        stack.append((toml_source, str()))
+    else:
+        raise TypeError(
+            "Expected an instance of DescriptorInput, but got "
+            f"{type(toml_source).__name__}"
+        )
+
+    while stack:
+        container, hierarchy = stack.pop()
+        depth = hierarchy.count(".") + 1 if hierarchy else 0
+        is_array = isinstance(container, items.Array)
+        is_table = isinstance(container, items.InlineTable) or (
+            isinstance(container, items.Table) and not container.is_super_table()
+        )
+
+        for body_item in get_container_body(toml_source=container):
+            toml_item = body_item[1]
+
+            # Stylings and values are checked first, as they make up most of
+            # the items in a TOML source. A value within an array is not a field
+            if isinstance(toml_item, (items.Comment, items.Whitespace)):
+                toml_statistics.add_comment(item=toml_item)
+                continue
+            elif not isinstance(
+                toml_item, (items.Array, items.InlineTable, items.AoT, items.Table)
+            ):
+                toml_statistics.value_bytes += len(toml_item.as_string().encode())
+                if not is_array:
+                    toml_statistics.add_field(item=toml_item)
+                    toml_statistics.fields_per_depth[depth + 1] = (
+                        toml_statistics.fields_per_depth.get(depth + 1, 0) + 1
+                    )
+                    if is_table:
+                        toml_statistics.fields_per_table[hierarchy] = (
+                            toml_statistics.fields_per_table.get(hierarchy, 0) + 1
+                        )
+                continue
+
+            item_key = decompose_body_item(body_item=body_item)[0]
+            item_hierarchy = Hierarchy.create_hierarchy(
+                hierarchy=hierarchy, attribute=item_key or str()
+            )
+
+            if isinstance(toml_item, items.Array):
+                toml_statistics.add_array(item=toml_item)
+                stack.append((toml_item, item_hierarchy))
+            elif isinstance(toml_item, items.InlineTable):
+                toml_statistics.add_inline_table(table=toml_item)
+                toml_statistics._add_table_at(hierarchy=item_hierarchy)
+                stack.append((toml_item, item_hierarchy))
+            elif isinstance(toml_item, items.AoT) and not is_array:
+                toml_statistics.add_aot()
+                for table in toml_item.body:
+                    toml_statistics.add_table(table=table)
+                    toml_statistics._add_table_at(hierarchy=item_hierarchy)
+                    stack.append((table, item_hierarchy))
+            elif isinstance(toml_item, items.Table) and not is_array:
+                toml_statistics.add_table(table=toml_item)
+                if not toml_item.is_super_table():
+                    toml_statistics._add_table_at(hierarchy=item_hierarchy)
+                stack.append((toml_item, item_hierarchy))
+
+    return toml_statistics
@@ -1,10 +1,12 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Set, cast
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from tomlkit import items
 
+from tomlkit_extras._hierarchy import HierarchyTrie
 from tomlkit_extras._typing import Item, Stylings, Table, TOMLHierarchy
-from tomlkit_extras._utils import standardize_hierarchy
 from tomlkit_extras.descriptor._descriptors import (
     AoTDescriptor,
     AoTDescriptors,
@@ -13,7 +15,7 @@ from tomlkit_extras.descriptor._descriptors import (
     TableDescriptor,
 )
 from tomlkit_extras.descriptor._helpers import LineCounter, item_is_table
-from tomlkit_extras.descriptor._types import ItemInfo
+from tomlkit_extras.descriptor._types import ItemInfo, ItemPosition
 
 
 class BaseStore(ABC):
@@ -67,6 +69,11 @@ class BaseTableStore(BaseStore):
     def hierarchies(self) -> Set[str]:
         pass
 
+    @property
+    @abstractmethod
+    def hierarchy_index(self) -> HierarchyTrie[Any]:
+        pass
+
     @abstractmethod
     def add_table(self, hierarchy: str, table: Table, info: ItemInfo) -> None:
         pass
@@ -79,8 +86,9 @@ class DocumentStore(BaseStore):
     functionality is included to retrieve information from the store.
     """
 
-    def __init__(self, line_counter: LineCounter) -> None:
+    def __init__(self, line_counter: LineCounter, unwrap_values: bool) -> None:
         self._line_counter = line_counter
+        self._unwrap_values = unwrap_values
         self._document_fields: Dict[str, FieldDescriptor] = dict()
         self._document_stylings: StylingDescriptors = StylingDescriptors(
             comments=dict(), whitespace=dict()
@@ -133,7 +141,10 @@ class DocumentStore(BaseStore):
             info (`ItemInfo`): An `ItemInfo` instance with basic info on the field.
         """
         field_descriptor: FieldDescriptor = FieldDescriptor._from_toml_item(
-            item=item, info=info, line_no=self._line_counter.line_no
+            item=item,
+            info=info,
+            line_no=self._line_counter.line_no,
+            unwrap_value=self._unwrap_values,
         )
         self.field_descriptor = field_descriptor
         self._document_fields[info.key] = field_descriptor
@@ -156,6 +167,40 @@ class DocumentStore(BaseStore):
             styling_positions = self.field_descriptor.stylings
         return styling_positions
 
+    def shift(self, line_offset: int, position_offset: ItemPosition) -> None:
+        """
+        Shifts the line numbers and the positions of all fields and stylings in
+        the store, for when the items before them in the document changed.
+
+        Args:
+            line_offset (int): The number of lines to shift each line number by.
+            position_offset (`ItemPosition`): An `ItemPosition` instance, with the
+                number of attributes and items to offset each position by.
+        """
+        for field_descriptor in self._document_fields.values():
+            field_descriptor._shift_line_numbers(line_offset=line_offset)
+            field_descriptor._offset_position(offset=position_offset)
+
+        self._document_stylings._shift_line_numbers(line_offset=line_offset)
+        for style_descriptor in self._document_stylings.get_stylings():
+            style_descriptor._offset_position(offset=position_offset)
+
+    def merge(self, store: DocumentStore) -> None:
+        """
+        Adds all fields and stylings from another `DocumentStore` instance, built
+        from items that follow those already processed.
+
+        Args:
+            store (`DocumentStore`): A `DocumentStore` instance.
+        """
+        self._document_fields.update(store._document_fields)
+        self._document_stylings._merge(stylings=store._document_stylings)
+
+    def clear(self) -> None:
+        """Removes all fields and stylings from the store."""
+        self._document_fields = dict()
+        self._document_stylings = StylingDescriptors(comments=dict(), whitespace=dict())
+
 
 class ArrayOfTablesStore(BaseTableStore):
     """
@@ -165,9 +210,10 @@ class ArrayOfTablesStore(BaseTableStore):
     from the store.
     """
 
-    def __init__(self, line_counter: LineCounter) -> None:
+    def __init__(self, line_counter: LineCounter, unwrap_values: bool) -> None:
         self._line_counter = line_counter
-        self._array_of_tables: Dict[str, AoTDescriptors] = dict()
+        self._unwrap_values = unwrap_values
+        self._array_of_tables: HierarchyTrie[AoTDescriptors] = HierarchyTrie()
 
         # For faster access, a second dictionary ise used to store the
         # most recent TableDescriptor object created for a given hierarchy
@@ -179,7 +225,15 @@ class ArrayOfTablesStore(BaseTableStore):
         Returns a set of hierarchies corresponding to all array of tables that have
         been processed.
         """
-        return set(self._array_of_tables.keys())
+        return self._array_of_tables.hierarchies()
+
+    @property
+    def hierarchy_index(self) -> HierarchyTrie[AoTDescriptors]:
+        """
+        Returns a `HierarchyTrie` instance mapping the hierarchies of all array of
+        tables that have been processed to `AoTDescriptors` instances.
+        """
+        return self._array_of_tables
 
     def get(self, hierarchy: str) -> AoTDescriptors:
         """
@@ -206,7 +260,7 @@ class ArrayOfTablesStore(BaseTableStore):
         Returns:
             bool: A boolean indicating whether the hierarchy exists.
         """
-        return hierarchy in self.hierarchies
+        return hierarchy in self._array_of_tables
 
     def append(self, hierarchy: str, array_of_tables: AoTDescriptor) -> None:
         """
@@ -228,7 +282,7 @@ class ArrayOfTablesStore(BaseTableStore):
         else:
             self._array_of_tables[hierarchy].update_arrays(array=array_of_tables)
 
-    def _get_array_hierarchy(self, hierarchy: TOMLHierarchy) -> str:
+    def _get_array_hierarchy(self, hierarchy: TOMLHierarchy) -> Optional[str]:
         """
         Given a `TOMLHierarchy` instance representing a TOML hierarchy, will return
         the longest ancestor hierarchy that exists in the store. This effectively
@@ -238,12 +292,10 @@ class ArrayOfTablesStore(BaseTableStore):
             hierarchy (`TOMLHierarchy`): A `TOMLHierarchy` instance.
 
         Returns:
-            str: Returns a string hierarchy where a match was found.
+            str | None: Returns a string hierarchy where a match was found, or
+                None if there is no match.
         """
-        hierarchy_obj = standardize_hierarchy(hierarchy=hierarchy)
-        return cast(
-            str, hierarchy_obj.longest_ancestor_hierarchy(hierarchies=self.hierarchies)
-        )
+        return self._array_of_tables.longest_ancestor(hierarchy=hierarchy)
 
     def _get_aot_table(self, hierarchy: str) -> TableDescriptor:
         """
@@ -271,7 +323,10 @@ class ArrayOfTablesStore(BaseTableStore):
         """
         table: TableDescriptor = self._get_aot_table(hierarchy=info.hierarchy)
         field_desctiptor: FieldDescriptor = table._add_field(
-            item=item, info=info, line_no=self._line_counter.line_no
+            item=item,
+            info=info,
+            line_no=self._line_counter.line_no,
+            unwrap_value=self._unwrap_values,
         )
         self.field_descriptor = field_desctiptor
 
@@ -288,6 +343,7 @@ class ArrayOfTablesStore(BaseTableStore):
             info (`ItemInfo`): An `ItemInfo` instance with basic info on the table.
         """
         array_hierarchy = self._get_array_hierarchy(hierarchy=hierarchy)
+        assert array_hierarchy is not None, "table must be within an array of tables"
         array_of_tables = self._array_of_tables[array_hierarchy]
 
         table_descriptor = TableDescriptor._from_table_item(
@@ -321,6 +377,62 @@ class ArrayOfTablesStore(BaseTableStore):
             styling_descriptors = self.field_descriptor.stylings
         return styling_descriptors
 
+    def shift(self, line_offset: int, position_offset: ItemPosition) -> None:
+        """
+        Shifts the line numbers of all array of tables in the store, and the
+        positions of those in the top-level space of the document, for when the
+        items before them in the document changed.
+
+        Args:
+            line_offset (int): The number of lines to shift each line number by.
+            position_offset (`ItemPosition`): An `ItemPosition` instance, with the
+                number of attributes and items to offset each position by.
+        """
+        for array_of_tables in self._array_of_tables.values():
+            for array in array_of_tables.aots:
+                array._shift_line_numbers(line_offset=line_offset)
+                if array.parent_type == "document":
+                    array._offset_position(offset=position_offset)
+
+    def merge(self, store: ArrayOfTablesStore) -> None:
+        """
+        Adds all array of tables from another `ArrayOfTablesStore` instance, built
+        from items that follow those already processed.
+
+        Args:
+            store (`ArrayOfTablesStore`): An `ArrayOfTablesStore` instance.
+        """
+        for hierarchy, array_of_tables in store._array_of_tables.items():
+            for array in array_of_tables.aots:
+                self.append(hierarchy=hierarchy, array_of_tables=array)
+
+        self._table_checkpoints.update(store._table_checkpoints)
+
+    def replace_level(self, level: str, stores: List[ArrayOfTablesStore]) -> None:
+        """
+        Replaces all array of tables whose hierarchy starts with `level` with
+        those of other `ArrayOfTablesStore` instances, in the order the stores
+        are given.
+
+        The table checkpoints are left as is, as they are only used while items
+        are being parsed.
+
+        Args:
+            level (str): The first level of the hierarchies to replace.
+            stores (List[`ArrayOfTablesStore`]): A list of `ArrayOfTablesStore`
+                instances.
+        """
+        arrays: HierarchyTrie[AoTDescriptors] = HierarchyTrie()
+        for store in stores:
+            for hierarchy, array_of_tables in store._array_of_tables.items():
+                existing_arrays = arrays.get(hierarchy)
+                if existing_arrays is None:
+                    arrays[hierarchy] = AoTDescriptors(aots=list(array_of_tables.aots))
+                else:
+                    existing_arrays.aots.extend(array_of_tables.aots)
+
+        self._array_of_tables.replace_level(level=level, trie=arrays)
+
 
 class TableStore(BaseTableStore):
     """
@@ -330,9 +442,10 @@ class TableStore(BaseTableStore):
     is included to retrieve information from the store.
     """
 
-    def __init__(self, line_counter: LineCounter) -> None:
+    def __init__(self, line_counter: LineCounter, unwrap_values: bool) -> None:
         self._line_counter = line_counter
-        self._tables: Dict[str, TableDescriptor] = dict()
+        self._unwrap_values = unwrap_values
+        self._tables: HierarchyTrie[TableDescriptor] = HierarchyTrie()
 
     @property
     def hierarchies(self) -> Set[str]:
@@ -340,7 +453,15 @@ class TableStore(BaseTableStore):
         Returns a set of hierarchies corresponding to all tables that do not appear
         in any array of tables structures.
         """
-        return set(self._tables.keys())
+        return self._tables.hierarchies()
+
+    @property
+    def hierarchy_index(self) -> HierarchyTrie[TableDescriptor]:
+        """
+        Returns a `HierarchyTrie` instance mapping the hierarchies of all tables
+        that do not appear in any array of tables to `TableDescriptor` instances.
+        """
+        return self._tables
 
     def get(self, hierarchy: str) -> TableDescriptor:
         """
@@ -381,7 +502,10 @@ class TableStore(BaseTableStore):
             info (`ItemInfo`): An `ItemInfo` instance with basic info on the field.
         """
         field_desctiptor: FieldDescriptor = self._tables[info.hierarchy]._add_field(
-            item=item, info=info, line_no=self._line_counter.line_no
+            item=item,
+            info=info,
+            line_no=self._line_counter.line_no,
+            unwrap_value=self._unwrap_values,
         )
         self.field_descriptor = field_desctiptor
 
@@ -400,7 +524,7 @@ class TableStore(BaseTableStore):
         table_descriptor = TableDescriptor._from_table_item(
             table=table, info=info, line_no=self._line_counter.line_no
         )
-        self._tables.update({hierarchy: table_descriptor})
+        self._tables[hierarchy] = table_descriptor
 
     def get_stylings(self, style_info: ItemInfo) -> StylingDescriptors:
         """
@@ -420,6 +544,49 @@ class TableStore(BaseTableStore):
             styling_positions = self.field_descriptor.stylings
         return styling_positions
 
+    def shift(self, line_offset: int, position_offset: ItemPosition) -> None:
+        """
+        Shifts the line numbers of all tables in the store, and the positions of
+        those in the top-level space of the document, for when the items before
+        them in the document changed.
+
+        Args:
+            line_offset (int): The number of lines to shift each line number by.
+            position_offset (`ItemPosition`): An `ItemPosition` instance, with the
+                number of attributes and items to offset each position by.
+        """
+        for table_descriptor in self._tables.values():
+            table_descriptor._shift_line_numbers(line_offset=line_offset)
+            if table_descriptor.parent_type == "document":
+                table_descriptor._offset_position(offset=position_offset)
+
+    def merge(self, store: TableStore) -> None:
+        """
+        Adds all tables from another `TableStore` instance, built from items that
+        follow those already processed.
+
+        Args:
+            store (`TableStore`): A `TableStore` instance.
+        """
+        for hierarchy, table_descriptor in store._tables.items():
+            self._tables[hierarchy] = table_descriptor
+
+    def replace_level(self, level: str, stores: List[TableStore]) -> None:
+        """
+        Replaces all tables whose hierarchy starts with `level` with those of
+        other `TableStore` instances, in the order the stores are given.
+
+        Args:
+            level (str): The first level of the hierarchies to replace.
+            stores (List[`TableStore`]): A list of `TableStore` instances.
+        """
+        tables: HierarchyTrie[TableDescriptor] = HierarchyTrie()
+        for store in stores:
+            for hierarchy, table_descriptor in store._tables.items():
+                tables[hierarchy] = table_descriptor
+
+        self._tables.replace_level(level=level, trie=tables)
+
 
 class DescriptorStore:
     """
@@ -435,17 +602,23 @@ class DescriptorStore:
             appearing within the TOML file.
     """
 
-    def __init__(self, line_counter: LineCounter) -> None:
+    def __init__(self, line_counter: LineCounter, unwrap_values: bool) -> None:
         self._line_counter = line_counter
 
         # Object for storing any attributes occurring in top-level space
-        self.document = DocumentStore(line_counter=self._line_counter)
+        self.document = DocumentStore(
+            line_counter=self._line_counter, unwrap_values=unwrap_values
+        )
 
         # Object for storing any array of tables objects
-        self.array_of_tables = ArrayOfTablesStore(line_counter=self._line_counter)
+        self.array_of_tables = ArrayOfTablesStore(
+            line_counter=self._line_counter, unwrap_values=unwrap_values
+        )
 
         # Object for storing any attributes occurring within at least one table
-        self.tables = TableStore(line_counter=self._line_counter)
+        self.tables = TableStore(
+            line_counter=self._line_counter, unwrap_values=unwrap_values
+        )
 
     def _store_choice(self, info: ItemInfo) -> BaseStore:
         """
@@ -453,8 +626,18 @@ class DescriptorStore:
         """
         descriptor_store: BaseStore
         item_type: Item = info.item_type
+
+        # A styling within an array has the hierarchy of the array, so one within
+        # an array in the top-level space belongs to the field of the document
+        is_document_array_styling = (
+            item_type in {"comment", "whitespace"}
+            and info.parent_type == "array"
+            and not info.from_aot
+            and "." not in info.hierarchy
+        )
         if (
             item_type == "document"
+            or is_document_array_styling
             or not info.hierarchy
             and item_type in {"array", "field", "comment", "whitespace"}
         ):
@@ -509,3 +692,63 @@ class DescriptorStore:
             descriptor_store = self.tables
 
         descriptor_store.add_table(hierarchy=hierarchy, table=table, info=table_info)
+
+    def shift(self, line_offset: int, position_offset: ItemPosition) -> None:
+        """
+        Shifts the line numbers of everything in each of the three stores, and
+        the positions of everything in the top-level space of the document.
+
+        Args:
+            line_offset (int): The number of lines to shift each line number by.
+            position_offset (`ItemPosition`): An `ItemPosition` instance, with the
+                number of attributes and items to offset each position by.
+        """
+        self.document.shift(line_offset=line_offset, position_offset=position_offset)
+        self.array_of_tables.shift(
+            line_offset=line_offset, position_offset=position_offset
+        )
+        self.tables.shift(line_offset=line_offset, position_offset=position_offset)
+
+    def merge(self, store: DescriptorStore) -> None:
+        """
+        Adds everything from another `DescriptorStore` instance, built from a
+        part of a document that follows the parts already processed, to each of
+        the three stores.
+
+        Args:
+            store (`DescriptorStore`): A `DescriptorStore` instance.
+        """
+        self.document.merge(store=store.document)
+        self.array_of_tables.merge(store=store.array_of_tables)
+        self.tables.merge(store=store.tables)
+
+    def replace_level(self, level: str, stores: List[DescriptorStore]) -> None:
+        """
+        Replaces all tables and array of tables whose hierarchy starts with
+        `level` with those of other `DescriptorStore` instances, in the order the
+        stores are given.
+
+        Args:
+            level (str): The first level of the hierarchies to replace.
+            stores (List[`DescriptorStore`]): A list of `DescriptorStore`
+                instances.
+        """
+        self.array_of_tables.replace_level(
+            level=level, stores=[store.array_of_tables for store in stores]
+        )
+        self.tables.replace_level(
+            level=level, stores=[store.tables for store in stores]
+        )
+
+    def reorder_levels(self, levels: Iterable[str]) -> None:
+        """
+        Reorders the tables and array of tables by the first level of their
+        hierarchies, so that they are iterated through in the order the levels
+        appear in the document.
+
+        Args:
+            levels (Iterable[str]): The first levels in the order they appear.
+        """
+        levels = list(levels)
+        self.array_of_tables.hierarchy_index.reorder_levels(levels=levels)
+        self.tables.hierarchy_index.reorder_levels(levels=levels)
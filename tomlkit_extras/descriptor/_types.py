@@ -11,22 +11,27 @@ from tomlkit_extras._typing import (
     Item,
     ParentItem,
 )
-from tomlkit_extras.descriptor._helpers import get_item_type
+from tomlkit_extras.descriptor._helpers import FrozenSlots, get_item_type
 
 
-@dataclass
-class ItemPosition:
+@dataclass(frozen=True)
+class ItemPosition(FrozenSlots):
     """
-    A class that stores positional information for a specific `tomlkit` object
-    while recursively traversing a TOML structure in the `_generate_descriptor`
-    method of `_TOMLParser`.
+    An immutable record that stores positional information for a specific
+    `tomlkit` object while recursively traversing a TOML structure in the
+    `_generate_descriptor` method of `_TOMLParser`.
 
     The attribute position refers to the position of an item amongst all
     other key value pairs (fields, tables) within the containing object. The
     container position is the position of the item amongst all other types,
     including stylings (whitespace, comments), within the containing object.
+
+    Since it is immutable, the position of the next item is a new instance,
+    and descriptors can hold on to the position of an item without copying it.
     """
 
+    __slots__ = ("attribute", "container")
+
     attribute: int
     container: int
 
@@ -36,54 +41,60 @@ class ItemPosition:
         Class method that generates a default position where the attribute and
         container positions are both one.
         """
-        return ItemPosition(attribute=1, container=1)
+        return cls(attribute=1, container=1)
 
-    def update_position(self) -> None:
-        """Add one to the `attribute` positional property."""
-        self.attribute += 1
+    def next_body_position(self) -> ItemPosition:
+        """
+        Returns the position following an item that is not an attribute, where
+        only the `container` positional property is one more.
+        """
+        return ItemPosition(attribute=self.attribute, container=self.container + 1)
 
-    def update_body_position(self) -> None:
-        """Add one to the `container` positional property."""
-        self.container += 1
+    def next_positions(self) -> ItemPosition:
+        """
+        Returns the position following an attribute, where both the `attribute`
+        and `container` positional properties are one more.
+        """
+        return ItemPosition(attribute=self.attribute + 1, container=self.container + 1)
 
-    def update_positions(self) -> None:
-        """Add one to the `attribute` and `container` positional properties."""
-        self.update_position()
-        self.update_body_position()
+    def offset_by(self, offset: ItemPosition) -> ItemPosition:
+        """
+        Returns the position offset by another position, where both the
+        `attribute` and `container` positional properties of the offset are
+        added. Used for items that follow items which were parsed separately.
+        """
+        return ItemPosition(
+            attribute=self.attribute + offset.attribute,
+            container=self.container + offset.container,
+        )
 
 
-class ItemInfo:
+@dataclass(frozen=True)
+class ItemInfo(FrozenSlots):
     """
-    A class that stores general information for a specific `tomlkit` object
-    while recursively traversing a TOML structure in the `_generate_descriptor`
-    method of `_TOMLParser`.
+    An immutable record that stores general information for a specific
+    `tomlkit` object while recursively traversing a TOML structure in the
+    `_generate_descriptor` method of `_TOMLParser`.
+
+    Since it is immutable, the same instance is shared by the parser and any
+    descriptor created for the item, without copying.
     """
 
-    def __init__(
-        self,
-        item_type: Item,
-        parent_type: Optional[ParentItem],
-        key: str,
-        hierarchy: str,
-        from_aot: bool,
-    ) -> None:
-        self.item_type = item_type
-        self.parent_type = parent_type
-        self.key = key
-        self.hierarchy = hierarchy
-        self.from_aot = from_aot
-
-        self._position: ItemPosition
-
-    @property
-    def position(self) -> ItemPosition:
-        """Returns the `ItemPosition` object associated with item."""
-        return self._position
-
-    @position.setter
-    def position(self, position: ItemPosition) -> None:
-        """Sets the `ItemPosition` object associated with item."""
-        self._position = position
+    __slots__ = (
+        "item_type",
+        "parent_type",
+        "key",
+        "hierarchy",
+        "from_aot",
+        "position",
+    )
+
+    item_type: Item
+    parent_type: Optional[ParentItem]
+    key: str
+    hierarchy: str
+    from_aot: bool
+    position: ItemPosition
 
     @classmethod
     def from_parent_type(
@@ -93,10 +104,12 @@ class ItemInfo:
         toml_item: DescriptorInput,
         parent_type: Optional[ParentItem] = None,
         from_aot: bool = False,
+        position: Optional[ItemPosition] = None,
     ) -> ItemInfo:
         """
         A class method that creates an `ItemInfo` instance from parent
-        information.
+        information. If no position is passed in, then the default position
+        is used.
         """
         item_type = get_item_type(toml_item=toml_item)
         return cls(
@@ -105,6 +118,7 @@ class ItemInfo:
             key=key,
             hierarchy=hierarchy,
             from_aot=from_aot,
+            position=position or ItemPosition.default_position(),
         )
 
     @classmethod
@@ -113,6 +127,7 @@ class ItemInfo:
         hierarchy: str,
         container_info: ItemInfo,
         body_item: BodyContainerItemDecomposed,
+        position: ItemPosition,
     ) -> ItemInfo:
         """
         A class method that creates an `ItemInfo` instance from the body
@@ -128,6 +143,7 @@ class ItemInfo:
             key=key,
             hierarchy=hierarchy,
             from_aot=container_info.from_aot,
+            position=position,
         )
 
 
@@ -205,3 +221,15 @@ class TOMLStatistics:
         """
         self.number_of_fields += 1
         self.add_comment(item=item)
+
+    def merge(self, toml_statistics: TOMLStatistics) -> None:
+        """
+        Given another `TOMLStatistics` instance, will add each of its counts
+        to the counts of this instance.
+        """
+        self.number_of_tables += toml_statistics.number_of_tables
+        self.number_of_inline_tables += toml_statistics.number_of_inline_tables
+        self.number_of_aots += toml_statistics.number_of_aots
+        self.number_of_comments += toml_statistics.number_of_comments
+        self.number_of_fields += toml_statistics.number_of_fields
+        self.number_of_arrays += toml_statistics.number_of_arrays
@@ -12,7 +12,7 @@ from tomlkit_extras._typing import (
 )
 from tomlkit_extras._utils import decompose_body_item, get_container_body
 from tomlkit_extras.descriptor._descriptor import TOMLDocumentDescriptor
-from tomlkit_extras.toml._out_of_order import fix_out_of_order_table
+from tomlkit_extras.toml._out_of_order import OutOfOrderTableView
 from tomlkit_extras.toml._retrieval import get_attribute_from_toml_source
 
 
@@ -50,23 +50,24 @@ def get_comments(
             `ContainerComment` instances.
     """
     if isinstance(toml_source, items.Array) or hierarchy is None:
-        if isinstance(toml_source, OutOfOrderTableProxy):
-            toml_source = fix_out_of_order_table(table=toml_source)
-
-        attributes = [toml_source]
+        attribute: Any = toml_source
     else:
         attribute = get_attribute_from_toml_source(
-            hierarchy=hierarchy, toml_source=toml_source, fix_order=True
+            hierarchy=hierarchy, toml_source=toml_source
         )
-        if not isinstance(attribute, list) or isinstance(attribute, items.AoT):
-            attribute = [attribute]
 
-        if not all(_container_has_comments(attribute=attr) for attr in attribute):
-            raise ValueError("Attribute is not a structure that can contain comments")
+    # The top-level comments of an out-of-order table are those of the component
+    # a fixed table is built from, which is read through a view without copying
+    if isinstance(attribute, OutOfOrderTableProxy):
+        attribute = OutOfOrderTableView.from_proxy(table=attribute).parent
 
-        attributes = cast(
-            List[Union[TOMLDocument, items.Table, items.Array]], attribute
-        )
+    if not isinstance(attribute, list) or isinstance(attribute, items.AoT):
+        attribute = [attribute]
+
+    if not all(_container_has_comments(attribute=attr) for attr in attribute):
+        raise ValueError("Attribute is not a structure that can contain comments")
+
+    attributes = cast(List[Union[TOMLDocument, items.Table, items.Array]], attribute)
 
     comments: List[ContainerComment] = []
     for attr in attributes:
@@ -5,6 +5,7 @@ from tomlkit import TOMLDocument, items
 
 from tomlkit_extras._exceptions import InvalidHierarchyDeletionError
 from tomlkit_extras._hierarchy import Hierarchy, standardize_hierarchy
+from tomlkit_extras._mutations import notify_mutation
 from tomlkit_extras._typing import (
     TOMLDictLike,
     TOMLHierarchy,
@@ -104,3 +105,4 @@ def delete_from_toml_source(hierarchy: TOMLHierarchy, toml_source: TOMLSource) -
 
     hierarchy_queue: PDeque[str] = pdeque(hierarchy_obj.full_hierarchy)
     _recursive_deletion(current_source=toml_source, hierarchy_queue=hierarchy_queue)
+    notify_mutation(toml_source=toml_source, hierarchies=[hierarchy_obj])
@@ -1,22 +1,28 @@
 import copy
 import datetime
+import itertools
 import warnings
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import tomlkit
 from tomlkit import TOMLDocument, items
-from tomlkit.container import OutOfOrderTableProxy
+from tomlkit.container import Container, OutOfOrderTableProxy, ends_with_whitespace
+from tomlkit.exceptions import KeyAlreadyPresent
 
 from tomlkit_extras._constants import DICTIONARY_LIKE_TYPES
 from tomlkit_extras._exceptions import KeyNotProvidedError, TOMLInsertionError
 from tomlkit_extras._hierarchy import Hierarchy, standardize_hierarchy
+from tomlkit_extras._mutations import notify_mutation
 from tomlkit_extras._typing import (
     BodyContainer,
-    BodyContainerInOrder,
+    BodyContainerItem,
     BodyContainerItemDecomposed,
     BodyContainerItems,
+    BulkInsertion,
     ContainerLike,
+    DictLikeContainer,
+    PlannedSplice,
     Stylings,
     TOMLFieldSource,
     TOMLHierarchy,
@@ -44,6 +50,8 @@ _VALID_ARRAY_OR_INLINE_TYPES = (
     items.InlineTable,  # inline_table
 )
 
+_TABLE_HEADER_TYPES = (items.Table, items.AoT)
+
 
 def container_insert(
     toml_source: TOMLFieldSource,
@@ -182,6 +190,91 @@ def general_insert(
     )
 
 
+def bulk_insert(
+    toml_source: TOMLFieldSource, insertions: Iterable[BulkInsertion]
+) -> None:
+    """
+    Inserts many objects that are tomlkit compatible, each based on an
+    attribute or container position, applying all insertions that target
+    the same container in a single pass over its body.
+
+    Each insertion is a tuple of `(hierarchy, key, value, position, by_attribute)`.
+    The `hierarchy`, `key`, and `position` elements have the same meaning
+    as the arguments of `attribute_insert` and `container_insert`, and the
+    `value` element is the object to insert. If `by_attribute` is True,
+    then `position` is an attribute position, otherwise it is a container
+    position.
+
+    Positions are interpreted against the original layout of each container,
+    before any of the insertions are applied. Insertions that share the same
+    position are placed in the order they are given. All insertions are
+    resolved and validated before the `toml_source` is modified, and each
+    `hierarchy` must already exist within the `toml_source`.
+
+    Args:
+        toml_source (`TOMLFieldSource`): A `TOMLFieldSource` instance.
+        insertions (Iterable[`BulkInsertion`]): An iterable of `BulkInsertion`
+            tuples.
+    """
+    parents: Dict[Optional[str], ContainerLike] = {}
+    groups: Dict[int, Tuple[ContainerLike, List[_PositionalInserter]]] = {}
+
+    for hierarchy, key, insertion, position, by_attribute in insertions:
+        inserter = _PositionalInserter(
+            toml_source=toml_source,
+            hierarchy=hierarchy,
+            key=key,
+            insertion=insertion,
+            position=position,
+            by_attribute=by_attribute,
+        )
+
+        # Each distinct hierarchy is only resolved once
+        hierarchy_str: Optional[str] = None
+        if inserter.hierarchy_obj is not None:
+            hierarchy_str = str(inserter.hierarchy_obj)
+
+        if hierarchy_str not in parents:
+            parents[hierarchy_str] = inserter.get_toml_source_insertion_object()
+
+        parent = parents[hierarchy_str]
+        _validate_insertion(inserter=inserter, toml_source=parent)
+        groups.setdefault(id(parent), (parent, []))[1].append(inserter)
+
+    # Resolve where each insertion will be spliced into dict-like types before
+    # any container is modified, so that a duplicate key leaves the source as is
+    merges: List[Tuple[DictLikeContainer, List[PlannedSplice]]] = []
+    others: List[Tuple[ContainerLike, List[_PositionalInserter]]] = []
+    for parent, inserters in groups.values():
+        if isinstance(parent, (TOMLDocument, items.Table, items.InlineTable)):
+            merges.append(
+                (parent, _plan_dict_like_merge(container=parent, inserters=inserters))
+            )
+        else:
+            others.append((parent, inserters))
+
+    for container, planned in merges:
+        _merge_into_dict_like(container=container, planned=planned)
+
+    for parent, inserters in others:
+        if isinstance(parent, items.Array):
+            _merge_into_array(array=parent, inserters=inserters)
+        else:
+            _insert_from_last_position(
+                parent=cast(Union[items.AoT, OutOfOrderTableProxy], parent),
+                inserters=inserters,
+            )
+
+    notify_mutation(
+        toml_source=toml_source,
+        hierarchies=[
+            inserter.hierarchy_obj
+            for _, inserters in groups.values()
+            for inserter in inserters
+        ],
+    )
+
+
 class _BaseItemInserter(ABC):
     """
     A private base abstract class that is an abstract structure which provides
@@ -240,7 +333,7 @@ class _DictLikeItemInserter(_BaseItemInserter):
     def __init__(
         self,
         item_to_insert: Tuple[str, items.Item],
-        container: Union[TOMLDocument, items.Table, items.InlineTable],
+        container: DictLikeContainer,
         by_attribute: bool = True,
     ) -> None:
         super().__init__(item_to_insert=item_to_insert, by_attribute=by_attribute)
@@ -261,31 +354,6 @@ class _DictLikeItemInserter(_BaseItemInserter):
             self.container.add(key, item)
 
 
-class _ListLikeItemInserter(_BaseItemInserter):
-    """
-    A sub-class of `_BaseItemInserter` which provides tools to insert `tomlkit.items.Item`
-    objects at specific positions within `tomlkit` list-like types that support insertion.
-    """
-
-    def __init__(
-        self,
-        item_to_insert: BodyContainerItemDecomposed,
-        container: items.Array,
-        by_attribute: bool = True,
-    ) -> None:
-        super().__init__(item_to_insert=item_to_insert, by_attribute=by_attribute)
-        self.container = container
-
-    def add(self, item: items.Item, _: Optional[str] = None) -> None:
-        """
-        Adds a `tomlkit.items.Item` instance to a list-like `tomlkit` type.
-
-        Args:
-            item (`items.Item`): A `tomlkit.items.Item` instance.
-        """
-        self.container.append(item)
-
-
 class _BaseInserter(ABC):
     """
     A private base abstract class that is an abstract structure which provides
@@ -447,45 +515,544 @@ class _PositionalInserter(_BaseInserter):
         """
         Inserts an `tomlkit.items.Item` within a `tomlkit` type that is not
         a `tomlkit.items.AoT` instance.
+
+        The item is spliced directly into the body of the parent at the index
+        corresponding to the position, leaving all other items untouched.
         """
-        item_to_insert: BodyContainerItemDecomposed = self.body_item
+        if isinstance(parent, OutOfOrderTableProxy):
+            self._rebuild_insert(parent=parent)
+        elif isinstance(parent, items.Array):
+            _splice_into_array(
+                array=parent,
+                item=self.toml_item,
+                position=self.position,
+                by_attribute=self.by_attribute,
+            )
+        else:
+            _splice_into_dict_like(
+                container=parent,
+                key=cast(str, self.key),
+                item=self.toml_item,
+                position=self.position,
+                by_attribute=self.by_attribute,
+            )
+
+    def _rebuild_insert(self, parent: OutOfOrderTableProxy) -> None:
+        """
+        Inserts an `tomlkit.items.Item` within a `tomlkit.container.OutOfOrderTableProxy`
+        instance by clearing and rebuilding the entire body.
+        """
+        item_to_insert = cast(Tuple[str, items.Item], self.body_item)
         toml_body_items = copy.deepcopy(get_container_body(toml_source=parent))
         _refresh_container(initial_container=parent)
 
-        container: BodyContainerInOrder
+        # Since an out-of-order table is not a container itself, create a
+        # temporary new items.Table instance to insert into
+        container: items.Table = tomlkit.table()
+        inserter = _DictLikeItemInserter(
+            item_to_insert=item_to_insert,
+            container=container,
+            by_attribute=self.by_attribute,
+        )
 
-        # If the parent of the insertion point is an out-of-order table,
-        # then overwrite the container variable by creating a temporary
-        # new items.Table instance.
-        if isinstance(parent, OutOfOrderTableProxy):
-            container = tomlkit.table()
-        else:
-            container = parent
+        # Update the original parent container (which has been cleared of its
+        # contents)
+        parent.update(container)
 
-        inserter: _BaseItemInserter
+        _insert_item_at_position_in_container(
+            position=self.position, inserter=inserter, toml_body_items=toml_body_items
+        )
 
-        # Conditional to create insert object for dict-like or list-like tomlkit types
-        if isinstance(container, (TOMLDocument, items.Table, items.InlineTable)):
-            inserter = _DictLikeItemInserter(
-                item_to_insert=cast(Tuple[str, items.Item], item_to_insert),
-                container=container,
-                by_attribute=self.by_attribute,
+
+class _BodyLayout:
+    """
+    A private class which scans the body of a `tomlkit.container.Container`
+    instance, and translates attribute or container positions, indexed at 1,
+    into indices within the body where an item should be spliced.
+
+    Unless the container is an inline table, the resulting index is adjusted
+    so that the item is rendered within the correct section of the TOML file.
+    A key-value pair cannot follow a table header, and a table cannot precede
+    a key-value pair, otherwise each would be parsed as part of another table.
+
+    The body is scanned lazily, only as far as the positions translated so far
+    require, and each item is scanned at most once, so a single field spliced
+    into the middle of a body does not scan the items after it.
+    """
+
+    def __init__(self, body_container: Container, constrained: bool) -> None:
+        self.body_container = body_container
+        self.constrained = constrained
+        self.length = len(body_container.body)
+
+        self.keyed_indices: List[int] = []
+        self.first_header_index: Optional[int] = None
+        self.fields_end = 0
+
+        # The number of items at the start of the body scanned so far
+        self._scanned = 0
+        self._last_index_before_table: Optional[int] = None
+
+    def _scan_to(self, stop: int) -> None:
+        """
+        Private method which scans the body up to, but not including, an index,
+        recording the index of each keyed item, and whether it renders a table
+        header.
+        """
+        body = self.body_container.body
+        keyed_indices = self.keyed_indices
+        for index in range(self._scanned, min(stop, self.length)):
+            item_key, toml_item = body[index]
+            if item_key is None:
+                continue
+
+            keyed_indices.append(index)
+
+            # Same check as _renders_table_header, inlined as this loop is the
+            # main cost of translating a position within a large body
+            if type(toml_item) in _TABLE_HEADER_TYPES and not item_key.is_dotted():
+                if self.first_header_index is None:
+                    self.first_header_index = index
+            else:
+                self.fields_end = index + 1
+
+        self._scanned = max(self._scanned, min(stop, self.length))
+
+    @property
+    def last_index_before_table(self) -> int:
+        """
+        Returns the last index before any table header within the body, which
+        is only computed once.
+        """
+        if self._last_index_before_table is None:
+            self._last_index_before_table = (
+                self.body_container._get_last_index_before_table()
             )
+        return self._last_index_before_table
+
+    def body_index(self, position: int, by_attribute: bool, item: items.Item) -> int:
+        """
+        Translates a position, indexed at 1, into the index within the original
+        body where an item should be spliced. Positions that fall outside of
+        the body map to the end of the body.
+
+        Args:
+            position (int): The position of insertion, indexed at 1.
+            by_attribute (bool): Whether the position is an attribute position,
+                as opposed to a container position.
+            item (`items.Item`): The `tomlkit.items.Item` instance to insert.
+
+        Returns:
+            int: The index within the body where the item should be spliced.
+        """
+        index: int
+
+        if position < 1:
+            index = self.length
+        elif not by_attribute:
+            index = min(position - 1, self.length)
+        elif position == 1:
+            index = 0
         else:
-            inserter = _ListLikeItemInserter(
-                item_to_insert=item_to_insert,
-                container=container,
-                by_attribute=self.by_attribute,
+            # The keyed item at a position is at least as far into the body as
+            # the position, so each scan covers at least the items still needed
+            while (
+                len(self.keyed_indices) < position - 1 and self._scanned < self.length
+            ):
+                self._scan_to(
+                    stop=self._scanned + position - 1 - len(self.keyed_indices)
+                )
+
+            index = (
+                self.keyed_indices[position - 2] + 1
+                if position - 2 < len(self.keyed_indices)
+                else self.length
             )
 
-        # For out-of-order tables, update the original parent container (which
-        # has been cleared of its contents)
-        if isinstance(parent, OutOfOrderTableProxy):
-            parent.update(container)
+        if not self.constrained:
+            return index
+        elif isinstance(item, (items.Table, items.AoT)):
+            # Any field after the index must be found, so the whole body is needed
+            self._scan_to(stop=self.length)
+            return max(index, self.fields_end)
 
-        _insert_item_at_position_in_container(
-            position=self.position, inserter=inserter, toml_body_items=toml_body_items
+        # Only a table header before the index can move a field
+        if self.first_header_index is None:
+            self._scan_to(stop=index)
+
+        if self.first_header_index is not None and self.first_header_index < index:
+            return self.last_index_before_table
+        else:
+            return index
+
+
+def _renders_table_header(body_item: BodyContainerItem) -> bool:
+    """
+    A private function which determines if an item from the body of a
+    `BodyContainer` instance is rendered with a table header.
+    """
+    item_key, toml_item = body_item
+
+    # Compare exact types, as an isinstance check against the abstract tomlkit
+    # types is comparatively slow when scanning through large bodies
+    return (
+        item_key is not None
+        and type(toml_item) in _TABLE_HEADER_TYPES
+        and not item_key.is_dotted()
+    )
+
+
+def _get_body_container(container: DictLikeContainer) -> Container:
+    """
+    A private function which returns the `tomlkit.container.Container` instance
+    holding the body of a dict-like `tomlkit` type.
+    """
+    return container if isinstance(container, TOMLDocument) else container.value
+
+
+def _last_rendered_table(item: Optional[items.Item]) -> Optional[items.Table]:
+    """
+    A private function which returns the table rendered last within a table or
+    array-of-tables, being the table that holds any whitespace trailing the item.
+    Returns None for any other item.
+    """
+    while isinstance(item, (items.Table, items.AoT)):
+        if isinstance(item, items.AoT):
+            if not item.body:
+                return None
+            item = item.body[-1]
+        elif item.value.body and isinstance(
+            item.value.body[-1][1], (items.Table, items.AoT)
+        ):
+            item = item.value.body[-1][1]
+        else:
+            return item
+
+    return None
+
+
+def _prepare_spliced_item(
+    previous_item: Optional[items.Item],
+    next_body_item: Optional[BodyContainerItem],
+    key: str,
+    item: items.Item,
+) -> None:
+    """
+    A private function which prepares an item that is about to be spliced into
+    the body of a dict-like `tomlkit` type, directly after `previous_item` and
+    before `next_body_item`.
+
+    A table or array-of-tables spliced directly before a table header takes
+    over the whitespace trailing the previous table, or a single newline, so
+    that the header stays separated from the item as it was from the previous
+    one.
+    """
+    if isinstance(item, (items.Table, items.AoT)) and item.name is None:
+        item.name = key
+
+    spliced_table = _last_rendered_table(item=item)
+    if (
+        spliced_table is not None
+        and next_body_item is not None
+        and _renders_table_header(body_item=next_body_item)
+        and not ends_with_whitespace(spliced_table)
+    ):
+        previous_table = _last_rendered_table(item=previous_item)
+        if previous_table is not None and ends_with_whitespace(previous_table):
+            _, whitespace = previous_table.value.body.pop()
+        else:
+            whitespace = tomlkit.ws("\n")
+
+        spliced_table.value.append(None, whitespace)
+
+    if (
+        isinstance(item, items.Table)
+        and previous_item is not None
+        and not (
+            item.trivia.indent
+            or isinstance(previous_item, items.Whitespace)
+            or ends_with_whitespace(previous_item)
+        )
+    ):
+        item.trivia.indent = "\n"
+
+
+def _splice_into_dict_like(
+    container: DictLikeContainer,
+    key: str,
+    item: items.Item,
+    position: int,
+    by_attribute: bool,
+) -> None:
+    """
+    A private function which splices a key-value pair directly into the body
+    and key map of a dict-like `tomlkit` type at a specific position.
+    """
+    body_container = _get_body_container(container=container)
+    layout = _BodyLayout(
+        body_container=body_container,
+        constrained=not isinstance(container, items.InlineTable),
+    )
+    index = layout.body_index(position=position, by_attribute=by_attribute, item=item)
+
+    # If the item belongs at the bottom of the body, the standard tomlkit
+    # append will place it there
+    if index >= len(body_container.body):
+        container.add(key, item)
+        return
+
+    if key in body_container:
+        raise KeyAlreadyPresent(key)
+
+    _, previous_item = body_container.body[index - 1] if index else (None, None)
+    _prepare_spliced_item(
+        previous_item=previous_item,
+        next_body_item=body_container.body[index],
+        key=key,
+        item=item,
+    )
+
+    if isinstance(item, items.Table):
+        body_container._table_keys.append(items.SingleKey(key))
+
+    body_container._insert_at(index, key, item)
+
+    # The container of a table is wrapped, so the key must also be reflected
+    # in the dictionary of the table itself
+    if not isinstance(container, TOMLDocument):
+        dict.__setitem__(container, key, body_container[key])
+
+
+def _find_array_value_index(
+    array: items.Array, position: int, by_attribute: bool
+) -> int:
+    """
+    A private function which translates an attribute or container position,
+    indexed at 1, into the index of a value within a `tomlkit.items.Array`
+    instance. Positions that fall outside of the array map to the end.
+    """
+    if by_attribute:
+        return position - 1 if 1 <= position <= len(array) else len(array)
+
+    body = get_container_body(toml_source=array)
+    body_index = len(body) if position < 1 else min(position - 1, len(body))
+    return sum(
+        not isinstance(array_item, (items.Whitespace, items.Comment))
+        for _, array_item in body[:body_index]
+    )
+
+
+def _splice_into_array(
+    array: items.Array, item: items.Item, position: int, by_attribute: bool
+) -> None:
+    """
+    A private function which splices an item directly into a `tomlkit.items.Array`
+    instance at a specific position.
+    """
+    value_index = _find_array_value_index(
+        array=array, position=position, by_attribute=by_attribute
+    )
+    array.insert(value_index, item)
+
+
+def _plan_dict_like_merge(
+    container: DictLikeContainer, inserters: List[_PositionalInserter]
+) -> List[PlannedSplice]:
+    """
+    A private function which resolves the index within the original body of
+    a dict-like `tomlkit` type where each insertion will be spliced, sorted by
+    index while retaining the given order of insertions sharing an index. At
+    a shared index, fields are always placed before tables.
+    """
+    body_container = _get_body_container(container=container)
+    layout = _BodyLayout(
+        body_container=body_container,
+        constrained=not isinstance(container, items.InlineTable),
+    )
+
+    keys_seen = set()
+    planned: List[PlannedSplice] = []
+    for inserter in inserters:
+        key = cast(str, inserter.key)
+        if key in body_container or key in keys_seen:
+            raise KeyAlreadyPresent(key)
+
+        keys_seen.add(key)
+        index = layout.body_index(
+            position=inserter.position,
+            by_attribute=inserter.by_attribute,
+            item=inserter.toml_item,
+        )
+        planned.append((index, key, inserter.toml_item))
+
+    # Tables being inserted must also follow any fields being inserted, so
+    # that none of the new fields are placed under a new table header
+    if layout.constrained:
+        fields_end = max(
+            (
+                index
+                for index, _, item in planned
+                if not isinstance(item, (items.Table, items.AoT))
+            ),
+            default=0,
         )
+        planned = [
+            (
+                (max(index, fields_end), key, item)
+                if isinstance(item, (items.Table, items.AoT))
+                else (index, key, item)
+            )
+            for index, key, item in planned
+        ]
+
+    planned.sort(
+        key=lambda splice: (splice[0], isinstance(splice[2], (items.Table, items.AoT)))
+    )
+    return planned
+
+
+def _merge_into_dict_like(
+    container: DictLikeContainer, planned: List[PlannedSplice]
+) -> None:
+    """
+    A private function which merges all planned insertions into the body of a
+    dict-like `tomlkit` type in a single pass, and then rebuilds its key map.
+    """
+    body_container = _get_body_container(container=container)
+    body = body_container.body
+
+    merged: BodyContainerItems = []
+    planned_index = 0
+    for index, body_item in enumerate(body):
+        while planned_index < len(planned) and planned[planned_index][0] == index:
+            _, key, item = planned[planned_index]
+            previous_item = merged[-1][1] if merged else None
+            _prepare_spliced_item(
+                previous_item=previous_item,
+                next_body_item=body_item,
+                key=key,
+                item=item,
+            )
+
+            # Ensure the previous item ends its line, as tomlkit does when
+            # inserting into the middle of a body
+            if not (
+                previous_item is None
+                or isinstance(previous_item, items.Whitespace)
+                or ends_with_whitespace(previous_item)
+                or isinstance(item, (items.Table, items.AoT))
+                or "\n" in previous_item.trivia.trail
+            ):
+                previous_item.trivia.trail += "\n"
+
+            if isinstance(item, items.Table):
+                body_container._table_keys.append(items.SingleKey(key))
+
+            merged.append((items.SingleKey(key), item))
+            planned_index += 1
+
+        merged.append(body_item)
+
+    body[:] = merged
+    _rebuild_key_map(body_container=body_container)
+
+    for _, key, item in planned[:planned_index]:
+        dict.__setitem__(body_container, key, item.value)
+
+        # The container of a table is wrapped, so the key must also be reflected
+        # in the dictionary of the table itself
+        if not isinstance(container, TOMLDocument):
+            dict.__setitem__(container, key, body_container[key])
+
+    # Any items that belong at the bottom of the body are placed there by the
+    # standard tomlkit append
+    for _, key, item in planned[planned_index:]:
+        container.add(key, item)
+
+
+def _rebuild_key_map(body_container: Container) -> None:
+    """
+    A private function which rebuilds the map from each key to its index, or
+    indices, within the body of a `tomlkit.container.Container` instance.
+    """
+    key_map: Dict[items.Key, Union[int, Tuple[int, ...]]] = {}
+    for index, (item_key, _) in enumerate(body_container.body):
+        if item_key is None:
+            continue
+
+        current_index = key_map.get(item_key)
+        if current_index is None:
+            key_map[item_key] = index
+        elif isinstance(current_index, tuple):
+            key_map[item_key] = (*current_index, index)
+        else:
+            key_map[item_key] = (current_index, index)
+
+    body_container._map = key_map
+
+
+def _merge_into_array(array: items.Array, inserters: List[_PositionalInserter]) -> None:
+    """
+    A private function which inserts many items into a `tomlkit.items.Array`
+    instance, with all positions interpreted against its original layout.
+    """
+    planned = sorted(
+        (
+            (
+                _find_array_value_index(
+                    array=array,
+                    position=inserter.position,
+                    by_attribute=inserter.by_attribute,
+                ),
+                inserter.toml_item,
+            )
+            for inserter in inserters
+        ),
+        key=lambda splice: splice[0],
+    )
+
+    # Inserting from the last index backwards leaves every earlier index intact
+    for value_index, item in reversed(planned):
+        array.insert(value_index, item)
+
+
+def _insert_from_last_position(
+    parent: Union[items.AoT, OutOfOrderTableProxy],
+    inserters: List[_PositionalInserter],
+) -> None:
+    """
+    A private function which inserts many items into a `tomlkit.items.AoT`
+    or `tomlkit.container.OutOfOrderTableProxy` instance one at a time. By
+    inserting from the last position backwards, every earlier position still
+    refers to the original layout.
+    """
+    if isinstance(parent, items.AoT):
+        attributes = containers = len(parent)
+    else:
+        body = get_container_body(toml_source=parent)
+        attributes = sum(item_key is not None for item_key, _ in body)
+        containers = len(body)
+
+    in_range: List[_PositionalInserter] = []
+    out_of_range: List[_PositionalInserter] = []
+    for inserter in inserters:
+        last_position = attributes if inserter.by_attribute else containers
+        if 1 <= inserter.position <= last_position:
+            in_range.append(inserter)
+        else:
+            out_of_range.append(inserter)
+
+    in_range.sort(key=lambda inserter: inserter.position)
+
+    # Insertions that fall outside of the original layout are placed at the
+    # bottom, in the order given
+    for inserter in itertools.chain(reversed(in_range), out_of_range):
+        if isinstance(parent, items.AoT):
+            inserter.array_of_tables_insert(
+                array_of_tables=parent, table=cast(items.Table, inserter.toml_item)
+            )
+        else:
+            inserter.insert(parent=parent)
 
 
 def _insert_item_at_position_in_container(
@@ -530,13 +1097,11 @@ def _refresh_container(initial_container: BodyContainer) -> None:
         raise TypeError("Type is not a valid container-like structure")
 
 
-def _insert_into_toml_source(inserter: _BaseInserter) -> None:
+def _validate_insertion(inserter: _BaseInserter, toml_source: ContainerLike) -> None:
     """
-    A private function which serves as the basis for all three insertion
-    operations, `general_insert`, `attribute_insert`, and `container_insert`.
+    A private function which validates that the item of an inserter can be
+    inserted into the `tomlkit` type retrieved as the point of insertion.
     """
-    toml_source = inserter.get_toml_source_insertion_object()
-
     # For insertion into an array-of-tables, the item to be inserted must
     # only be an tomlkit.items.Table object
     if isinstance(toml_source, items.AoT):
@@ -568,10 +1133,6 @@ def _insert_into_toml_source(inserter: _BaseInserter) -> None:
         if inserter.key != name and name is not None:
             inserter.key = name
 
-        inserter.array_of_tables_insert(
-            array_of_tables=toml_source, table=inserter.toml_item
-        )
-
     # Otherwise the insertion is occuring into a dictionary-like object,
     # where the item to be inserted can be of any type, unless the source
     # is an inline table or array. If the source is an inline table, then
@@ -601,4 +1162,22 @@ def _insert_into_toml_source(inserter: _BaseInserter) -> None:
                 "`key` is required for dictionary-like tomlkit types"
             )
 
+
+def _insert_into_toml_source(inserter: _BaseInserter) -> None:
+    """
+    A private function which serves as the basis for all three insertion
+    operations, `general_insert`, `attribute_insert`, and `container_insert`.
+    """
+    toml_source = inserter.get_toml_source_insertion_object()
+    _validate_insertion(inserter=inserter, toml_source=toml_source)
+
+    if isinstance(toml_source, items.AoT):
+        inserter.array_of_tables_insert(
+            array_of_tables=toml_source, table=cast(items.Table, inserter.toml_item)
+        )
+    else:
         inserter.insert(parent=toml_source)
+
+    notify_mutation(
+        toml_source=inserter.toml_source, hierarchies=[inserter.hierarchy_obj]
+    )
@@ -1,10 +1,148 @@
+from __future__ import annotations
+
 import copy
-from typing import Any, Iterator, List, Optional, cast
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, cast
 
 from tomlkit import TOMLDocument, items
 from tomlkit.container import OutOfOrderTableProxy
 
-from tomlkit_extras._typing import TOMLSource
+from tomlkit_extras._typing import BodyContainerItems, TOMLSource
+
+
+class OutOfOrderTableView(Mapping[str, Any]):
+    """
+    A read-only view of an out-of-order table, merging the component tables
+    of a `tomlkit.container.OutOfOrderTableProxy` instance without copying or
+    modifying them.
+
+    The keys of the component that `fix_out_of_order_table` builds the fixed
+    table from come first, followed by any new keys from the other components,
+    in the order they appear in the document. When a key maps to tables in
+    several components, its value is itself a view of those tables. Otherwise,
+    the `tomlkit` item of the component is returned as is.
+
+    Args:
+        tables (Iterable[`tomlkit.items.Table`]): The component tables, in the
+            order they appear in the document.
+    """
+
+    def __init__(self, tables: Iterable[items.Table]) -> None:
+        self._tables: Tuple[items.Table, ...] = tuple(tables)
+        if not self._tables:
+            raise ValueError("An out-of-order table must have at least one component")
+
+        parent = _find_parent_table(tables=self._tables)
+        self._ordered_tables: Tuple[items.Table, ...] = (parent,) + tuple(
+            table for table in self._tables if table is not parent
+        )
+
+    @classmethod
+    def from_proxy(cls, table: OutOfOrderTableProxy) -> OutOfOrderTableView:
+        """
+        A class method which returns an `OutOfOrderTableView` instance of a
+        `tomlkit.container.OutOfOrderTableProxy` instance.
+
+        Args:
+            table (`tomlkit.container.OutOfOrderTableProxy`): A
+                `tomlkit.container.OutOfOrderTableProxy` instance.
+
+        Returns:
+            `OutOfOrderTableView`: An `OutOfOrderTableView` instance.
+        """
+        return cls(tables=table._tables)
+
+    def __getitem__(self, key: str) -> Any:
+        values: List[Any] = []
+        for table in self._tables:
+            if key in table:
+                value = table.value.item(key)
+                if isinstance(value, OutOfOrderTableProxy):
+                    values.extend(value._tables)
+                else:
+                    values.append(value)
+
+        if not values:
+            raise KeyError(key)
+        elif len(values) > 1 and all(
+            isinstance(value, items.Table) for value in values
+        ):
+            return OutOfOrderTableView(tables=values)
+        else:
+            return values[0]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(
+            dict.fromkeys(key for table in self._ordered_tables for key in table)
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in table for table in self._tables)
+
+    def __repr__(self) -> str:
+        return f"<OutOfOrderTableView {list(self)}>"
+
+    @property
+    def components(self) -> Tuple[items.Table, ...]:
+        """
+        Returns a tuple of the component tables, in the order they appear in
+        the document.
+        """
+        return self._tables
+
+    @property
+    def parent(self) -> items.Table:
+        """
+        Returns the component table that `fix_out_of_order_table` builds the
+        fixed table from, being the first component that is not a super table,
+        or otherwise the super table with the shortest name.
+        """
+        return self._ordered_tables[0]
+
+    @property
+    def body(self) -> BodyContainerItems:
+        """
+        Returns the body items of all component tables in the order of the
+        view, being the body of the parent component followed by those of all
+        other components.
+        """
+        return [
+            body_item
+            for table in self._ordered_tables
+            for body_item in table.value.body
+        ]
+
+    def is_super_table(self) -> bool:
+        """Returns True if all component tables are super tables."""
+        return all(table.is_super_table() for table in self._tables)
+
+    def unwrap(self) -> Dict[str, Any]:
+        """Returns the merged table as a dictionary of unwrapped values."""
+        return {key: self[key].unwrap() for key in self}
+
+
+def _find_parent_table(tables: Iterable[items.Table]) -> items.Table:
+    """
+    A private function which returns the component table of an out-of-order
+    table that the fixed table is built from, being the first component that
+    is not a super table, or otherwise the super table with the shortest name.
+    """
+    table_w_shortest_name: Optional[items.Table] = None
+
+    for table in tables:
+        if not table.is_super_table():
+            return table
+        elif table.name is not None:
+            if table_w_shortest_name is None:
+                table_w_shortest_name = table
+            elif table_w_shortest_name.name is not None and len(table.name) < len(
+                table_w_shortest_name.name
+            ):
+                table_w_shortest_name = table
+
+    return cast(items.Table, table_w_shortest_name)
 
 
 def _fix_of_out_of_order_table_chain(
@@ -79,29 +217,7 @@ def fix_out_of_order_table(table: OutOfOrderTableProxy) -> items.Table:
         `tomlkit.items.Table`: A `tomlkit.items.Table` instance.
     """
     component_tables = cast(List[items.Table], copy.deepcopy(table._tables))
-
-    table_w_shortest_name: Optional[items.Table] = None
-    parent_table: Optional[items.Table] = None
-
-    component_tables_iter: Iterator[items.Table] = iter(component_tables)
-
-    try:
-        while parent_table is None:
-            co_table: items.Table = next(component_tables_iter)
-
-            if not co_table.is_super_table():
-                parent_table = co_table
-            elif co_table.name is not None:
-                if table_w_shortest_name is None:
-                    table_w_shortest_name = co_table
-                elif table_w_shortest_name.name is not None and len(
-                    co_table.name
-                ) < len(table_w_shortest_name.name):
-                    table_w_shortest_name = co_table
-    except StopIteration:
-        parent_table = table_w_shortest_name
-
-    parent_table = cast(items.Table, parent_table)
+    parent_table = _find_parent_table(tables=component_tables)
     component_tables.remove(parent_table)
 
     for component_table in component_tables:
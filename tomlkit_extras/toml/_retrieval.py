@@ -29,7 +29,10 @@ from tomlkit_extras._typing import (
     TOMLSource,
 )
 from tomlkit_extras._utils import decompose_body_item, get_container_body
-from tomlkit_extras.toml._out_of_order import fix_out_of_order_table
+from tomlkit_extras.toml._out_of_order import (
+    OutOfOrderTableView,
+    fix_out_of_order_table,
+)
 
 
 def _get_table_from_aot(
@@ -95,9 +98,15 @@ def get_positions(hierarchy: TOMLHierarchy, toml_source: TOMLSource) -> Tuple[in
     ):
         raise NotContainerLikeError("Hierarchy maps to a non-container-like object")
 
-    table_body_items: Iterator[BodyContainerItem] = iter(
-        get_container_body(toml_source=parent_source)
-    )
+    # The body of an out-of-order table is walked through a view of its
+    # components, in the same order as a fixed table
+    table_body_items: Iterator[BodyContainerItem]
+    if isinstance(parent_source, OutOfOrderTableProxy):
+        table_body_items = iter(
+            OutOfOrderTableView.from_proxy(table=parent_source).body
+        )
+    else:
+        table_body_items = iter(get_container_body(toml_source=parent_source))
 
     container_position = attribute_position = 0
     finding_positions = True
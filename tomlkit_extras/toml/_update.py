@@ -8,6 +8,7 @@ from tomlkit_extras._exceptions import (
     NotContainerLikeError,
 )
 from tomlkit_extras._hierarchy import Hierarchy, standardize_hierarchy
+from tomlkit_extras._mutations import notify_mutation
 from tomlkit_extras._typing import TOMLHierarchy, TOMLSource
 from tomlkit_extras.toml._retrieval import find_parent_toml_source
 
@@ -79,3 +80,5 @@ def update_toml_source(
             attribute_toml.append(update)
         else:
             retrieved_from_toml[hierarchy_field] = update
+
+    notify_mutation(toml_source=toml_source, hierarchies=[hierarchy_obj])